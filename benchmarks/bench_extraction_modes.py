@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark pypdf's plain and layout extraction modes.
+
+Extracts every PDF in the corpus (data/documents by default) with each mode,
+then runs the usual sentence splitting and obligation detection, and reports
+extraction time and obligation counts per document with the layout-minus-plain
+deltas. Layout mode keeps columns and indentation, which can change where
+sentences break and therefore which obligations are found.
+
+Usage:
+    python benchmarks/bench_extraction_modes.py --repeats 5
+    python benchmarks/bench_extraction_modes.py --pdf a.pdf b.pdf
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+from typing import Dict, List
+
+# Add the src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from compliance_assistant.logging_config import setup_logging
+from compliance_assistant.obligation_finder import ObligationFinder
+from compliance_assistant.pdf_reader import EXTRACTION_MODES, PDFReader
+
+CORPUS_DIR = os.path.join(os.path.dirname(__file__), '..', 'data', 'documents')
+
+
+def run_mode(pdf_path: str, extraction_mode: str, repeats: int) -> Dict[str, float]:
+    """Extract a PDF in one mode and count the obligations found in its text."""
+    reader = PDFReader(extraction_mode=extraction_mode, strip_headers=False, skip_listings=False)
+    best = float('inf')
+    for _ in range(repeats):
+        started = time.perf_counter()
+        text = reader.extract_text_from_pdf(pdf_path)
+        best = min(best, time.perf_counter() - started)
+
+    sentences = reader.split_into_sentences(text)
+    obligations = ObligationFinder().process_sentences(sentences)
+    return {'seconds': best, 'characters': len(text), 'sentences': len(sentences),
+            'obligations': len(obligations)}
+
+
+def main() -> None:
+    """Run the benchmark and print a per-document comparison."""
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pdf', nargs='+', default=None,
+                        help='PDFs to benchmark (default: every PDF in data/documents)')
+    parser.add_argument('--repeats', type=int, default=3,
+                        help='Extractions per mode, best time is reported (default: 3)')
+    args = parser.parse_args()
+
+    # Keep library logging out of the benchmark output
+    setup_logging(log_level="WARNING", console_output=False)
+
+    pdf_paths: List[str] = args.pdf or sorted(glob.glob(os.path.join(CORPUS_DIR, '*.pdf')))
+    if not pdf_paths:
+        print("No PDFs found")
+        sys.exit(1)
+
+    print(f"{'document':<40} {'mode':<7} {'seconds':>9} {'chars':>8} {'sentences':>10} "
+          f"{'obligations':>12}")
+    totals = {mode: {'seconds': 0.0, 'obligations': 0} for mode in EXTRACTION_MODES}
+    for pdf_path in pdf_paths:
+        name = os.path.basename(pdf_path)[:40]
+        results = {mode: run_mode(pdf_path, mode, args.repeats) for mode in EXTRACTION_MODES}
+        for mode, result in results.items():
+            totals[mode]['seconds'] += result['seconds']
+            totals[mode]['obligations'] += result['obligations']
+            print(f"{name:<40} {mode:<7} {result['seconds']:>9.4f} {result['characters']:>8,} "
+                  f"{result['sentences']:>10,} {result['obligations']:>12,}")
+
+        time_delta = results['layout']['seconds'] - results['plain']['seconds']
+        obligation_delta = results['layout']['obligations'] - results['plain']['obligations']
+        print(f"{'':<40} {'delta':<7} {time_delta:>+9.4f} {'':>8} {'':>10} {obligation_delta:>+12,}")
+
+    print()
+    plain, layout = totals['plain'], totals['layout']
+    ratio = layout['seconds'] / plain['seconds'] if plain['seconds'] > 0 else float('nan')
+    print(f"Corpus of {len(pdf_paths)} PDFs: layout takes {ratio:.2f}x the plain extraction time "
+          f"and finds {layout['obligations'] - plain['obligations']:+,} obligations")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark package import time against a startup budget.
+
+Each import runs in a fresh interpreter, and the time of an empty interpreter
+is subtracted so only the cost of the import itself is reported. A warm-up
+launch writes bytecode caches first, as an installed package would have.
+The package and CLI must stay under the budget; the heavy dependencies they
+defer are shown for comparison. Exits with status 1 when the budget is exceeded, so it
+can guard startup time in CI.
+
+Usage:
+    python benchmarks/bench_import_time.py --runs 10 --budget-ms 100
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict
+
+SRC_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+
+# Imports that must stay under the budget
+BUDGETED_IMPORTS = {
+    'package': 'import compliance_assistant',
+    'cli': 'import compliance_assistant.cli',
+    'obligation finder': 'from compliance_assistant import ObligationFinder',
+}
+
+# Dependencies loaded only once a PDF is read or Excel is written
+DEFERRED_IMPORTS = {
+    'pypdf': 'import pypdf',
+    'pandas + openpyxl': 'import pandas, openpyxl',
+}
+
+
+def time_import(statement: str, runs: int) -> float:
+    """Return the median wall time (seconds) of running statement in a new interpreter."""
+    env = {**os.environ, 'PYTHONPATH': SRC_PATH}
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    subprocess.run([sys.executable, '-c', statement], env=env, check=True)
+
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, '-c', statement], env=env, check=True)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    """Run the benchmark, print a table and enforce the budget."""
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=10,
+                        help='Interpreter launches per import, median is reported (default: 10)')
+    parser.add_argument('--budget-ms', type=float, default=100.0,
+                        help='Allowed import time for the package and CLI (default: 100)')
+    args = parser.parse_args()
+
+    baseline = time_import('pass', args.runs)
+    print(f"Interpreter startup: {baseline * 1000:.1f} ms (subtracted below)")
+    print()
+    print(f"{'import':<20} {'ms':>8} {'budget':>8}")
+
+    over_budget: Dict[str, float] = {}
+    for name, statement in BUDGETED_IMPORTS.items():
+        elapsed_ms = (time_import(statement, args.runs) - baseline) * 1000
+        status = 'ok' if elapsed_ms <= args.budget_ms else 'OVER'
+        if status == 'OVER':
+            over_budget[name] = elapsed_ms
+        print(f"{name:<20} {elapsed_ms:>8.1f} {status:>8}")
+
+    for name, statement in DEFERRED_IMPORTS.items():
+        elapsed_ms = (time_import(statement, args.runs) - baseline) * 1000
+        print(f"{name:<20} {elapsed_ms:>8.1f} {'deferred':>8}")
+
+    print()
+    if over_budget:
+        print(f"❌ Over the {args.budget_ms:.0f} ms budget: {', '.join(over_budget)}")
+        sys.exit(1)
+    print(f"✅ All imports within the {args.budget_ms:.0f} ms budget")
+
+
+if __name__ == "__main__":
+    main()
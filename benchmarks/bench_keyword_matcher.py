@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Benchmark obligation keyword matching on a synthetic sentence corpus.
+
+Compares the original approach (one regex built and searched per keyword,
+first to detect an obligation and again to collect its keywords) with the
+compiled alternation and word-level trie matchers, reporting sentences per
+second. --lexicon-size pads ObligationFinder's keywords with synthetic
+multi-word phrases to show where the trie overtakes the alternation.
+
+Usage:
+    python benchmarks/bench_keyword_matcher.py --sentences 1000000
+    python benchmarks/bench_keyword_matcher.py --sentences 100000 --lexicon-size 500 --skip-legacy
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+from typing import Callable, List, Sequence
+
+# Add the src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from compliance_assistant.keyword_matcher import KeywordMatcher, TrieKeywordMatcher
+from compliance_assistant.logging_config import setup_logging
+from compliance_assistant.obligation_finder import ObligationFinder
+
+KEYWORDS = ObligationFinder.OBLIGATION_KEYWORDS
+
+OBLIGATION_TEMPLATES = [
+    "All {asset} must be reviewed by the {team} team every quarter.",
+    "The {team} team shall encrypt {asset} at rest and in transit.",
+    "Multi-factor authentication is required for access to {asset}.",
+    "Security awareness training is mandatory and staff must complete it annually.",
+]
+OTHER_TEMPLATES = [
+    "The {team} team maintains an inventory of {asset}.",
+    "Backups of {asset} are stored in a separate region.",
+    "This section describes how {asset} are classified.",
+    "Mustard-coloured labels mark {asset} owned by the {team} team.",
+]
+ASSETS = ["customer records", "payment systems", "laptops", "source code", "audit logs"]
+TEAMS = ["security", "compliance", "infrastructure", "privacy"]
+
+
+def legacy_find_keywords(sentence: str, keywords: Sequence[str] = KEYWORDS) -> List[str]:
+    """The original per-keyword matching: detect first, then collect keywords."""
+    sentence_lower = sentence.lower()
+    for keyword in keywords:
+        if re.search(r'\b' + re.escape(keyword) + r'\b', sentence_lower):
+            break
+    else:
+        return []
+
+    found_keywords = []
+    for keyword in keywords:
+        if re.search(r'\b' + re.escape(keyword) + r'\b', sentence_lower):
+            found_keywords.append(keyword)
+    return found_keywords
+
+
+def build_lexicon(size: int, seed: int = 11) -> List[str]:
+    """Pad the obligation keywords with synthetic two- to four-word phrases."""
+    rng = random.Random(seed)
+    lexicon = list(KEYWORDS)
+    while len(lexicon) < size:
+        words = [''.join(rng.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(rng.randint(4, 9)))
+                 for _ in range(rng.randint(2, 4))]
+        lexicon.append(' '.join(words))
+    return lexicon
+
+
+def build_corpus(sentence_count: int, obligation_share: float = 0.3, seed: int = 7) -> List[str]:
+    """Build synthetic sentences, obligation_share of which contain keywords."""
+    rng = random.Random(seed)
+    sentences = []
+    for _ in range(sentence_count):
+        templates = OBLIGATION_TEMPLATES if rng.random() < obligation_share else OTHER_TEMPLATES
+        sentences.append(rng.choice(templates).format(asset=rng.choice(ASSETS),
+                                                      team=rng.choice(TEAMS)))
+    return sentences
+
+
+def time_matcher(find_keywords: Callable[[str], List[str]], sentences: List[str]) -> float:
+    """Return the seconds taken to match every sentence."""
+    started = time.perf_counter()
+    for sentence in sentences:
+        find_keywords(sentence)
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    """Run the benchmark and print throughput before and after."""
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sentences', type=int, default=1_000_000,
+                        help='Sentences in the synthetic corpus (default: 1000000)')
+    parser.add_argument('--lexicon-size', type=int, default=len(KEYWORDS),
+                        help=f'Keywords and phrases to match (default: {len(KEYWORDS)})')
+    parser.add_argument('--skip-legacy', action='store_true',
+                        help='Skip the per-keyword baseline, which is slow for large lexicons')
+    args = parser.parse_args()
+
+    # Keep library logging out of the benchmark output
+    setup_logging(log_level="WARNING", console_output=False)
+
+    sentences = build_corpus(args.sentences)
+    lexicon = build_lexicon(args.lexicon_size)
+    matchers = {'compiled alternation': KeywordMatcher(lexicon).find_keywords,
+                'word trie': TrieKeywordMatcher(lexicon).find_keywords}
+    if not args.skip_legacy:
+        matchers = {'per-keyword regex': lambda sentence: legacy_find_keywords(sentence, lexicon),
+                    **matchers}
+
+    # Every matcher must report the same keywords for the comparison to be fair
+    for sentence in sentences[:1000]:
+        found = {name: find_keywords(sentence) for name, find_keywords in matchers.items()}
+        if len({tuple(keywords) for keywords in found.values()}) > 1:
+            print(f"Matchers disagree on: {sentence}")
+            sys.exit(1)
+
+    print(f"Corpus: {len(sentences):,} sentences, lexicon: {len(lexicon):,} entries")
+    print()
+    print(f"{'matcher':<22} {'seconds':>9} {'sentences/s':>13}")
+    results = {}
+    for name, find_keywords in matchers.items():
+        results[name] = time_matcher(find_keywords, sentences)
+        print(f"{name:<22} {results[name]:>9.2f} {len(sentences) / results[name]:>13,.0f}")
+
+    print()
+    baseline = 'per-keyword regex' if 'per-keyword regex' in results else 'compiled alternation'
+    for name in results:
+        if name != baseline:
+            print(f"{name} speed-up over {baseline}: {results[baseline] / results[name]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
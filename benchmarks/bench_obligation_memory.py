@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Benchmark the memory held by obligations as dictionaries and as records.
+
+Finds obligations in a synthetic batch of page-aware sentences twice: with
+the original code, which built a dictionary per obligation, and with
+ObligationFinder, which builds slotted Obligation records. Reports the
+memory each result list keeps alive (traced with tracemalloc) and the peak
+while the Excel DataFrame is built from it, row dictionary by row dictionary
+as the exporter used to, or column by column as it does now.
+
+Usage:
+    python benchmarks/bench_obligation_memory.py --documents 100 --sentences-per-document 5000
+"""
+
+import argparse
+import os
+import random
+import sys
+
+import pandas as pd
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+# Add the src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from compliance_assistant.excel_exporter import ExcelExporter
+from compliance_assistant.logging_config import setup_logging
+from compliance_assistant.obligation_finder import ObligationFinder
+from compliance_assistant.page_index import Sentence
+
+TEMPLATES = [
+    "All {asset} must be reviewed by the {team} team every quarter.",
+    "The {team} team shall encrypt {asset} at rest and in transit as required.",
+    "Backups of {asset} are stored in a separate region.",
+    "Multi-factor authentication is mandatory for access to {asset}.",
+]
+ASSETS = ["customer records", "payment systems", "laptops", "source code", "audit logs"]
+TEAMS = ["security", "compliance", "infrastructure", "privacy"]
+
+
+def build_sentences(sentence_count: int, seed: int = 7) -> List[Sentence]:
+    """Build page-aware sentences as PDFReader would return them."""
+    rng = random.Random(seed)
+    sentences = []
+    offset = 0
+    for index in range(sentence_count):
+        text = rng.choice(TEMPLATES).format(asset=rng.choice(ASSETS), team=rng.choice(TEAMS))
+        sentences.append(Sentence(text, index // 40 + 1, offset, offset + len(text)))
+        offset += len(text) + 1
+    return sentences
+
+
+def legacy_process_sentences(finder: ObligationFinder,
+                             sentences: List[Sentence]) -> List[Dict[str, Any]]:
+    """The original extraction: one dictionary per obligation, then filtering."""
+    obligations = []
+    for sentence_index, sentence in enumerate(sentences):
+        found_keywords = finder.matcher.find_keywords(sentence)
+        if found_keywords:
+            obligation = {
+                'text': sentence.strip(),
+                'keywords': ', '.join(found_keywords),
+                'sentence_index': sentence_index
+            }
+            if sentence.page is not None:
+                obligation['page'] = sentence.page
+                obligation['span'] = sentence.span
+            obligations.append(obligation)
+    return finder.filter_obligations(obligations)
+
+
+def legacy_create_dataframe(obligations: List[Dict[str, Any]], source_document: str) -> pd.DataFrame:
+    """The original exporter: one row dictionary per obligation."""
+    data = []
+    for i, obligation in enumerate(obligations, 1):
+        data.append({
+            'ID': f'OBL-{i:03d}',
+            'Obligation Text': obligation['text'],
+            'Source Document': source_document,
+            'Page': obligation.get('page', ''),
+            'Keywords': obligation.get('keywords', ''),
+            'Owner': 'Not Started',
+            'Next Due Date': 'Not Started',
+            'Status': 'Not Started'
+        })
+    return pd.DataFrame(data)
+
+
+def traced(build: Callable[[], Any]) -> Tuple[Any, int, int]:
+    """Run build under tracemalloc, returning its result, retained and peak bytes."""
+    tracemalloc.start()
+    try:
+        result = build()
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, retained, peak
+
+
+def main() -> None:
+    """Run the benchmark and print memory per representation."""
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--documents', type=int, default=100,
+                        help='Documents in the batch (default: 100)')
+    parser.add_argument('--sentences-per-document', type=int, default=5000,
+                        help='Sentences per document (default: 5000)')
+    args = parser.parse_args()
+
+    # Keep library logging out of the benchmark output
+    setup_logging(log_level="WARNING", console_output=False)
+
+    finder = ObligationFinder()
+    exporter = ExcelExporter()
+    documents = [build_sentences(args.sentences_per_document, seed=document)
+                 for document in range(args.documents)]
+
+    print(f"Batch: {args.documents} documents x {args.sentences_per_document:,} sentences")
+    print()
+    print(f"{'representation':<16} {'obligations':>12} {'retained MB':>12} {'bytes each':>11} "
+          f"{'DataFrame peak MB':>18}")
+    retained_by_name = {}
+    for name, process, create_dataframe in (
+            ('dictionaries', lambda sentences: legacy_process_sentences(finder, sentences),
+             legacy_create_dataframe),
+            ('records', finder.process_sentences, exporter.create_obligation_dataframe)):
+        batch, retained, _ = traced(lambda: [process(sentences) for sentences in documents])
+        count = sum(len(obligations) for obligations in batch)
+        _, _, frame_peak = traced(lambda: create_dataframe(batch[0], 'doc.pdf'))
+        retained_by_name[name] = retained
+        print(f"{name:<16} {count:>12,} {retained / 1e6:>12.1f} {retained / count:>11.0f} "
+              f"{frame_peak / 1e6:>18.2f}")
+        del batch
+
+    print()
+    print(f"Records keep {retained_by_name['records'] / retained_by_name['dictionaries']:.0%} "
+          f"of the memory of dictionaries")
+
+
+if __name__ == "__main__":
+    main()
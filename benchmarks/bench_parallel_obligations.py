@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Benchmark chunked multiprocess obligation extraction.
+
+Runs ObligationFinder.process_sentences serially and with each requested
+worker count on a synthetic corpus, checks every run returns the same
+obligations in the same order, and reports throughput along with the chunk
+sizes the auto-tuning settled on.
+
+Usage:
+    python benchmarks/bench_parallel_obligations.py --sentences 2000000 --workers 2 4 8
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from typing import List
+
+# Add the src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from compliance_assistant.logging_config import setup_logging
+from compliance_assistant.obligation_finder import ObligationFinder
+
+TEMPLATES = [
+    "All {asset} must be reviewed by the {team} team every quarter.",
+    "The {team} team shall encrypt {asset} at rest and in transit.",
+    "Backups of {asset} are stored in a separate region.",
+    "This section describes how {asset} are classified.",
+    "The {team} team maintains an inventory of {asset}.",
+]
+ASSETS = ["customer records", "payment systems", "laptops", "source code", "audit logs"]
+TEAMS = ["security", "compliance", "infrastructure", "privacy"]
+
+
+def build_corpus(sentence_count: int, seed: int = 7) -> List[str]:
+    """Build synthetic sentences, about two fifths of them obligations."""
+    rng = random.Random(seed)
+    return [rng.choice(TEMPLATES).format(asset=rng.choice(ASSETS), team=rng.choice(TEAMS))
+            for _ in range(sentence_count)]
+
+
+def main() -> None:
+    """Run the benchmark and print throughput per worker count."""
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sentences', type=int, default=2_000_000,
+                        help='Sentences in the synthetic corpus (default: 2000000)')
+    parser.add_argument('--workers', type=int, nargs='+', default=[2, 4],
+                        help='Worker counts to compare with serial processing (default: 2 4)')
+    args = parser.parse_args()
+
+    # Keep library logging out of the benchmark output
+    setup_logging(log_level="WARNING", console_output=False)
+
+    sentences = build_corpus(args.sentences)
+    print(f"Corpus: {len(sentences):,} sentences, {os.cpu_count()} CPUs")
+    print()
+    print(f"{'workers':>7} {'seconds':>9} {'sentences/s':>13} {'chunks':>7} {'largest chunk':>14}")
+
+    expected = None
+    serial_seconds = None
+    for workers in [1] + args.workers:
+        finder = ObligationFinder(workers=workers, parallel_threshold=0)
+        started = time.perf_counter()
+        obligations = finder.process_sentences(sentences)
+        seconds = time.perf_counter() - started
+
+        if expected is None:
+            expected, serial_seconds = obligations, seconds
+        elif obligations != expected:
+            print(f"{workers} workers returned different obligations than serial processing")
+            sys.exit(1)
+
+        chunks = len(finder.chunk_sizes)
+        largest = f"{max(finder.chunk_sizes):,}" if chunks else '-'
+        print(f"{workers:>7} {seconds:>9.2f} {len(sentences) / seconds:>13,.0f} "
+              f"{chunks or '-':>7} {largest:>14}  ({serial_seconds / seconds:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
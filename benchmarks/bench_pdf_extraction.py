@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Benchmark PDF page extraction with buffered file reads vs a shared memory map.
+
+Builds a synthetic multi-page PDF from the sample document (or uses --pdf),
+extracts it across a process pool in each mode and reports wall time plus the
+resident memory of the worker processes. Private (anonymous) memory is what
+each worker holds on its own; file-backed memory comes from the shared page
+cache and is counted once by the OS no matter how many workers map it.
+
+Usage:
+    python benchmarks/bench_pdf_extraction.py --pages 400 --workers 4
+"""
+
+import argparse
+import os
+import resource
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List
+
+# Add the src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pypdf
+
+from compliance_assistant.pdf_reader import _extract_pages
+
+SAMPLE_PDF = os.path.join(os.path.dirname(__file__), '..', 'data', 'documents',
+                          'sample_IT_compliance_document.pdf')
+
+
+def build_synthetic_pdf(source_pdf: str, page_count: int, output_path: str) -> str:
+    """Write a PDF repeating the source document's pages up to page_count pages."""
+    source = pypdf.PdfReader(source_pdf)
+    writer = pypdf.PdfWriter()
+    for page_num in range(page_count):
+        writer.add_page(source.pages[page_num % len(source.pages)])
+    with open(output_path, 'wb') as file:
+        writer.write(file)
+    return output_path
+
+
+def memory_status() -> Dict[str, int]:
+    """Read resident memory figures (kB) for the current process."""
+    status = {'VmHWM': 0, 'RssAnon': 0, 'RssFile': 0}
+    try:
+        with open('/proc/self/status') as file:
+            for line in file:
+                key, _, value = line.partition(':')
+                if key in status:
+                    status[key] = int(value.split()[0])
+    except OSError:
+        # Not Linux: only peak RSS is available
+        status['VmHWM'] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return status
+
+
+def measure_page_range(pdf_path: str, start: int, stop: int, use_mmap: bool) -> Dict[str, int]:
+    """Extract a page range in a worker and report that worker's memory."""
+    _extract_pages(pdf_path, list(range(start, stop)), use_mmap)
+    return memory_status()
+
+
+def run_mode(pdf_path: str, page_count: int, workers: int, use_mmap: bool) -> Dict[str, float]:
+    """Extract every page across a fresh process pool and collect worker memory."""
+    chunk_size = -(-page_count // workers)
+    ranges = [(start, min(start + chunk_size, page_count))
+              for start in range(0, page_count, chunk_size)]
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+        futures = [executor.submit(measure_page_range, pdf_path, start, stop, use_mmap)
+                   for start, stop in ranges]
+        statuses: List[Dict[str, int]] = [future.result() for future in futures]
+    elapsed = time.perf_counter() - started
+
+    return {
+        'seconds': elapsed,
+        'private_kb': sum(status['RssAnon'] for status in statuses),
+        'file_backed_kb': sum(status['RssFile'] for status in statuses),
+        'peak_worker_kb': max(status['VmHWM'] for status in statuses)
+    }
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pdf', type=str, default=None,
+                        help='PDF to benchmark (default: synthetic copy of the sample document)')
+    parser.add_argument('--pages', type=int, default=200,
+                        help='Pages in the synthetic PDF (default: 200)')
+    parser.add_argument('--workers', type=int, default=4,
+                        help='Worker processes (default: 4)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        pdf_path = args.pdf or build_synthetic_pdf(
+            SAMPLE_PDF, args.pages, os.path.join(temp_dir, 'synthetic.pdf'))
+        page_count = len(pypdf.PdfReader(pdf_path).pages)
+
+        print(f"PDF: {pdf_path} ({page_count} pages, {os.path.getsize(pdf_path) / 1024:.0f} kB)")
+        print(f"Workers: {args.workers}")
+        print()
+        print(f"{'mode':<10} {'seconds':>9} {'private kB':>12} {'file kB':>10} {'peak worker kB':>16}")
+
+        results = {}
+        for mode, use_mmap in (('buffered', False), ('mmap', True)):
+            results[mode] = run_mode(pdf_path, page_count, args.workers, use_mmap)
+            result = results[mode]
+            print(f"{mode:<10} {result['seconds']:>9.2f} {result['private_kb']:>12,} "
+                  f"{result['file_backed_kb']:>10,} {result['peak_worker_kb']:>16,}")
+
+        saved_kb = results['buffered']['private_kb'] - results['mmap']['private_kb']
+        print()
+        print(f"Private resident memory saved by mmap across workers: {saved_kb:,} kB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark SentenceSegmenter against the original regex sentence splitter.
+
+The original approach collapses whitespace across the whole text with
+re.sub and then splits with a lookbehind pattern, compiling both patterns on
+every call. The segmenter scans once for boundary candidates and checks an
+abbreviation lexicon, so it also produces fewer false splits.
+
+Usage:
+    python benchmarks/bench_sentence_segmenter.py --sentences 200000
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+from typing import Callable, List
+
+# Add the src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from compliance_assistant.sentence_segmenter import SentenceSegmenter
+
+SENTENCE_TEMPLATES = [
+    "All {asset} must be reviewed by the {team} team within {days} days.",
+    "Access to {asset} shall be logged, e.g. through the SIEM.",
+    "Systems in the U.S. East region are covered by Sec. {days} of this standard.",
+    "The {team} team is required to report incidents affecting {asset}.",
+    "Staff should consult Dr. Smith or the {team} lead before changing {asset}.",
+    "Backups of {asset} are tested quarterly.",
+]
+ASSETS = ["customer records", "payment systems", "laptops", "source code", "audit logs"]
+TEAMS = ["security", "compliance", "infrastructure", "privacy"]
+
+
+def legacy_split(text: str) -> List[str]:
+    """The original regex splitter, including its per-call pattern compilation."""
+    cleaned_text = re.sub(r'\s+', ' ', text.strip())
+    sentences = re.split(r'(?<=[.!?])\s+(?=[A-Z])', cleaned_text)
+    return [sentence.strip() for sentence in sentences if sentence.strip()]
+
+
+def build_corpus(sentence_count: int, seed: int = 7) -> str:
+    """Build synthetic policy text with line breaks like extracted PDF pages."""
+    rng = random.Random(seed)
+    sentences = []
+    for _ in range(sentence_count):
+        template = rng.choice(SENTENCE_TEMPLATES)
+        sentences.append(template.format(asset=rng.choice(ASSETS), team=rng.choice(TEAMS),
+                                         days=rng.randint(1, 90)))
+    # Wrap at roughly 80 characters, as pypdf returns one line per text line
+    text = ' '.join(sentences)
+    return '\n'.join(text[i:i + 80] for i in range(0, len(text), 80))
+
+
+def time_splitter(split: Callable[[str], List[str]], text: str, repeats: int) -> float:
+    """Return the best wall time of several runs."""
+    best = float('inf')
+    for _ in range(repeats):
+        started = time.perf_counter()
+        split(text)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    """Run the benchmark and print throughput for both splitters."""
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sentences', type=int, default=200_000,
+                        help='Sentences in the synthetic corpus (default: 200000)')
+    parser.add_argument('--repeats', type=int, default=3,
+                        help='Runs per splitter, best time is reported (default: 3)')
+    args = parser.parse_args()
+
+    text = build_corpus(args.sentences)
+    megabytes = len(text) / (1024 * 1024)
+    segmenter = SentenceSegmenter()
+
+    print(f"Corpus: {args.sentences:,} sentences, {megabytes:.1f} MB")
+    print()
+    print(f"{'splitter':<12} {'seconds':>9} {'MB/s':>8} {'sentences/s':>13} {'sentences':>11}")
+
+    for name, split in (('regex', legacy_split), ('segmenter', segmenter.split)):
+        seconds = time_splitter(split, text, args.repeats)
+        found = len(split(text))
+        print(f"{name:<12} {seconds:>9.3f} {megabytes / seconds:>8.1f} "
+              f"{found / seconds:>13,.0f} {found:>11,}")
+
+    print()
+    print(f"Expected sentences: {args.sentences:,} "
+          f"(the regex splitter also breaks after 'U.S.', 'Sec.' and 'Dr.')")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,14 +7,55 @@ __version__ = "0.1.0"
 __author__ = "Compliance Assistant Team"
 __description__ = "Extract compliance obligations from PDF documents and export to Excel"
 
-from .pdf_reader import PDFReader
-from .obligation_finder import ObligationFinder
-from .excel_exporter import ExcelExporter
-from .main import ComplianceAssistant
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+# Public classes and the modules defining them. They are imported on first
+# access so that importing the package does not pull in pypdf or pandas.
+_LAZY_IMPORTS = {
+    "PDFReader": ".pdf_reader",
+    "ObligationFinder": ".obligation_finder",
+    "Obligation": ".obligation",
+    "ExcelExporter": ".excel_exporter",
+    "ComplianceAssistant": ".main",
+}
+
+if TYPE_CHECKING:
+    from .pdf_reader import PDFReader
+    from .obligation_finder import ObligationFinder
+    from .obligation import Obligation
+    from .excel_exporter import ExcelExporter
+    from .main import ComplianceAssistant
 
 __all__ = [
     "PDFReader",
     "ObligationFinder", 
+    "Obligation",
     "ExcelExporter",
     "ComplianceAssistant"
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import a public class the first time it is accessed.
+
+    Args:
+        name: Attribute being looked up on the package
+
+    Returns:
+        The requested class
+
+    Raises:
+        AttributeError: If name is not a public class of the package
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List module attributes, including classes not imported yet."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
@@ -7,12 +7,18 @@ import sys
 import os
 import argparse
 
-from .main import ComplianceAssistant
 from .logging_config import setup_logging, get_logger
 
 
 def main() -> None:
     """Main CLI entry point."""
+    # The pipeline is imported when a command runs so importing the CLI stays cheap
+    from .extraction_cache import ExtractionCache
+    from .lexicon import LexiconCache
+    from .main import ComplianceAssistant
+    from .obligation_finder import ObligationFinder
+    from .pdf_reader import EXTRACTION_MODES, PDFReader, parse_page_ranges
+
     # Set up logging first
     setup_logging(log_level="INFO", console_output=False)  # Only log to file for CLI
     logger = get_logger('cli')
@@ -26,7 +32,19 @@ def main() -> None:
 Examples:
   %(prog)s                                    # Process default sample PDF
   %(prog)s --pdf path/to/document.pdf        # Process specific PDF
+  %(prog)s --pdf path/to/export.md           # Process a text export without PDF parsing
   %(prog)s --output /custom/output/dir       # Use custom output directory
+  %(prog)s --workers 4                       # Extract large PDFs with 4 processes
+  %(prog)s --match-workers 4                 # Find obligations with 4 processes
+  %(prog)s --pages 12-80,95                  # Only process selected pages
+  %(prog)s --max-obligations 20              # Stop once 20 obligations are found
+  %(prog)s --extraction-mode layout          # Keep multi-column layout intact
+  %(prog)s --memory-limit-mb 64              # Bound memory for very large PDFs
+  %(prog)s --metrics-csv metrics.csv         # Record per-page extraction timings
+  %(prog)s --lexicon data/lexicons/obligation_lexicon.json  # Use a custom obligation lexicon
+  %(prog)s --cache                           # Reuse extraction results for unchanged PDFs
+  %(prog)s --clear-cache                     # Empty the extraction cache
+  %(prog)s --pdf doc.pdf --inspect           # Page count and cost estimate only
         """
     )
 
@@ -34,7 +52,8 @@ Examples:
         '--pdf',
         type=str,
         default="data/documents/sample_IT_compliance_document.pdf",
-        help='Path to PDF document to process (default: sample document)'
+        help='Path to PDF document, or .txt/.md/.html text export, to process '
+             '(default: sample document)'
     )
 
     parser.add_argument(
@@ -44,6 +63,141 @@ Examples:
         help='Output directory for Excel files (default: output)'
     )
 
+    parser.add_argument(
+        '--inspect',
+        action='store_true',
+        help='Print page count, size, encryption status and estimated extraction cost, then exit'
+    )
+
+    parser.add_argument(
+        '--pages',
+        type=str,
+        default=None,
+        help='Pages to process, e.g. 12-80,95 (default: all pages)'
+    )
+
+    parser.add_argument(
+        '--max-obligations',
+        type=int,
+        default=None,
+        help='Stop extraction once this many obligations are found; headers are then detected '
+             f'from the first {PDFReader.HEADER_FOOTER_EARLY_STOP_SAMPLE_PAGES} pages only, so '
+             'the stop is not held back (default: no limit)'
+    )
+
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Worker processes for PDF page extraction (default: 1, serial)'
+    )
+
+    parser.add_argument(
+        '--parallel-threshold',
+        type=int,
+        default=PDFReader.DEFAULT_PARALLEL_THRESHOLD,
+        help='Minimum page count before parallel extraction is used '
+             f'(default: {PDFReader.DEFAULT_PARALLEL_THRESHOLD})'
+    )
+
+    parser.add_argument(
+        '--match-workers',
+        type=int,
+        default=1,
+        help='Worker processes for finding obligations in documents of at least '
+             f'{ObligationFinder.DEFAULT_PARALLEL_THRESHOLD:,} sentences (default: 1, serial)'
+    )
+
+    parser.add_argument(
+        '--keep-headers',
+        action='store_true',
+        help='Keep header/footer lines that repeat across pages (stripped by default; detection '
+             f'holds back the first {PDFReader.HEADER_FOOTER_SAMPLE_PAGES} pages)'
+    )
+
+    parser.add_argument(
+        '--keep-listings',
+        action='store_true',
+        help='Keep table of contents and index pages (skipped by default)'
+    )
+
+    parser.add_argument(
+        '--page-timeout',
+        type=float,
+        default=None,
+        help='Seconds allowed per page; slower pages are skipped and reported (default: no limit)'
+    )
+
+    parser.add_argument(
+        '--extraction-mode',
+        choices=EXTRACTION_MODES,
+        default='plain',
+        help="pypdf text extraction mode: 'plain' is fastest, 'layout' keeps columns "
+             "and indentation (default: plain)"
+    )
+
+    parser.add_argument(
+        '--mmap',
+        action='store_true',
+        help='Read PDFs through a memory map shared by extraction workers'
+    )
+
+    parser.add_argument(
+        '--memory-limit-mb',
+        type=float,
+        default=None,
+        help='Spill extracted sentences to a temporary file beyond this many MB '
+             '(default: keep everything in memory)'
+    )
+
+    parser.add_argument(
+        '--metrics-csv',
+        type=str,
+        default=None,
+        help='Append per-page extraction timings and pypdf warning counts to this CSV file'
+    )
+
+    parser.add_argument(
+        '--lexicon',
+        type=str,
+        default=None,
+        help='JSON or YAML file of obligation phrases with categories and weights '
+             '(default: built-in keywords)'
+    )
+
+    parser.add_argument(
+        '--cache',
+        action='store_true',
+        help='Cache extraction results keyed by PDF content hash'
+    )
+
+    parser.add_argument(
+        '--cache-dir',
+        type=str,
+        default=ExtractionCache.DEFAULT_CACHE_DIR,
+        help=f'Extraction cache directory (default: {ExtractionCache.DEFAULT_CACHE_DIR})'
+    )
+
+    parser.add_argument(
+        '--cache-max-mb',
+        type=int,
+        default=ExtractionCache.DEFAULT_MAX_BYTES // (1024 * 1024),
+        help='Size cap for the extraction cache in MB; least recently used entries '
+             f'are evicted (default: {ExtractionCache.DEFAULT_MAX_BYTES // (1024 * 1024)})'
+    )
+
+    parser.add_argument(
+        '--clear-cache',
+        action='store_true',
+        help='Remove every extraction cache entry and exit'
+    )
+
+    parser.add_argument(
+        '--invalidate-cache',
+        action='store_true',
+        help='Remove extraction cache entries for --pdf and exit'
+    )
+
     parser.add_argument(
         '--log-level',
         type=str,
@@ -65,7 +219,18 @@ Examples:
         setup_logging(log_level=args.log_level, console_output=False)
         logger = get_logger('cli')
 
-    logger.info(f"CLI arguments: pdf={args.pdf}, output={args.output}, log_level={args.log_level}")
+    logger.info(f"CLI arguments: pdf={args.pdf}, output={args.output}, log_level={args.log_level}, "
+                f"pages={args.pages}, max_obligations={args.max_obligations}, "
+                f"workers={args.workers}, match_workers={args.match_workers}, parallel_threshold={args.parallel_threshold}, mmap={args.mmap}, "
+                f"extraction_mode={args.extraction_mode}, "
+                f"page_timeout={args.page_timeout}, keep_headers={args.keep_headers}, "
+                f"keep_listings={args.keep_listings}, memory_limit_mb={args.memory_limit_mb}, "
+                f"metrics_csv={args.metrics_csv}, lexicon={args.lexicon}, cache={args.cache}, cache_dir={args.cache_dir}")
+
+    if args.clear_cache:
+        removed = ExtractionCache(args.cache_dir).clear()
+        print(f"🗑️ Removed {removed} entries from extraction cache: {args.cache_dir}")
+        sys.exit(0)
 
     # Validate PDF file exists
     if not os.path.exists(args.pdf):
@@ -74,13 +239,59 @@ Examples:
         print(f"❌ Error: {error_msg}")
         sys.exit(1)
 
+    pages = None
+    if args.pages is not None:
+        try:
+            pages = parse_page_ranges(args.pages)
+        except ValueError as e:
+            logger.error(str(e))
+            print(f"❌ Error: {e}")
+            sys.exit(1)
+
+    if args.inspect:
+        try:
+            info = PDFReader(use_mmap=args.mmap).inspect(args.pdf)
+        except Exception as e:
+            logger.error(f"Inspection failed: {e}")
+            print(f"❌ Error: {e}")
+            sys.exit(1)
+        print(f"📄 Document: {info['path']}")
+        print(f"📦 File Size: {info['file_size']:,} bytes")
+        print(f"📑 Pages: {info['page_count'] if info['page_count'] is not None else 'unknown'}")
+        print(f"🔒 Encrypted: {'yes' if info['encrypted'] else 'no'}")
+        print(f"⏱️ Estimated Extraction: {info['estimated_seconds']:.2f}s")
+        sys.exit(0)
+
+    if args.invalidate_cache:
+        removed = ExtractionCache(args.cache_dir).invalidate(args.pdf)
+        print(f"🗑️ Removed {removed} extraction cache entries for: {args.pdf}")
+        sys.exit(0)
+
     # Run the compliance assistant
     print("🚀 Compliance Assistant - PDF Obligation Extractor")
     print("="*60)
 
     try:
-        assistant = ComplianceAssistant()
-        result = assistant.process_document(args.pdf, args.output)
+        cache = None
+        if args.cache:
+            cache = ExtractionCache(args.cache_dir, max_bytes=args.cache_max_mb * 1024 * 1024)
+        memory_limit = None
+        if args.memory_limit_mb is not None:
+            memory_limit = int(args.memory_limit_mb * 1024 * 1024)
+        pdf_reader = PDFReader(workers=args.workers, parallel_threshold=args.parallel_threshold,
+                               cache=cache, use_mmap=args.mmap, page_timeout=args.page_timeout,
+                               strip_headers=not args.keep_headers,
+                               skip_listings=not args.keep_listings,
+                               memory_limit=memory_limit,
+                               extraction_mode=args.extraction_mode)
+        obligation_finder = ObligationFinder(
+            lexicon_path=args.lexicon,
+            lexicon_cache=LexiconCache() if args.lexicon is not None else None,
+            workers=args.match_workers)
+        assistant = ComplianceAssistant(pdf_reader=pdf_reader, obligation_finder=obligation_finder)
+        result = assistant.process_document(args.pdf, args.output, pages=pages,
+                                            max_obligations=args.max_obligations,
+                                            metrics_csv=args.metrics_csv)
 
         # Print summary
         assistant.print_summary(result)
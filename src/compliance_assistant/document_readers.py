@@ -0,0 +1,189 @@
+"""
+Document Readers Module for Compliance Assistant
+Reads pre-extracted text exports (plain text, Markdown, HTML) without PDF parsing.
+"""
+
+import os
+import re
+from html.parser import HTMLParser
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+from .logging_config import get_logger
+
+logger = get_logger('document_readers')
+
+# Text is streamed to the sentence splitter in blocks of this many characters
+READ_BLOCK_SIZE = 1024 * 1024
+
+# A reader turns a document path into text chunks that join into its full text
+DocumentReader = Callable[[str], Iterator[str]]
+
+# Markdown syntax removed before splitting, leaving only the readable text
+MARKDOWN_IMAGE = re.compile(r'!\[([^\]]*)\]\([^)]*\)')
+MARKDOWN_LINK = re.compile(r'\[([^\]]*)\]\([^)]*\)')
+MARKDOWN_LINE_PREFIX = re.compile(r'^\s*(?:#{1,6}\s+|>\s?|[-*+]\s+)')
+MARKDOWN_EMPHASIS = re.compile(r'(\*{1,3}|_{2,3}|`+|~~)')
+MARKDOWN_TABLE_RULE = re.compile(r'^\s*\|?\s*:?-{3,}')
+
+
+def read_text_file(path: str) -> Iterator[str]:
+    """
+    Read a plain text document in blocks.
+
+    Args:
+        path: Path to the text file
+
+    Yields:
+        Consecutive blocks of the file's text
+    """
+    with open(path, 'r', encoding='utf-8', errors='replace') as file:
+        for block in iter(lambda: file.read(READ_BLOCK_SIZE), ''):
+            yield block
+
+
+def read_markdown_file(path: str) -> Iterator[str]:
+    """
+    Read a Markdown document line by line with its markup removed.
+
+    Args:
+        path: Path to the Markdown file
+
+    Yields:
+        Each line's readable text, ending in a newline
+    """
+    in_code_block = False
+    with open(path, 'r', encoding='utf-8', errors='replace') as file:
+        for line in file:
+            if line.lstrip().startswith('```'):
+                in_code_block = not in_code_block
+                continue
+            if in_code_block or MARKDOWN_TABLE_RULE.match(line):
+                continue
+            line = MARKDOWN_IMAGE.sub(r'\1', line)
+            line = MARKDOWN_LINK.sub(r'\1', line)
+            line = MARKDOWN_LINE_PREFIX.sub('', line)
+            line = MARKDOWN_EMPHASIS.sub('', line).replace('|', ' ')
+            yield line.rstrip('\n') + '\n'
+
+
+class _HTMLTextParser(HTMLParser):
+    """Collects the visible text of an HTML document."""
+
+    # Tags whose content is never shown as text
+    HIDDEN_TAGS = frozenset({'script', 'style', 'head', 'title', 'noscript', 'template'})
+
+    # Tags that start a new line of text
+    BLOCK_TAGS = frozenset({
+        'p', 'div', 'br', 'li', 'ul', 'ol', 'tr', 'td', 'th', 'table', 'section',
+        'article', 'header', 'footer', 'blockquote', 'pre', 'hr',
+        'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+    })
+
+    def __init__(self) -> None:
+        """Initialize the parser with an empty text buffer."""
+        super().__init__(convert_charrefs=True)
+        self.parts: List[str] = []
+        self._hidden_depth = 0
+
+    def handle_starttag(self, tag: str, attrs: List) -> None:
+        """Track hidden sections and break lines at block elements."""
+        if tag in self.HIDDEN_TAGS:
+            self._hidden_depth += 1
+        elif tag in self.BLOCK_TAGS:
+            self.parts.append('\n')
+
+    def handle_endtag(self, tag: str) -> None:
+        """Close hidden sections and break lines at block elements."""
+        if tag in self.HIDDEN_TAGS:
+            self._hidden_depth = max(0, self._hidden_depth - 1)
+        elif tag in self.BLOCK_TAGS:
+            self.parts.append('\n')
+
+    def handle_data(self, data: str) -> None:
+        """Keep text outside hidden sections."""
+        if not self._hidden_depth:
+            self.parts.append(data)
+
+    def take_text(self) -> str:
+        """Return the text collected so far and clear the buffer."""
+        text = ''.join(self.parts)
+        self.parts = []
+        return text
+
+
+def read_html_file(path: str) -> Iterator[str]:
+    """
+    Read the visible text of an HTML document in blocks.
+
+    Args:
+        path: Path to the HTML file
+
+    Yields:
+        Text parsed from consecutive blocks of the file
+    """
+    parser = _HTMLTextParser()
+    with open(path, 'r', encoding='utf-8', errors='replace') as file:
+        for block in iter(lambda: file.read(READ_BLOCK_SIZE), ''):
+            parser.feed(block)
+            yield parser.take_text()
+    parser.close()
+    yield parser.take_text()
+
+
+class ReaderRegistry:
+    """Maps file extensions to readers that produce a document's text."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._readers: Dict[str, DocumentReader] = {}
+
+    @staticmethod
+    def _normalise_extension(extension: str) -> str:
+        """Lowercase an extension and make sure it starts with a dot."""
+        extension = extension.lower()
+        return extension if extension.startswith('.') else f'.{extension}'
+
+    def register(self, extensions: Iterable[str], reader: DocumentReader) -> None:
+        """
+        Register a reader for one or more file extensions.
+
+        Args:
+            extensions: Extensions such as ".txt" or "md" (case-insensitive)
+            reader: Function taking a path and yielding the document's text in chunks
+        """
+        for extension in extensions:
+            extension = self._normalise_extension(extension)
+            logger.debug(f"Registering reader {reader.__name__} for {extension}")
+            self._readers[extension] = reader
+
+    def get(self, path: str) -> Optional[DocumentReader]:
+        """
+        Find the reader for a document by its file extension.
+
+        Args:
+            path: Path to the document
+
+        Returns:
+            The registered reader, or None if the extension has none
+        """
+        extension = os.path.splitext(path)[1]
+        if not extension:
+            return None
+        return self._readers.get(self._normalise_extension(extension))
+
+    def extensions(self) -> List[str]:
+        """Return the registered extensions in sorted order."""
+        return sorted(self._readers)
+
+
+def default_registry() -> ReaderRegistry:
+    """
+    Build a registry with the built-in text export readers.
+
+    Returns:
+        Registry covering plain text, Markdown and HTML files
+    """
+    registry = ReaderRegistry()
+    registry.register(['.txt', '.text'], read_text_file)
+    registry.register(['.md', '.markdown'], read_markdown_file)
+    registry.register(['.html', '.htm'], read_html_file)
+    return registry
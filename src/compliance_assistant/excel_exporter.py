@@ -3,11 +3,14 @@ Excel Exporter Module for Compliance Assistant
 Exports compliance obligations to Excel format.
 """
 
-import pandas as pd
 import os
-from typing import List, Dict, Any
+from typing import TYPE_CHECKING, Dict, Any, Mapping, Sequence
 from datetime import datetime
 from .logging_config import get_logger
+from .obligation import Obligation
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 logger = get_logger('excel_exporter')
 
@@ -20,39 +23,45 @@ class ExcelExporter:
         logger.info("Initializing Excel exporter")
         pass
     
-    def create_obligation_dataframe(self, obligations: List[Dict[str, str]],
-                                  source_document: str) -> pd.DataFrame:
+    def create_obligation_dataframe(self, obligations: Sequence[Mapping[str, Any]],
+                                  source_document: str) -> 'pd.DataFrame':
         """
         Create a pandas DataFrame from obligations list.
 
         Args:
-            obligations: List of obligation dictionaries
-            source_document: Name of the source document
+            obligations: Obligations, as records or dictionaries
+            source_document: Name of the source document, for obligations
+                that don't name their own
 
         Returns:
             DataFrame with obligation data
         """
         logger.info(f"Creating DataFrame for {len(obligations)} obligations from {source_document}")
-        data = []
-
-        for i, obligation in enumerate(obligations, 1):
-            row = {
-                'ID': f'OBL-{i:03d}',  # Format as OBL-001, OBL-002, etc.
-                'Obligation Text': obligation['text'],
-                'Source Document': source_document,
-                'Keywords': obligation.get('keywords', ''),
-                'Owner': 'Not Started',
-                'Next Due Date': 'Not Started',
-                'Status': 'Not Started'
-            }
-            data.append(row)
-            logger.debug(f"Added obligation {i}: {obligation['text'][:50]}...")
+
+        # Built column by column, without an intermediate dictionary per row
+        data: Dict[str, Any] = {
+            'ID': [f'OBL-{i:03d}' for i in range(1, len(obligations) + 1)],  # OBL-001, OBL-002, etc.
+            'Obligation Text': [obligation['text'] for obligation in obligations],
+            'Source Document': [obligation.get('source_document', source_document)
+                                for obligation in obligations],
+            'Page': [obligation.get('page', '') for obligation in obligations],
+            'Keywords': [obligation.get('keywords', '') for obligation in obligations]
+        }
+        # Present when the obligations were found with a lexicon file
+        if obligations and 'categories' in obligations[0]:
+            data['Categories'] = [obligation.get('categories', '') for obligation in obligations]
+            data['Weight'] = [obligation.get('weight', '') for obligation in obligations]
+        for column in ('Owner', 'Next Due Date', 'Status'):
+            data[column] = ['Not Started'] * len(obligations)
+
+        # pandas is imported on first use so importing this module stays cheap
+        import pandas as pd
 
         df = pd.DataFrame(data)
         logger.info(f"DataFrame created with {len(df)} rows and {len(df.columns)} columns")
         return df
     
-    def format_excel_worksheet(self, df: pd.DataFrame, worksheet: Any) -> None:
+    def format_excel_worksheet(self, df: 'pd.DataFrame', worksheet: Any) -> None:
         """
         Apply formatting to the Excel worksheet.
 
@@ -87,13 +96,13 @@ class ExcelExporter:
 
         logger.debug("Excel worksheet formatting completed")
     
-    def export_to_excel(self, obligations: List[Dict[str, str]],
+    def export_to_excel(self, obligations: Sequence[Mapping[str, Any]],
                        source_document: str, output_path: str) -> str:
         """
         Export obligations to Excel file.
 
         Args:
-            obligations: List of obligation dictionaries
+            obligations: Obligations, as records or dictionaries
             source_document: Name of the source document
             output_path: Path where Excel file should be saved
 
@@ -111,6 +120,8 @@ class ExcelExporter:
         logger.debug(f"Ensured output directory exists: {output_dir}")
 
         # Export to Excel with formatting
+        import pandas as pd
+
         try:
             with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
                 df.to_excel(writer, sheet_name='Compliance Obligations', index=False)
@@ -148,13 +159,13 @@ class ExcelExporter:
         logger.debug(f"Generated output filename: {full_path}")
         return full_path
     
-    def create_summary_report(self, obligations: List[Dict[str, str]],
+    def create_summary_report(self, obligations: Sequence[Mapping[str, Any]],
                             source_document: str) -> Dict[str, Any]:
         """
         Create a summary report of the extraction process.
 
         Args:
-            obligations: List of obligation dictionaries
+            obligations: Obligations, as records or dictionaries
             source_document: Name of the source document
 
         Returns:
@@ -164,7 +175,11 @@ class ExcelExporter:
         keyword_counts: Dict[str, int] = {}
 
         for obligation in obligations:
-            keywords = obligation.get('keywords', '').split(', ')
+            # Records keep their keywords as a tuple; dictionaries join them
+            if isinstance(obligation, Obligation):
+                keywords = obligation.keywords
+            else:
+                keywords = obligation.get('keywords', '').split(', ')
             for keyword in keywords:
                 if keyword.strip():
                     keyword_counts[keyword.strip()] = keyword_counts.get(keyword.strip(), 0) + 1
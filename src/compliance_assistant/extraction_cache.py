@@ -0,0 +1,305 @@
+"""
+Extraction Cache Module for Compliance Assistant
+Stores extracted page texts and sentences on disk, keyed by PDF content hash,
+plus individual page texts keyed by page content hash.
+"""
+
+import hashlib
+import json
+import os
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from .logging_config import get_logger
+
+if TYPE_CHECKING:
+    import pypdf
+
+logger = get_logger('extraction_cache')
+
+
+def page_content_hash(page: 'pypdf.PageObject') -> str:
+    """
+    Hash everything on a page that feeds text extraction.
+
+    Covers the decoded content stream, any form XObjects it draws, and the
+    fonts used (name, type and ToUnicode map), so a page's hash only changes
+    when its extracted text could change.
+
+    Args:
+        page: pypdf page object
+
+    Returns:
+        Hex SHA-256 digest of the page's text-bearing content
+    """
+    digest = hashlib.sha256()
+    contents = page.get_contents()
+    if contents is not None:
+        digest.update(contents.get_data())
+
+    resources = page.get('/Resources')
+    resources = resources.get_object() if resources is not None else {}
+
+    xobjects = resources.get('/XObject')
+    if xobjects is not None:
+        xobjects = xobjects.get_object()
+        for name in sorted(xobjects):
+            xobject = xobjects[name].get_object()
+            if xobject.get('/Subtype') == '/Form':
+                digest.update(name.encode('utf-8'))
+                digest.update(xobject.get_data())
+
+    fonts = resources.get('/Font')
+    if fonts is not None:
+        fonts = fonts.get_object()
+        for name in sorted(fonts):
+            font = fonts[name].get_object()
+            digest.update(f"{name}:{font.get('/BaseFont')}:{font.get('/Subtype')}".encode('utf-8'))
+            to_unicode = font.get('/ToUnicode')
+            if to_unicode is not None:
+                digest.update(to_unicode.get_object().get_data())
+
+    return digest.hexdigest()
+
+
+class ExtractionCache:
+    """On-disk cache of PDF extraction results with a size cap and LRU eviction."""
+
+    # Bump when the layout of cache entries changes
+    CACHE_FORMAT_VERSION: int = 4
+
+    DEFAULT_CACHE_DIR: str = '.cache/extraction'
+    DEFAULT_MAX_BYTES: int = 512 * 1024 * 1024  # 512MB
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR,
+                 max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """
+        Initialize the extraction cache.
+
+        Args:
+            cache_dir: Directory holding cache entries (created if missing)
+            max_bytes: Total size the cache may grow to before evicting entries
+        """
+        logger.info(f"Initializing extraction cache at {cache_dir} (max {max_bytes} bytes)")
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def hash_file(pdf_path: str) -> str:
+        """
+        Compute the SHA-256 of a file's bytes.
+
+        Args:
+            pdf_path: Path to the file
+
+        Returns:
+            Hex digest of the file contents
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+        """
+        digest = hashlib.sha256()
+        try:
+            with open(pdf_path, 'rb') as file:
+                for block in iter(lambda: file.read(1024 * 1024), b''):
+                    digest.update(block)
+        except FileNotFoundError as e:
+            logger.error(f"PDF file not found: {pdf_path}")
+            raise FileNotFoundError(f"PDF file not found: {pdf_path}") from e
+        return digest.hexdigest()
+
+    @staticmethod
+    def hash_pages(pdf_path: str) -> List[str]:
+        """
+        Compute the content hash of every page of a PDF, as page cache keys use.
+
+        Args:
+            pdf_path: Path to the PDF file
+
+        Returns:
+            Hex digest per page, in page order
+        """
+        # pypdf is imported on first use so importing this module stays cheap
+        import pypdf
+
+        return [page_content_hash(page) for page in pypdf.PdfReader(pdf_path).pages]
+
+    def make_key(self, content_hash: str, settings: Dict[str, Any]) -> str:
+        """
+        Build the cache key for a document and the reader settings used on it.
+
+        Args:
+            content_hash: SHA-256 of the PDF bytes
+            settings: Reader version and any settings that change extracted text
+
+        Returns:
+            Cache key, prefixed with the content hash so entries can be
+            invalidated per document
+        """
+        settings_json = json.dumps(
+            {'format': self.CACHE_FORMAT_VERSION, 'settings': settings},
+            sort_keys=True
+        )
+        settings_digest = hashlib.sha256(settings_json.encode('utf-8')).hexdigest()[:16]
+        return f'{content_hash}_{settings_digest}'
+
+    def _entry_path(self, key: str) -> str:
+        """Return the file path for a cache key."""
+        return os.path.join(self.cache_dir, f'{key}.json')
+
+    def _entries(self) -> List[os.DirEntry]:
+        """Return the directory entries of all cache files."""
+        with os.scandir(self.cache_dir) as entries:
+            return [entry for entry in entries if entry.is_file() and entry.name.endswith('.json')]
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cache entry and mark it as recently used.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Dictionary with 'pages', 'sentences' and 'skipped', or None on a miss
+        """
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, 'r', encoding='utf-8') as file:
+                entry = json.load(file)
+        except FileNotFoundError:
+            logger.debug(f"Cache miss: {key}")
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Discarding unreadable cache entry {entry_path}: {e}")
+            self._remove(entry_path)
+            return None
+
+        # Access time is unreliable (noatime mounts), so recency is tracked via mtime
+        os.utime(entry_path)
+        logger.debug(f"Cache hit: {key}")
+        return entry
+
+    def put(self, key: str, pages: List[Tuple[int, str]], sentences: List[List[Any]],
+            skipped: Optional[List[Dict[str, Any]]] = None) -> None:
+        """
+        Store extraction results and evict old entries if over the size cap.
+
+        Args:
+            key: Cache key from make_key
+            pages: (page number, text) of each extracted page
+            sentences: [text, page, start, end] records for each sentence
+            skipped: Pages deliberately left out of the text, with reasons
+        """
+        self._write(key, {'pages': pages, 'sentences': sentences, 'skipped': skipped or []})
+        self.evict()
+
+    def get_page(self, key: str) -> Optional[str]:
+        """
+        Look up the cached text of a single page.
+
+        Args:
+            key: Cache key built from the page's content hash
+
+        Returns:
+            Page text, or None on a miss
+        """
+        entry = self.get(key)
+        if entry is None:
+            return None
+        return entry.get('text')
+
+    def put_page(self, key: str, text: str) -> None:
+        """
+        Store the text of a single page.
+
+        Eviction is left to the caller so a whole document's pages can be
+        written before the cache directory is scanned once.
+
+        Args:
+            key: Cache key built from the page's content hash
+            text: Extracted page text
+        """
+        self._write(key, {'text': text})
+
+    def _write(self, key: str, entry: Dict[str, Any]) -> None:
+        """Atomically write a cache entry so concurrent runs never read half of one."""
+        entry_path = self._entry_path(key)
+        temp_path = f'{entry_path}.{os.getpid()}.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            json.dump(entry, file)
+        os.replace(temp_path, entry_path)
+        logger.debug(f"Stored cache entry {key} ({os.path.getsize(entry_path)} bytes)")
+
+    def evict(self) -> int:
+        """
+        Remove least recently used entries until the cache fits its size cap.
+
+        Returns:
+            Number of entries removed
+        """
+        entries = sorted(self._entries(), key=lambda entry: entry.stat().st_mtime)
+        total_bytes = sum(entry.stat().st_size for entry in entries)
+        removed = 0
+
+        for entry in entries:
+            if total_bytes <= self.max_bytes:
+                break
+            total_bytes -= entry.stat().st_size
+            self._remove(entry.path)
+            removed += 1
+
+        if removed:
+            logger.info(f"Evicted {removed} cache entries, cache size now {total_bytes} bytes")
+        return removed
+
+    def invalidate(self, pdf_path: str) -> int:
+        """
+        Remove every cache entry for a document, whatever settings produced it.
+
+        Per-page entries are keyed by page content rather than by file, so
+        the document's pages are hashed to find them as well. A page shared
+        with another document loses its entry too and is simply extracted
+        again next time.
+
+        Args:
+            pdf_path: Path to the PDF whose entries should be dropped
+
+        Returns:
+            Number of entries removed
+        """
+        prefixes = [f'{self.hash_file(pdf_path)}_']
+        try:
+            prefixes.extend(f'{page_hash}_' for page_hash in self.hash_pages(pdf_path))
+        except Exception as e:
+            logger.warning(f"Could not hash the pages of {pdf_path}, "
+                           f"removing document entries only: {e}")
+        prefixes = tuple(prefixes)
+
+        removed = 0
+        for entry in self._entries():
+            if entry.name.startswith(prefixes):
+                self._remove(entry.path)
+                removed += 1
+
+        logger.info(f"Invalidated {removed} cache entries for {pdf_path}")
+        return removed
+
+    def clear(self) -> int:
+        """
+        Remove every entry from the cache.
+
+        Returns:
+            Number of entries removed
+        """
+        entries = self._entries()
+        for entry in entries:
+            self._remove(entry.path)
+
+        logger.info(f"Cleared {len(entries)} cache entries from {self.cache_dir}")
+        return len(entries)
+
+    def _remove(self, path: str) -> None:
+        """Delete a cache file, ignoring files already removed by another run."""
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,162 @@
+"""
+Extraction Metrics Module for Compliance Assistant
+Collects per-page timing, throughput and pypdf warning counts.
+"""
+
+import csv
+import logging
+import os
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+from .logging_config import get_logger
+
+logger = get_logger('extraction_metrics')
+
+
+class WarningCounter(logging.Handler):
+    """Logging handler that counts warnings instead of emitting them."""
+
+    def __init__(self) -> None:
+        """Initialize the counter at zero."""
+        super().__init__(level=logging.WARNING)
+        self.count = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Count a warning or error record."""
+        self.count += 1
+
+
+@contextmanager
+def count_pypdf_warnings() -> Iterator[WarningCounter]:
+    """
+    Count the warnings pypdf logs while the block runs.
+
+    pypdf reports malformed content (broken fonts, bad streams) through its
+    'pypdf' logger, so the count is a cheap signal of a troublesome page.
+
+    Yields:
+        Counter whose count attribute holds the warnings seen so far
+    """
+    counter = WarningCounter()
+    pypdf_logger = logging.getLogger('pypdf')
+    pypdf_logger.addHandler(counter)
+    try:
+        yield counter
+    finally:
+        pypdf_logger.removeHandler(counter)
+
+
+class ExtractionMetrics:
+    """Per-page extraction measurements for one document."""
+
+    CSV_COLUMNS = ['document', 'page', 'source', 'seconds', 'characters',
+                   'chars_per_second', 'warnings']
+
+    def __init__(self, document: Optional[str] = None) -> None:
+        """
+        Initialize empty metrics.
+
+        Args:
+            document: Path of the document being measured
+        """
+        self.document = document
+        self.pages: List[Dict[str, Any]] = []
+
+    def add_page(self, page: int, seconds: float, characters: int,
+                 warnings: int = 0, source: str = 'extracted') -> None:
+        """
+        Record one page.
+
+        Args:
+            page: Page number (1-based)
+            seconds: Wall time spent extracting the page
+            characters: Characters of text extracted
+            warnings: pypdf warnings logged while extracting the page
+            source: 'extracted', 'cache' or the reason the page was skipped
+        """
+        self.pages.append({
+            'page': page,
+            'source': source,
+            'seconds': seconds,
+            'characters': characters,
+            'chars_per_second': characters / seconds if seconds > 0 else None,
+            'warnings': warnings
+        })
+
+    @property
+    def total_seconds(self) -> float:
+        """Extraction time summed over all pages."""
+        return sum(page['seconds'] for page in self.pages)
+
+    @property
+    def total_characters(self) -> int:
+        """Characters extracted over all pages."""
+        return sum(page['characters'] for page in self.pages)
+
+    @property
+    def total_warnings(self) -> int:
+        """pypdf warnings logged over all pages."""
+        return sum(page['warnings'] for page in self.pages)
+
+    def slowest_pages(self, count: int = 5) -> List[Dict[str, Any]]:
+        """
+        Find the pages that took longest to extract.
+
+        Args:
+            count: How many pages to return
+
+        Returns:
+            Page records, slowest first
+        """
+        return sorted(self.pages, key=lambda page: page['seconds'], reverse=True)[:count]
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Summarise the document's extraction.
+
+        Returns:
+            Dictionary of page counts, totals and the slowest page
+        """
+        extracted = [page for page in self.pages if page['source'] == 'extracted']
+        extracted_seconds = sum(page['seconds'] for page in extracted)
+        extracted_characters = sum(page['characters'] for page in extracted)
+        slowest = self.slowest_pages(1)
+        return {
+            'document': self.document,
+            'pages': len(self.pages),
+            'extracted_pages': len(extracted),
+            'cached_pages': sum(1 for page in self.pages if page['source'] == 'cache'),
+            'total_seconds': self.total_seconds,
+            'characters': self.total_characters,
+            'chars_per_second': (extracted_characters / extracted_seconds
+                                 if extracted_seconds > 0 else None),
+            'warnings': self.total_warnings,
+            'slowest_page': slowest[0]['page'] if slowest else None
+        }
+
+    def to_csv(self, csv_path: str, append: bool = False) -> str:
+        """
+        Write one row per page to a CSV file.
+
+        Args:
+            csv_path: Path of the CSV file
+            append: Add rows to an existing file instead of replacing it,
+                so metrics for many documents can be collected in one place
+
+        Returns:
+            Path to the CSV file
+        """
+        output_dir = os.path.dirname(csv_path)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        write_header = not append or not os.path.exists(csv_path) or os.path.getsize(csv_path) == 0
+
+        with open(csv_path, 'a' if append else 'w', newline='', encoding='utf-8') as file:
+            writer = csv.DictWriter(file, fieldnames=self.CSV_COLUMNS)
+            if write_header:
+                writer.writeheader()
+            for page in self.pages:
+                writer.writerow({'document': self.document, **page})
+
+        logger.info(f"Wrote metrics for {len(self.pages)} pages to {csv_path}")
+        return csv_path
@@ -0,0 +1,343 @@
+"""
+Keyword Matcher Module for Compliance Assistant
+Finds every lexicon keyword or phrase in a sentence in a single pass.
+"""
+
+import re
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+# Words as seen by the trie matcher; the same definition as regex \b boundaries
+WORD = re.compile(r'\w+')
+
+# Lexicons at least this large use the trie matcher when the backend is 'auto'
+TRIE_MIN_KEYWORDS = 150
+
+
+def build_alternation(keywords: Iterable[str]) -> str:
+    """
+    Build one regular expression matching any keyword as whole words.
+
+    Args:
+        keywords: Lowercase keywords or phrases
+
+    Returns:
+        Pattern source; longest keywords come first, so a phrase wins over a
+        keyword it starts with
+    """
+    alternatives = sorted(keywords, key=len, reverse=True)
+    return r'\b(?:' + '|'.join(re.escape(keyword) for keyword in alternatives) + r')\b'
+
+
+def _is_word_boundary(text: str, end: int) -> bool:
+    """
+    Check whether a regex word boundary falls before text[end].
+
+    Args:
+        text: Lowercase keyword or phrase
+        end: Position inside text, greater than zero
+
+    Returns:
+        True if exactly one of text[end - 1] and text[end] is a word character
+    """
+    return bool(WORD.match(text[end - 1])) != bool(WORD.match(text[end]))
+
+
+class KeywordMatcher:
+    """
+    Matches a fixed keyword lexicon against text in a single pass.
+
+    All keywords are compiled into one case-insensitive alternation with
+    word boundaries, so a sentence is scanned once however many keywords
+    there are, instead of once per keyword. Like TrieKeywordMatcher, every
+    occurrence is reported, including keywords nested in or overlapping
+    longer phrases ("must" within "must not"), so both backends find the
+    same keywords.
+    """
+
+    def __init__(self, keywords: Iterable[str]) -> None:
+        """
+        Compile the matcher for a lexicon.
+
+        Args:
+            keywords: Keywords or phrases to match (case-insensitive)
+
+        Raises:
+            ValueError: If the lexicon is empty
+        """
+        # Lexicon order is kept so results list keywords the way they were given
+        self.keywords: List[str] = list(dict.fromkeys(keyword.lower() for keyword in keywords))
+        if not self.keywords:
+            raise ValueError("Keyword lexicon is empty")
+        self._order = {keyword: position for position, keyword in enumerate(self.keywords)}
+
+        alternation = build_alternation(self.keywords)
+        # Matching lowercased text is faster than IGNORECASE; the case-insensitive
+        # pattern is only needed where offsets must refer to the original text
+        self._lower_pattern = re.compile(alternation)
+        self.pattern = re.compile(alternation, re.IGNORECASE)
+        # Single words can never overlap, so only lexicons with phrases pay for
+        # a lookahead, which matches the longest keyword at every word without
+        # consuming it so that keywords overlapping a match are still seen
+        if all(WORD.fullmatch(keyword) for keyword in self.keywords):
+            self._overlapping_lower = self._lower_pattern
+            self._overlapping = self.pattern
+        else:
+            self._overlapping_lower = re.compile(f'(?=({alternation}))')
+            self._overlapping = re.compile(f'(?=({alternation}))', re.IGNORECASE)
+
+        # Shorter keywords each keyword starts with, longest first; they occur
+        # wherever it does but lose to it at the same start. Plain string checks
+        # stand in for the word boundaries, as compiling a pattern per keyword
+        # pair takes seconds for lexicons of a few hundred phrases
+        self._prefixes: Dict[str, List[str]] = {}
+        by_length = sorted(self.keywords, key=len, reverse=True)
+        for keyword in self.keywords:
+            if not WORD.match(keyword):
+                continue
+            prefixes = [other for other in by_length
+                        if len(other) < len(keyword) and keyword.startswith(other)
+                        and _is_word_boundary(keyword, len(other))]
+            if prefixes:
+                self._prefixes[keyword] = prefixes
+
+    def search(self, text: str) -> bool:
+        """
+        Check whether any keyword occurs in text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            True as soon as one keyword is found
+        """
+        return self._lower_pattern.search(text.lower()) is not None
+
+    def find_matches(self, text: str) -> List[Tuple[str, int, int]]:
+        """
+        Find every keyword occurrence in text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            (keyword, start, end) for each occurrence, overlapping ones
+            included, ordered by start offset (longest first on ties)
+        """
+        matches = []
+        for match in self._overlapping.finditer(text):
+            keyword = match.group(match.lastindex or 0).lower()
+            start = match.start()
+            matches.append((keyword, start, match.end(match.lastindex or 0)))
+            for prefix in self._prefixes.get(keyword, ()):
+                matches.append((prefix, start, start + len(prefix)))
+        return matches
+
+    def find_keywords(self, text: str) -> List[str]:
+        """
+        Find which keywords occur in text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Distinct keywords found, in lexicon order (empty if none)
+        """
+        found = self._overlapping_lower.findall(text.lower())
+        if not found:
+            return []
+        found = set(found)
+        if self._prefixes:
+            for keyword in list(found):
+                found.update(self._prefixes.get(keyword, ()))
+        # Returning the lexicon's own strings lets callers keep them without copies
+        positions = sorted(self._order[keyword] for keyword in found)
+        return [self.keywords[position] for position in positions]
+
+
+class _TrieNode:
+    """One word position in the phrase trie."""
+
+    __slots__ = ('children', 'phrase')
+
+    def __init__(self) -> None:
+        # Keyed by the next word, prefixed with any punctuation expected before it
+        self.children: Dict[str, '_TrieNode'] = {}
+        self.phrase: Optional[str] = None
+
+
+class TrieKeywordMatcher:
+    """
+    Matches a large phrase lexicon with a word-level trie.
+
+    Each sentence is split into words once and every word advances the
+    partial phrase matches in progress, in the manner of Aho-Corasick, so
+    the cost per sentence depends on its length rather than the size of the
+    lexicon. Phrases only match on whole words, and every occurrence is
+    reported, including phrases nested in or overlapping longer ones.
+    """
+
+    def __init__(self, keywords: Iterable[str]) -> None:
+        """
+        Build the trie for a lexicon.
+
+        Whitespace between words of a phrase matches any whitespace; other
+        punctuation (as in "follow-up") must appear as written.
+
+        Args:
+            keywords: Keywords or phrases to match (case-insensitive)
+
+        Raises:
+            ValueError: If the lexicon is empty or a phrase contains no words
+        """
+        self.keywords: List[str] = list(dict.fromkeys(keyword.lower() for keyword in keywords))
+        if not self.keywords:
+            raise ValueError("Keyword lexicon is empty")
+        self._order = {keyword: position for position, keyword in enumerate(self.keywords)}
+
+        self._root = _TrieNode()
+        for keyword in self.keywords:
+            words = list(WORD.finditer(keyword))
+            if not words:
+                raise ValueError(f"Keyword '{keyword}' contains no words")
+            node = self._root
+            previous_end = None
+            for word in words:
+                key = word.group()
+                if previous_end is not None:
+                    key = keyword[previous_end:word.start()].strip() + key
+                node = node.children.setdefault(key, _TrieNode())
+                previous_end = word.end()
+            node.phrase = keyword
+        self._first_words = frozenset(self._root.children)
+
+    def _iter_matches(self, text: str) -> Iterator[Tuple[str, int, int]]:
+        """
+        Walk the trie over the words of text.
+
+        Args:
+            text: Text to scan
+
+        Yields:
+            (phrase, start, end) as each phrase completes, in order of end offset
+        """
+        lowered = text.lower()
+        # Lowercasing very rarely changes length; offsets must still fit text then
+        same_length = len(lowered) == len(text)
+        source = lowered if same_length else text
+        # Most sentences hold no word that starts a phrase; rule them out in C
+        if self._first_words.isdisjoint(WORD.findall(lowered)):
+            return
+        root_children = self._root.children
+
+        active: List[Tuple[_TrieNode, int]] = []
+        previous_end = 0
+        for word in WORD.finditer(source):
+            token = word.group() if same_length else word.group().lower()
+            start = word.start()
+            advanced = []
+            if active:
+                gap = source[previous_end:start].strip().lower()
+                for node, phrase_start in active:
+                    child = node.children.get(gap + token)
+                    if child is not None:
+                        advanced.append((child, phrase_start))
+                        if child.phrase is not None:
+                            yield child.phrase, phrase_start, word.end()
+
+            child = root_children.get(token)
+            if child is not None:
+                advanced.append((child, start))
+                if child.phrase is not None:
+                    yield child.phrase, start, word.end()
+
+            active = [(node, phrase_start) for node, phrase_start in advanced if node.children]
+            previous_end = word.end()
+
+    def search(self, text: str) -> bool:
+        """
+        Check whether any keyword occurs in text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            True as soon as one keyword is found
+        """
+        return next(self._iter_matches(text), None) is not None
+
+    def find_matches(self, text: str) -> List[Tuple[str, int, int]]:
+        """
+        Find every keyword occurrence in text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            (keyword, start, end) for each occurrence, overlapping ones
+            included, ordered by start offset (longest first on ties)
+        """
+        return sorted(self._iter_matches(text), key=lambda match: (match[1], -match[2]))
+
+    def find_keywords(self, text: str) -> List[str]:
+        """
+        Find which keywords occur in text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Distinct keywords found, in lexicon order (empty if none)
+        """
+        found = {phrase for phrase, _, _ in self._iter_matches(text)}
+        if len(found) < 2:
+            return list(found)
+        return sorted(found, key=self._order.__getitem__)
+
+
+# Matcher backends selectable by name
+MATCHER_BACKENDS = {
+    'regex': KeywordMatcher,
+    'trie': TrieKeywordMatcher,
+}
+
+
+def select_backend(keyword_count: int, backend: str = 'auto') -> str:
+    """
+    Resolve a matcher backend name.
+
+    Args:
+        keyword_count: Number of entries in the lexicon
+        backend: 'regex', 'trie', or 'auto' to use the trie for lexicons of
+            TRIE_MIN_KEYWORDS or more entries
+
+    Returns:
+        Name of a backend in MATCHER_BACKENDS
+
+    Raises:
+        ValueError: If the backend is unknown
+    """
+    if backend == 'auto':
+        return 'trie' if keyword_count >= TRIE_MIN_KEYWORDS else 'regex'
+    if backend not in MATCHER_BACKENDS:
+        raise ValueError(f"Unknown matcher backend '{backend}', "
+                         f"expected one of: auto, {', '.join(MATCHER_BACKENDS)}")
+    return backend
+
+
+def create_matcher(keywords: Iterable[str],
+                   backend: str = 'auto') -> Union[KeywordMatcher, TrieKeywordMatcher]:
+    """
+    Build a keyword matcher for a lexicon.
+
+    Args:
+        keywords: Keywords or phrases to match
+        backend: 'regex', 'trie', or 'auto' (see select_backend)
+
+    Returns:
+        Compiled matcher
+
+    Raises:
+        ValueError: If the backend is unknown or the lexicon is empty
+    """
+    keywords = list(keywords)
+    return MATCHER_BACKENDS[select_backend(len(keywords), backend)](keywords)
@@ -0,0 +1,297 @@
+"""
+Lexicon Module for Compliance Assistant
+Loads obligation phrases with categories and weights from JSON or YAML files,
+caching the decoded lexicon on disk keyed by the file's content hash.
+"""
+
+import hashlib
+import json
+import os
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from .logging_config import get_logger
+
+logger = get_logger('lexicon')
+
+# Lexicon file extensions; YAML additionally needs PyYAML installed
+JSON_EXTENSIONS = ('.json',)
+YAML_EXTENSIONS = ('.yaml', '.yml')
+
+DEFAULT_WEIGHT = 1.0
+
+
+class Lexicon:
+    """
+    Obligation phrases, each with an optional category and a weight.
+
+    A lexicon file is either a list of phrases or a mapping with a
+    'phrases' list; each phrase is a string or a mapping with 'phrase' and
+    optional 'category' and 'weight'. Top-level 'default_category' and
+    'default_weight' apply to phrases that do not set their own:
+
+        {"default_category": "obligation",
+         "phrases": ["must", {"phrase": "no later than", "category": "deadline",
+                              "weight": 0.5}]}
+    """
+
+    def __init__(self, entries: Iterable[Dict[str, Any]], source: Optional[str] = None,
+                 content_hash: Optional[str] = None) -> None:
+        """
+        Initialize a lexicon from its entries.
+
+        Args:
+            entries: Mappings with 'phrase' and optional 'category' and 'weight'
+            source: Path of the file the lexicon was loaded from
+            content_hash: SHA-256 of that file's bytes
+
+        Raises:
+            ValueError: If the lexicon is empty or an entry is invalid
+        """
+        self.source = source
+        self.content_hash = content_hash
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        for entry in entries:
+            phrase = entry.get('phrase')
+            if not isinstance(phrase, str) or not phrase.strip():
+                raise ValueError(f"Lexicon entry has no phrase: {entry!r}")
+            phrase = phrase.strip().lower()
+            if phrase in self._entries:
+                raise ValueError(f"Duplicate lexicon phrase: '{phrase}'")
+            weight = entry.get('weight', DEFAULT_WEIGHT)
+            if isinstance(weight, bool) or not isinstance(weight, (int, float)):
+                raise ValueError(f"Weight of '{phrase}' must be a number, got {weight!r}")
+            self._entries[phrase] = {'category': entry.get('category'), 'weight': float(weight)}
+        if not self._entries:
+            raise ValueError(f"Lexicon is empty{f': {source}' if source else ''}")
+
+    @classmethod
+    def from_keywords(cls, keywords: Iterable[str]) -> 'Lexicon':
+        """
+        Build an uncategorised lexicon from plain keywords.
+
+        Args:
+            keywords: Keywords or phrases, each given the default weight
+
+        Returns:
+            Lexicon without a source file
+        """
+        return cls({'phrase': keyword} for keyword in keywords)
+
+    def entries(self) -> List[Dict[str, Any]]:
+        """Return every phrase with its category and weight, in lexicon order."""
+        return [{'phrase': phrase, **entry} for phrase, entry in self._entries.items()]
+
+    @property
+    def keywords(self) -> List[str]:
+        """Phrases in lexicon order."""
+        return list(self._entries)
+
+    def category(self, phrase: str) -> Optional[str]:
+        """Return the category of a phrase, or None if it has none."""
+        return self._entries[phrase]['category']
+
+    def weight(self, phrase: str) -> float:
+        """Return the weight of a phrase."""
+        return self._entries[phrase]['weight']
+
+    def categories_for(self, phrases: Iterable[str]) -> List[str]:
+        """
+        Collect the categories of matched phrases.
+
+        Args:
+            phrases: Phrases found in a sentence
+
+        Returns:
+            Distinct categories in the order their phrases were given
+        """
+        categories = (self._entries[phrase]['category'] for phrase in phrases)
+        return list(dict.fromkeys(category for category in categories if category))
+
+    def weight_for(self, phrases: Iterable[str]) -> float:
+        """
+        Score a sentence by the strongest phrase it contains.
+
+        Args:
+            phrases: Phrases found in a sentence
+
+        Returns:
+            Highest weight among the phrases, or 0.0 if there are none
+        """
+        return max((self._entries[phrase]['weight'] for phrase in phrases), default=0.0)
+
+    def __len__(self) -> int:
+        """Return the number of phrases."""
+        return len(self._entries)
+
+
+def _parse_entries(data: Any, lexicon_path: str) -> List[Dict[str, Any]]:
+    """Turn a decoded lexicon file into entry mappings with defaults applied."""
+    defaults: Dict[str, Any] = {}
+    if isinstance(data, dict):
+        if 'default_category' in data:
+            defaults['category'] = data['default_category']
+        if 'default_weight' in data:
+            defaults['weight'] = data['default_weight']
+        data = data.get('phrases')
+    if not isinstance(data, list):
+        raise ValueError(f"Lexicon must be a list of phrases or have a 'phrases' list: {lexicon_path}")
+
+    entries = []
+    for item in data:
+        if isinstance(item, str):
+            item = {'phrase': item}
+        elif not isinstance(item, dict):
+            raise ValueError(f"Lexicon entry must be a phrase or a mapping, got {item!r}: {lexicon_path}")
+        entries.append({**defaults, **item})
+    return entries
+
+
+def _decode(content: bytes, extension: str, lexicon_path: str) -> Any:
+    """Decode the bytes of a JSON or YAML lexicon file."""
+    if extension in YAML_EXTENSIONS:
+        try:
+            import yaml
+        except ImportError as e:
+            raise ImportError("PyYAML is required for YAML lexicons (pip install pyyaml); "
+                              "JSON lexicons need no extra packages") from e
+        # The C loader is several times faster when PyYAML was built with libyaml
+        loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+        try:
+            return yaml.load(content, Loader=loader)
+        except yaml.YAMLError as e:
+            raise ValueError(f"Invalid YAML in lexicon {lexicon_path}: {e}") from e
+    try:
+        return json.loads(content)
+    except ValueError as e:
+        raise ValueError(f"Invalid JSON in lexicon {lexicon_path}: {e}") from e
+
+
+def load_lexicon(lexicon_path: str, cache: Optional['LexiconCache'] = None) -> Lexicon:
+    """
+    Load a lexicon from a JSON or YAML file.
+
+    Args:
+        lexicon_path: Path to a .json, .yaml or .yml file
+        cache: Cache of decoded lexicons; when the file's content hash is
+            cached, the file is not parsed again
+
+    Returns:
+        Lexicon with its source path and content hash
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        ImportError: If the file is YAML and PyYAML is not installed
+        ValueError: If the extension is unsupported or the content is invalid
+    """
+    extension = os.path.splitext(lexicon_path)[1].lower()
+    if extension not in JSON_EXTENSIONS + YAML_EXTENSIONS:
+        raise ValueError(f"Unsupported lexicon format '{extension}', "
+                         f"expected one of: {', '.join(JSON_EXTENSIONS + YAML_EXTENSIONS)}")
+
+    try:
+        with open(lexicon_path, 'rb') as file:
+            content = file.read()
+    except FileNotFoundError as e:
+        logger.error(f"Lexicon file not found: {lexicon_path}")
+        raise FileNotFoundError(f"Lexicon file not found: {lexicon_path}") from e
+    content_hash = hashlib.sha256(content).hexdigest()
+
+    entries = cache.get(content_hash) if cache is not None else None
+    cached = entries is not None
+    if not cached:
+        entries = _parse_entries(_decode(content, extension, lexicon_path), lexicon_path)
+
+    lexicon = Lexicon(entries, source=lexicon_path, content_hash=content_hash)
+    if cache is not None and not cached:
+        cache.put(content_hash, lexicon.entries())
+    logger.info(f"Loaded {len(lexicon)} phrases from lexicon {lexicon_path}"
+                f"{' (cached)' if cached else ''}")
+    return lexicon
+
+
+def file_stamp(path: str) -> Tuple[int, int]:
+    """
+    Cheaply fingerprint a file for change detection.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        Modification time in nanoseconds and size in bytes
+    """
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+class LexiconCache:
+    """
+    On-disk cache of decoded lexicons, keyed by lexicon file content hash.
+
+    Parsing a YAML lexicon of thousands of phrases takes a large fraction of
+    a second, while the cached entries are plain JSON that loads in a few
+    milliseconds, so only the first process to see a lexicon file parses it.
+    """
+
+    # Bump when the layout of cache entries changes
+    CACHE_FORMAT_VERSION: int = 1
+
+    DEFAULT_CACHE_DIR: str = '.cache/lexicon'
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR) -> None:
+        """
+        Initialize the lexicon cache.
+
+        Args:
+            cache_dir: Directory holding decoded lexicons (created if missing)
+        """
+        logger.info(f"Initializing lexicon cache at {cache_dir}")
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _entry_path(self, content_hash: str) -> str:
+        """Return the file path for a lexicon content hash."""
+        return os.path.join(self.cache_dir, f'{content_hash}_v{self.CACHE_FORMAT_VERSION}.json')
+
+    def get(self, content_hash: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Look up the decoded entries of a lexicon file.
+
+        Args:
+            content_hash: SHA-256 of the lexicon file's bytes
+
+        Returns:
+            Lexicon entries, or None on a miss
+        """
+        entry_path = self._entry_path(content_hash)
+        try:
+            with open(entry_path, 'r', encoding='utf-8') as file:
+                entries = json.load(file)
+        except FileNotFoundError:
+            logger.debug(f"Lexicon cache miss: {content_hash}")
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Discarding unreadable lexicon cache entry {entry_path}: {e}")
+            os.remove(entry_path)
+            return None
+        logger.debug(f"Lexicon cache hit: {content_hash}")
+        return entries
+
+    def put(self, content_hash: str, entries: List[Dict[str, Any]]) -> None:
+        """
+        Store the decoded entries of a lexicon file.
+
+        Args:
+            content_hash: SHA-256 of the lexicon file's bytes
+            entries: Validated lexicon entries
+        """
+        entry_path = self._entry_path(content_hash)
+        # Written to a temporary file first so concurrent readers never see a partial entry
+        temp_path = f'{entry_path}.{os.getpid()}.tmp'
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as file:
+                json.dump(entries, file)
+            os.replace(temp_path, entry_path)
+            logger.debug(f"Cached lexicon entries: {entry_path}")
+        except OSError as e:
+            logger.warning(f"Could not write lexicon cache entry {entry_path}: {e}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
@@ -3,13 +3,19 @@ Main Script for Compliance Assistant
 Combines PDF reading, obligation finding, and Excel export functionality.
 """
 
+import itertools
 import os
 import sys
-from typing import Dict, Any
+from typing import Dict, Any, Iterator, List, Optional, Sequence, Tuple
 
+from .document_readers import ReaderRegistry, default_registry
 from .pdf_reader import PDFReader
+from .obligation import Obligation
+from .page_index import Sentence
+from .sentence_spool import SentenceSpool
 from .obligation_finder import ObligationFinder
 from .excel_exporter import ExcelExporter
+from .extraction_metrics import ExtractionMetrics
 from .logging_config import get_logger
 
 logger = get_logger('main')
@@ -18,21 +24,48 @@ logger = get_logger('main')
 class ComplianceAssistant:
     """Main class that orchestrates the compliance obligation extraction process."""
 
-    def __init__(self) -> None:
-        """Initialize the compliance assistant with all required components."""
+    def __init__(self, pdf_reader: Optional[PDFReader] = None,
+                 readers: Optional[ReaderRegistry] = None,
+                 obligation_finder: Optional[ObligationFinder] = None) -> None:
+        """
+        Initialize the compliance assistant with all required components.
+
+        Args:
+            pdf_reader: Pre-configured PDF reader (defaults to a serial PDFReader)
+            readers: Readers for pre-extracted text formats, keyed by file
+                extension (defaults to .txt, .md and .html); other files are
+                read as PDFs
+            obligation_finder: Pre-configured obligation finder, for example
+                with a lexicon file (defaults to the built-in keywords)
+        """
         logger.info("Initializing Compliance Assistant")
-        self.pdf_reader = PDFReader()
-        self.obligation_finder = ObligationFinder()
+        self.pdf_reader = pdf_reader if pdf_reader is not None else PDFReader()
+        self.readers = readers if readers is not None else default_registry()
+        self.obligation_finder = (obligation_finder if obligation_finder is not None
+                                  else ObligationFinder())
         self.excel_exporter = ExcelExporter()
         logger.info("Compliance Assistant initialization complete")
 
-    def process_document(self, pdf_path: str, output_dir: str = 'output') -> Dict[str, Any]:
+    def process_document(self, pdf_path: str, output_dir: str = 'output',
+                         pages: Optional[Sequence[int]] = None,
+                         max_obligations: Optional[int] = None,
+                         metrics_csv: Optional[str] = None) -> Dict[str, Any]:
         """
-        Process a PDF document and extract compliance obligations.
+        Process a document and extract compliance obligations.
+
+        Documents with a registered text reader (such as .txt, .md or .html
+        exports) are read directly and skip PDF parsing; everything else is
+        read as a PDF. Both go through the same sentence splitter and finder.
+        Unless an extraction cache, memory limit or parallel matching needs
+        the whole sentence list, sentences stream from the reader into the
+        finder, so detection starts on page 1 while later pages are parsed.
 
         Args:
-            pdf_path: Path to the PDF document
+            pdf_path: Path to the PDF document or text export
             output_dir: Directory for output files
+            pages: Page numbers to process (1-based), or None for every page
+            max_obligations: Stop extracting once this many obligations are found
+            metrics_csv: CSV file to append per-page extraction metrics to
 
         Returns:
             Processing results and summary
@@ -41,25 +74,69 @@ class ComplianceAssistant:
 
         try:
             print(f"Processing document: {pdf_path}")
+            # Long-running callers pick up lexicon edits between documents
+            if self.obligation_finder.reload_lexicon_if_changed():
+                print(f"Reloaded lexicon: {self.obligation_finder.lexicon_path}")
 
             # Step 1: Extract text and split into sentences
-            print("Step 1: Extracting text from PDF...")
-            logger.info("Step 1: Starting PDF text extraction")
-            sentences = self.pdf_reader.process_pdf(pdf_path)
-            print(f"Extracted {len(sentences)} sentences")
-            logger.info(f"Step 1 complete: Extracted {len(sentences)} sentences")
+            text_reader = self.readers.get(pdf_path)
+            stream = self._streams_sentences(text_reader is not None)
+            if text_reader is not None:
+                print("Step 1: Reading text export...")
+                logger.info(f"Step 1: Reading {pdf_path} with {text_reader.__name__}")
+                if pages is not None:
+                    logger.warning("Page selection does not apply to text exports, reading all text")
+                sentences = self.pdf_reader.split_sentence_stream(text_reader(pdf_path),
+                                                                  separator='')
+                if not stream:
+                    sentences = list(sentences)
+            elif stream:
+                print("Step 1: Extracting text from PDF, finding obligations page by page...")
+                logger.info("Step 1: Starting streamed PDF text extraction")
+                sentences = self.pdf_reader.iter_sentences(pdf_path, pages)
+            else:
+                print("Step 1: Extracting text from PDF...")
+                logger.info("Step 1: Starting PDF text extraction")
+                sentences = self.pdf_reader.process_pdf(
+                    pdf_path, pages=pages, max_candidates=max_obligations,
+                    is_candidate=self.obligation_finder.is_obligation)
 
             # Step 2: Find compliance obligations
-            print("Step 2: Finding compliance obligations...")
-            logger.info("Step 2: Starting obligation detection")
-            obligations = self.obligation_finder.process_sentences(sentences)
+            if stream:
+                obligations, sentence_count = self._stream_obligations(sentences, max_obligations)
+                print(f"Extracted {sentence_count} sentences")
+                logger.info(f"Steps 1-2 streamed: {sentence_count} sentences")
+            else:
+                sentence_count = len(sentences)
+                print(f"Extracted {sentence_count} sentences")
+                logger.info(f"Step 1 complete: Extracted {sentence_count} sentences")
+                print("Step 2: Finding compliance obligations...")
+                logger.info("Step 2: Starting obligation detection")
+                try:
+                    obligations = self.obligation_finder.process_sentences(sentences)
+                finally:
+                    if isinstance(sentences, SentenceSpool):
+                        # Release the spool's temporary file once it has been read
+                        sentences.close()
+                if max_obligations is not None:
+                    obligations = obligations[:max_obligations]
+            if text_reader is not None:
+                skipped_pages = []
+                metrics = ExtractionMetrics(pdf_path)
+            else:
+                skipped_pages = list(self.pdf_reader.skipped_pages)
+                metrics = self.pdf_reader.metrics
+            source_document = os.path.basename(pdf_path)
+            for obligation in obligations:
+                # Callers' finders may still return plain dictionaries
+                if isinstance(obligation, Obligation):
+                    obligation.source_document = source_document
             print(f"Found {len(obligations)} compliance obligations")
             logger.info(f"Step 2 complete: Found {len(obligations)} obligations")
 
             # Step 3: Export to Excel
             print("Step 3: Exporting to Excel...")
             logger.info("Step 3: Starting Excel export")
-            source_document = os.path.basename(pdf_path)
             output_path = self.excel_exporter.generate_output_filename(source_document, output_dir)
             excel_path = self.excel_exporter.export_to_excel(obligations, source_document, output_path)
             print(f"Excel file created: {excel_path}")
@@ -69,13 +146,19 @@ class ComplianceAssistant:
             logger.info("Step 4: Generating summary report")
             summary = self.excel_exporter.create_summary_report(obligations, source_document)
             summary['excel_output_path'] = excel_path
-            summary['total_sentences'] = len(sentences)
+            summary['total_sentences'] = sentence_count
+            summary['skipped_pages'] = skipped_pages
+            summary['extraction'] = metrics.summary()
+            if metrics_csv:
+                metrics.to_csv(metrics_csv, append=True)
+                summary['metrics_csv'] = metrics_csv
 
             result = {
                 'success': True,
                 'summary': summary,
                 'obligations': obligations,
-                'excel_path': excel_path
+                'excel_path': excel_path,
+                'metrics': metrics
             }
 
             logger.info("Document processing completed successfully")
@@ -90,6 +173,57 @@ class ComplianceAssistant:
                 'error': error_msg
             }
 
+    def _streams_sentences(self, text_export: bool) -> bool:
+        """
+        Check whether sentences can flow straight from the reader to the finder.
+
+        The extraction cache stores whole documents, a memory limit spools
+        sentences to disk, and parallel matching splits a complete list into
+        chunks, so each of these still needs the full sentence list first.
+
+        Args:
+            text_export: Whether the document is read by a text export reader
+
+        Returns:
+            True if obligation detection can start while pages are still parsed
+        """
+        if self.obligation_finder.workers != 1:
+            return False
+        return text_export or (self.pdf_reader.cache is None
+                               and self.pdf_reader.memory_limit is None)
+
+    def _stream_obligations(self, sentences: Iterator[Sentence],
+                            max_obligations: Optional[int] = None) -> Tuple[List[Obligation], int]:
+        """
+        Find obligations while later pages are still being parsed.
+
+        Each sentence reaches the finder as soon as the splitter yields it.
+        With max_obligations set, the sentence stream is closed once that
+        many obligations pass the filters, so no further pages are parsed.
+
+        Args:
+            sentences: Sentence stream from the reader, consumed once
+            max_obligations: Stop once this many obligations are found
+
+        Returns:
+            Tuple of (obligations in document order, sentences read)
+        """
+        sentence_count = 0
+
+        def counted() -> Iterator[Sentence]:
+            nonlocal sentence_count
+            for sentence in sentences:
+                sentence_count += 1
+                yield sentence
+
+        try:
+            found = self.obligation_finder.iter_obligations(counted())
+            obligations = list(itertools.islice(found, max_obligations))
+        finally:
+            # Stop extraction (and any extraction workers) at once on an early stop
+            sentences.close()
+        return obligations, sentence_count
+
     def print_summary(self, result: Dict[str, Any]) -> None:
         """
         Print a formatted summary of the processing results.
@@ -114,6 +248,21 @@ class ComplianceAssistant:
         print(f"⚖️ Total Obligations: {summary['total_obligations']}")
         print(f"📁 Excel Output: {summary['excel_output_path']}")
 
+        if summary.get('skipped_pages'):
+            print(f"\n⚠️ Skipped Pages:")
+            for skipped in summary['skipped_pages']:
+                print(f"   • Page {skipped['page']}: {skipped['reason']}")
+
+        extraction = summary.get('extraction')
+        if extraction and extraction['pages']:
+            rate = extraction['chars_per_second']
+            rate_text = f", {rate:,.0f} chars/s" if rate else ""
+            print(f"\n⏱️ Extraction: {extraction['pages']} pages in "
+                  f"{extraction['total_seconds']:.2f}s{rate_text}, "
+                  f"{extraction['warnings']} pypdf warnings, slowest page {extraction['slowest_page']}")
+            if summary.get('metrics_csv'):
+                print(f"   • Per-page metrics: {summary['metrics_csv']}")
+
         if summary['keyword_distribution']:
             print(f"\n🔍 Keyword Distribution:")
             for keyword, count in summary['keyword_distribution'].items():
@@ -129,7 +278,8 @@ class ComplianceAssistant:
                 text = obligation['text']
                 if len(text) > 100:
                     text = text[:97] + "..."
-                print(f"   {i}. [{obligation['keywords']}] {text}")
+                page = f" (p. {obligation['page']})" if 'page' in obligation else ""
+                print(f"   {i}. [{obligation['keywords']}] {text}{page}")
 
             if len(result['obligations']) > 3:
                 print(f"   ... and {len(result['obligations']) - 3} more obligations")
@@ -0,0 +1,115 @@
+"""
+Obligation Module for Compliance Assistant
+Compact record type for a compliance obligation found in a document.
+"""
+
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+
+class Obligation(Mapping):
+    """
+    One obligation sentence and where it was found.
+
+    Attributes live in __slots__, so an obligation takes a fraction of the
+    memory of the dictionary it replaces. It is also a read-only mapping
+    with the keys those dictionaries had ('text', 'keywords', 'sentence_index',
+    and 'page', 'span', 'categories', 'weight' or 'source_document' when
+    set), so code written against the dictionaries keeps working. As
+    before, obligation['keywords'] is the comma-separated string; the
+    keywords attribute is the tuple.
+    """
+
+    __slots__ = ('text', 'keywords', 'sentence_index', 'page', 'span',
+                 'categories', 'weight', 'source_document')
+
+    def __init__(self, text: str, keywords: Tuple[str, ...],
+                 sentence_index: Optional[int] = None, page: Optional[int] = None,
+                 span: Optional[Tuple[int, int]] = None,
+                 categories: Optional[Tuple[str, ...]] = None,
+                 weight: Optional[float] = None,
+                 source_document: Optional[str] = None) -> None:
+        """
+        Initialize an obligation.
+
+        Args:
+            text: The obligation sentence, stripped
+            keywords: Keywords found in the sentence, in lexicon order
+            sentence_index: Position of the sentence in the processed input
+            page: Source page number (1-based), when known
+            span: Character span of the sentence in the document text
+            categories: Categories of the keywords, when found with a lexicon file
+            weight: Weight of the strongest keyword, when found with a lexicon file
+            source_document: Name of the document the sentence came from
+        """
+        self.text = text
+        self.keywords = keywords
+        self.sentence_index = sentence_index
+        self.page = page
+        self.span = span
+        self.categories = categories
+        self.weight = weight
+        self.source_document = source_document
+
+    @classmethod
+    def from_dict(cls, obligation: Dict[str, Any]) -> 'Obligation':
+        """
+        Build an obligation from the dictionary form.
+
+        Args:
+            obligation: Dictionary with at least 'text' and 'keywords'
+
+        Returns:
+            Equivalent obligation record
+        """
+        categories = obligation.get('categories')
+        return cls(
+            text=obligation['text'],
+            keywords=_split(obligation.get('keywords', '')),
+            sentence_index=obligation.get('sentence_index'),
+            page=obligation.get('page'),
+            span=obligation.get('span'),
+            categories=_split(categories) if categories is not None else None,
+            weight=obligation.get('weight'),
+            source_document=obligation.get('source_document')
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the dictionary form, with only the keys that are set."""
+        return dict(self.items())
+
+    def __getitem__(self, key: str) -> Any:
+        """Look up a field by its dictionary key; unset fields are missing keys."""
+        if key == 'keywords':
+            return ', '.join(self.keywords)
+        if key == 'categories' and self.categories is not None:
+            return ', '.join(self.categories)
+        if key not in self.__slots__:
+            raise KeyError(key)
+        value = getattr(self, key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the keys of the fields that are set."""
+        return (key for key in self.__slots__
+                if key == 'keywords' or getattr(self, key) is not None)
+
+    def __len__(self) -> int:
+        """Return the number of fields that are set."""
+        return sum(1 for _ in self)
+
+    def __reduce__(self) -> Tuple[Any, Tuple[Any, ...]]:
+        """Pickle as constructor arguments, compact for passing between processes."""
+        return (Obligation, tuple(getattr(self, key) for key in self.__slots__))
+
+    def __repr__(self) -> str:
+        """Show the fields that are set."""
+        fields = ', '.join(f'{key}={getattr(self, key)!r}' for key in self)
+        return f'Obligation({fields})'
+
+
+def _split(joined: str) -> Tuple[str, ...]:
+    """Split a comma-separated string into its non-empty parts."""
+    return tuple(part.strip() for part in joined.split(',') if part.strip())
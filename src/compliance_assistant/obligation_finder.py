@@ -4,11 +4,99 @@ Finds compliance obligations in text using keyword matching.
 """
 
 import re
-from typing import List, Dict
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from itertools import islice
+from typing import (TYPE_CHECKING, Any, Iterable, Iterator, List, Dict, Mapping, Optional,
+                    Sequence, Tuple, Union)
+from .keyword_matcher import build_alternation, create_matcher
+from .lexicon import Lexicon, LexiconCache, file_stamp, load_lexicon
 from .logging_config import get_logger
+from .obligation import Obligation
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 logger = get_logger('obligation_finder')
 
+# Runs of letters as counted by str.isalpha, in Python re and pyarrow (RE2) syntax
+LETTER_RUNS = r'[^\W\d_]+'
+ARROW_LETTER_RUNS = r'\pL+'
+
+# A keyword made of a single word, which can never nest inside another keyword
+WORD_ONLY = re.compile(r'\w+')
+
+# Finder used by a process pool worker, set once when the worker starts
+_worker_finder: Optional['ObligationFinder'] = None
+
+
+def _init_worker(finder: 'ObligationFinder') -> None:
+    """Keep the parent's finder in a worker so chunks don't carry the matcher."""
+    global _worker_finder
+    _worker_finder = finder
+
+
+def _process_chunk(start_index: int, sentences: List[str]) -> Tuple[List[Obligation], float]:
+    """
+    Extract and filter the obligations of one chunk in a worker process.
+
+    Args:
+        start_index: Index of the chunk's first sentence in the whole input
+        sentences: Sentences of the chunk
+
+    Returns:
+        Tuple of (filtered obligations in order, seconds spent on the chunk)
+    """
+    started = time.perf_counter()
+    obligations = list(_worker_finder.iter_obligations(sentences, start_index=start_index))
+    return obligations, time.perf_counter() - started
+
+
+def _letter_counts(text: 'pd.Series') -> 'pd.Series':
+    """
+    Count the letters in each string of a column, as str.isalpha would.
+
+    Arrow columns are counted with numpy straight from the UTF-8 buffer,
+    where every byte of an ASCII string is one character; only strings
+    with other characters, and columns without pyarrow, fall back to
+    removing letter runs with a regex and comparing lengths.
+
+    Args:
+        text: Column of strings without missing values
+
+    Returns:
+        Letter count per string, with the column's index
+    """
+    import pandas as pd
+
+    if getattr(text.dtype, 'storage', None) != 'pyarrow':
+        return text.str.len() - text.str.replace(LETTER_RUNS, '', regex=True).str.len()
+
+    import numpy as np
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    array = pa.array(text.array)
+    if isinstance(array, pa.ChunkedArray):
+        array = array.combine_chunks()
+    _, offsets_buffer, data_buffer = array.buffers()
+    offset_type = np.int64 if pa.types.is_large_string(array.type) else np.int32
+    offsets = np.frombuffer(offsets_buffer, dtype=offset_type)[array.offset:array.offset + len(array) + 1]
+    data = (np.frombuffer(data_buffer, dtype=np.uint8) if data_buffer is not None
+            else np.zeros(0, dtype=np.uint8))
+
+    # Setting bit 0x20 folds A-Z onto a-z; everything else lands outside a-z
+    is_letter = ((data | 0x20) - ord('a')).astype(np.uint8) < 26
+    cumulative = np.concatenate(([0], np.cumsum(is_letter, dtype=np.int64)))
+    counts = pd.Series(cumulative[offsets[1:]] - cumulative[offsets[:-1]], index=text.index)
+
+    non_ascii = ~pc.string_is_ascii(array).to_numpy(zero_copy_only=False)
+    if non_ascii.any():
+        others = text[non_ascii]
+        counts[non_ascii] = (others.str.len()
+                             - others.str.replace(ARROW_LETTER_RUNS, '', regex=True).str.len())
+    return counts
+
 
 class ObligationFinder:
     """Finds compliance obligations in text using keyword patterns."""
@@ -16,11 +104,102 @@ class ObligationFinder:
     # Keywords that typically indicate compliance obligations
     OBLIGATION_KEYWORDS: List[str] = ['must', 'shall', 'required', 'mandatory']
 
-    def __init__(self) -> None:
-        """Initialize the obligation finder."""
+    # All-caps text shorter than this is taken to be a heading
+    ALL_CAPS_MAX_LENGTH: int = 100
+    # Text with a smaller share of letters is mostly numbers or symbols
+    MIN_ALPHA_RATIO: float = 0.5
+
+    # Largest single-word lexicon whose batch keywords are found one column pass per keyword
+    BATCH_KEYWORD_PASSES: int = 32
+
+    # Fewest sentences worth starting a process pool for
+    DEFAULT_PARALLEL_THRESHOLD: int = 100_000
+
+    # Parallel chunk sizing: the first chunk's size, the bounds, and the time
+    # each chunk should take, long enough to amortise sending it to a worker
+    # and short enough to keep workers evenly loaded
+    INITIAL_CHUNK_SIZE: int = 5_000
+    MIN_CHUNK_SIZE: int = 1_000
+    MAX_CHUNK_SIZE: int = 250_000
+    TARGET_CHUNK_SECONDS: float = 0.25
+
+    def __init__(self, matcher_backend: str = 'auto', lexicon_path: Optional[str] = None,
+                 lexicon_cache: Optional[LexiconCache] = None, workers: int = 1,
+                 parallel_threshold: int = DEFAULT_PARALLEL_THRESHOLD) -> None:
+        """
+        Initialize the obligation finder.
+
+        Args:
+            matcher_backend: Keyword matcher to use: 'regex' (one compiled
+                alternation, fastest for small lexicons), 'trie' (word-level
+                Aho-Corasick style, for hundreds of phrases) or 'auto'
+            lexicon_path: JSON or YAML lexicon of phrases with categories and
+                weights to use instead of OBLIGATION_KEYWORDS
+            lexicon_cache: Cache of decoded lexicon files, so the file is
+                only parsed by the first process to see its current content
+            workers: Worker processes for process_sentences (1 = serial)
+            parallel_threshold: Minimum sentence count before the process pool is used
+
+        Raises:
+            ValueError: If the matcher backend is unknown or the lexicon is invalid
+            FileNotFoundError: If the lexicon file doesn't exist
+        """
         logger.info("Initializing obligation finder")
-        logger.debug(f"Using obligation keywords: {self.OBLIGATION_KEYWORDS}")
-        pass
+        self.matcher_backend = matcher_backend
+        self.lexicon_path = lexicon_path
+        self.lexicon_cache = lexicon_cache
+        self.workers = max(1, workers)
+        self.parallel_threshold = parallel_threshold
+        # Chunk sizes of the most recent parallel run, in submission order
+        self.chunk_sizes: List[int] = []
+        self._lexicon_stamp = None
+        if lexicon_path is None:
+            logger.debug(f"Using obligation keywords: {self.OBLIGATION_KEYWORDS}")
+            self._use_lexicon(Lexicon.from_keywords(self.OBLIGATION_KEYWORDS))
+        else:
+            self._lexicon_stamp = file_stamp(lexicon_path)
+            self._use_lexicon(load_lexicon(lexicon_path, lexicon_cache))
+
+    def _use_lexicon(self, lexicon: Lexicon) -> None:
+        """Compile the matcher for a lexicon and start using both."""
+        # Compiled once per lexicon; every sentence is then scanned in one pass
+        self.matcher = create_matcher(lexicon.keywords, self.matcher_backend)
+        self._batch_pattern = build_alternation(lexicon.keywords)
+        # One shared tuple per distinct keyword combination across all obligations
+        self._keyword_tuples: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+        self.lexicon = lexicon
+        logger.debug(f"Using {type(self.matcher).__name__} for {len(lexicon)} keywords")
+
+    def reload_lexicon_if_changed(self) -> bool:
+        """
+        Reload the lexicon file if it has changed since it was last loaded.
+
+        Only the file's modification time and size are checked unless they
+        changed, so this is cheap enough to call before every document in a
+        long-running process. A file that cannot be read or parsed (for
+        example while it is being saved) leaves the current lexicon in use
+        and is retried on the next call.
+
+        Returns:
+            True if a changed lexicon was loaded
+        """
+        if self.lexicon_path is None:
+            return False
+        try:
+            stamp = file_stamp(self.lexicon_path)
+            if stamp == self._lexicon_stamp:
+                return False
+            lexicon = load_lexicon(self.lexicon_path, self.lexicon_cache)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Keeping current lexicon, could not reload {self.lexicon_path}: {e}")
+            return False
+
+        self._lexicon_stamp = stamp
+        if lexicon.content_hash == self.lexicon.content_hash:
+            return False
+        self._use_lexicon(lexicon)
+        logger.info(f"Reloaded lexicon {self.lexicon_path}: {len(lexicon)} phrases")
+        return True
     
     def contains_obligation_keyword(self, sentence: str) -> bool:
         """
@@ -32,58 +211,129 @@ class ObligationFinder:
         Returns:
             True if sentence contains obligation keywords
         """
-        sentence_lower = sentence.lower()
+        # Word boundaries in the matcher avoid partial matches
+        return self.matcher.search(sentence)
+    
+    def is_obligation(self, sentence: str, min_length: int = 20) -> bool:
+        """
+        Check if a sentence would be kept as an obligation.
 
-        for keyword in self.OBLIGATION_KEYWORDS:
-            # Use word boundaries to avoid partial matches
-            pattern = r'\b' + re.escape(keyword) + r'\b'
-            if re.search(pattern, sentence_lower):
-                logger.debug(f"Found keyword '{keyword}' in sentence: {sentence[:50]}...")
-                return True
+        Applies the keyword match and the filters of filter_obligations, so
+        a budget counted with it (such as PDFReader's max_candidates) only
+        counts obligations that survive filtering.
 
-        return False
-    
-    def extract_obligations(self, sentences: List[str]) -> List[Dict[str, str]]:
+        Args:
+            sentence: The sentence to check
+            min_length: Minimum length for obligation text
+
+        Returns:
+            True if the sentence contains obligation keywords and passes the filters
+        """
+        return (self.matcher.search(sentence)
+                and self._filter_reason(sentence.strip(), min_length) is None)
+
+    def extract_obligations(self, sentences: List[str], start_index: int = 0) -> List[Obligation]:
         """
         Extract obligation sentences from a list of sentences.
 
         Args:
             sentences: List of sentences to analyze
+            start_index: Index of the first sentence, when the list is part
+                of a larger input
 
         Returns:
-            List of obligation dictionaries with text and keywords
+            Obligations with text, keywords and the sentence's index in the
+            input, plus page and span when the sentence came from a PDF, and
+            categories and weight when the finder uses a lexicon file
         """
         logger.info(f"Starting obligation extraction from {len(sentences)} sentences")
         obligations = []
 
-        for i, sentence in enumerate(sentences):
-            if self.contains_obligation_keyword(sentence):
-                # Find which keywords are present
-                found_keywords = []
-                sentence_lower = sentence.lower()
-
-                for keyword in self.OBLIGATION_KEYWORDS:
-                    pattern = r'\b' + re.escape(keyword) + r'\b'
-                    if re.search(pattern, sentence_lower):
-                        found_keywords.append(keyword)
-
-                obligation = {
-                    'text': sentence.strip(),
-                    'keywords': ', '.join(found_keywords)
-                }
-                obligations.append(obligation)
+        for sentence_index, sentence in enumerate(sentences, start_index):
+            # One scan both detects an obligation and finds which keywords are present
+            found_keywords = self.matcher.find_keywords(sentence)
+            if found_keywords:
+                obligations.append(self._make_obligation(sentence, sentence_index, found_keywords))
                 logger.debug(f"Found obligation {len(obligations)}: {sentence[:50]}...")
 
         logger.info(f"Extracted {len(obligations)} potential obligations")
         return obligations
+
+    def _make_obligation(self, sentence: str, sentence_index: int,
+                         found_keywords: List[str]) -> Obligation:
+        """Build the obligation record for a sentence containing keywords."""
+        keywords = tuple(found_keywords)
+        keywords = self._keyword_tuples.setdefault(keywords, keywords)
+        obligation = Obligation(sentence.strip(), keywords, sentence_index)
+        if self.lexicon_path is not None:
+            obligation.categories = tuple(self.lexicon.categories_for(found_keywords))
+            obligation.weight = self.lexicon.weight_for(found_keywords)
+        # Sentences from PDFReader carry their source page for citations
+        page = getattr(sentence, 'page', None)
+        if page is not None:
+            obligation.page = page
+            obligation.span = sentence.span
+        return obligation
+
+    def _filter_reason(self, text: str, min_length: int) -> Optional[str]:
+        """Return why obligation text should be filtered out, or None to keep it."""
+        # Filter by minimum length
+        if len(text) < min_length:
+            return 'too short'
+
+        # Filter out common false positives (headers, titles, etc.)
+        if text.isupper() and len(text) < self.ALL_CAPS_MAX_LENGTH:  # Skip all-caps short text
+            return 'all caps'
+
+        # Skip sentences that are mostly numbers or special characters
+        alpha_chars = sum(c.isalpha() for c in text)
+        if alpha_chars < len(text) * self.MIN_ALPHA_RATIO:  # Less than 50% alphabetic
+            return 'non-alphabetic'
+        return None
+
+    def iter_obligations(self, sentences: Iterable[str], min_length: int = 20,
+                         start_index: int = 0) -> Iterator[Obligation]:
+        """
+        Find and filter obligations lazily, one sentence at a time.
+
+        Equivalent to extract_obligations followed by filter_obligations, but
+        without either intermediate list, so it can sit between a sentence
+        stream and its consumer while holding only the current sentence.
+
+        Args:
+            sentences: Any iterable of sentences, consumed once
+            min_length: Minimum length for obligation text
+            start_index: Index of the first sentence, when the iterable is
+                part of a larger input
+
+        Yields:
+            Obligations that pass the filters, in input order
+        """
+        found_count = 0
+        kept_count = 0
+        for sentence_index, sentence in enumerate(sentences, start_index):
+            found_keywords = self.matcher.find_keywords(sentence)
+            if not found_keywords:
+                continue
+            found_count += 1
+
+            text = sentence.strip()
+            reason = self._filter_reason(text, min_length)
+            if reason is not None:
+                logger.debug(f"Filtered out obligation ({reason}): {text[:30]}...")
+                continue
+            kept_count += 1
+            yield self._make_obligation(sentence, sentence_index, found_keywords)
+
+        logger.info(f"Streamed {kept_count} obligations, {found_count - kept_count} filtered out")
     
-    def filter_obligations(self, obligations: List[Dict[str, str]],
-                          min_length: int = 20) -> List[Dict[str, str]]:
+    def filter_obligations(self, obligations: Sequence[Mapping[str, Any]],
+                          min_length: int = 20) -> List[Mapping[str, Any]]:
         """
         Filter obligations by minimum length and other criteria.
 
         Args:
-            obligations: List of obligation dictionaries
+            obligations: Obligations, as records or dictionaries
             min_length: Minimum length for obligation text
 
         Returns:
@@ -95,23 +345,9 @@ class ObligationFinder:
 
         for obligation in obligations:
             text = obligation['text']
-
-            # Filter by minimum length
-            if len(text) < min_length:
-                logger.debug(f"Filtered out obligation (too short): {text[:30]}...")
-                filtered_count += 1
-                continue
-
-            # Filter out common false positives (headers, titles, etc.)
-            if text.isupper() and len(text) < 100:  # Skip all-caps short text
-                logger.debug(f"Filtered out obligation (all caps): {text[:30]}...")
-                filtered_count += 1
-                continue
-
-            # Skip sentences that are mostly numbers or special characters
-            alpha_chars = sum(c.isalpha() for c in text)
-            if alpha_chars < len(text) * 0.5:  # Less than 50% alphabetic
-                logger.debug(f"Filtered out obligation (non-alphabetic): {text[:30]}...")
+            reason = self._filter_reason(text, min_length)
+            if reason is not None:
+                logger.debug(f"Filtered out obligation ({reason}): {text[:30]}...")
                 filtered_count += 1
                 continue
 
@@ -120,20 +356,187 @@ class ObligationFinder:
         logger.info(f"Filtering complete: {len(filtered)} obligations kept, {filtered_count} filtered out")
         return filtered
     
-    def process_sentences(self, sentences: List[str]) -> List[Dict[str, str]]:
+    def detect_obligations_batch(self, sentences: Union['pd.Series', Sequence[str]],
+                                 min_length: int = 20) -> 'pd.DataFrame':
+        """
+        Detect obligations across a whole column of sentences at once.
+
+        Keyword matching and the length, all-caps and alphabetic-ratio
+        filters of filter_obligations run as column operations rather than
+        per sentence. With pyarrow installed the column is converted to
+        Arrow strings and the operations run in native code, several times
+        faster than process_sentences; without it they still work but run
+        element by element. Arrow's regex engine treats only ASCII letters
+        as word characters at keyword boundaries.
+
+        Args:
+            sentences: Series or sequence of sentences; missing values are
+                never obligations
+            min_length: Minimum length for obligation text
+
+        Returns:
+            DataFrame with the input's index, a boolean 'is_obligation'
+            column agreeing with process_sentences, and a 'keywords' column
+            ('' for sentences that are not obligations)
+        """
+        import importlib.util
+
+        import numpy as np
+        import pandas as pd
+
+        series = sentences if isinstance(sentences, pd.Series) else pd.Series(list(sentences),
+                                                                              dtype=object)
+        logger.info(f"Starting batch obligation detection for {len(series)} sentences")
+        storage = 'python' if importlib.util.find_spec('pyarrow') is None else 'pyarrow'
+        text = series.astype(pd.StringDtype(storage))
+        # Positional index, so duplicate labels in the input cannot misalign results
+        text = text.str.strip().reset_index(drop=True)
+        lowered = text.str.lower()
+
+        # Keywords narrow the column first, so the filters only see candidates
+        has_keyword = lowered.str.contains(self._batch_pattern, regex=True)
+        candidates = text[has_keyword.fillna(False).astype(bool)]
+        lengths = candidates.str.len()
+        keep = ((lengths >= min_length)
+                & ~(candidates.str.isupper() & (lengths < self.ALL_CAPS_MAX_LENGTH))
+                & (_letter_counts(candidates) >= lengths * self.MIN_ALPHA_RATIO))
+        obligations = candidates[keep.fillna(False).astype(bool)]
+        positions = obligations.index.to_numpy()
+
+        is_obligation = np.zeros(len(series), dtype=bool)
+        is_obligation[positions] = True
+        keywords = np.full(len(series), '', dtype=object)
+        keywords[positions] = self._batch_keywords(obligations, lowered[positions])
+        result = pd.DataFrame({'is_obligation': is_obligation, 'keywords': keywords},
+                              index=series.index)
+
+        logger.info(f"Batch detection complete: {len(obligations)} obligations in {len(series)} sentences")
+        return result
+
+    def _batch_keywords(self, obligations: 'pd.Series', lowered: 'pd.Series') -> List[str]:
+        """
+        List the keywords of each obligation in a column.
+
+        Single-word lexicons of up to BATCH_KEYWORD_PASSES keywords take one
+        column pass per keyword and label each distinct combination once.
+        Phrases can nest or overlap, where only the matcher's own rules give
+        the same keywords as extract_obligations, so other lexicons are
+        matched sentence by sentence.
+
+        Args:
+            obligations: Obligation sentences
+            lowered: The same sentences lowercased
+
+        Returns:
+            Comma-separated keywords for each obligation, in lexicon order
+        """
+        import numpy as np
+
+        keywords = self.lexicon.keywords
+        if len(keywords) > self.BATCH_KEYWORD_PASSES or not all(WORD_ONLY.fullmatch(keyword)
+                                                                 for keyword in keywords):
+            return [', '.join(self.matcher.find_keywords(sentence))
+                    for sentence in obligations.tolist()]
+
+        codes = np.zeros(len(obligations), dtype=np.int64)
+        for bit, keyword in enumerate(keywords):
+            found = lowered.str.contains(build_alternation([keyword]), regex=True)
+            codes |= found.to_numpy(dtype=bool, na_value=False).astype(np.int64) << bit
+        unique_codes, inverse = np.unique(codes, return_inverse=True)
+        labels = np.array([', '.join(keyword for bit, keyword in enumerate(keywords) if code >> bit & 1)
+                           for code in unique_codes.tolist()], dtype=object)
+        return labels[inverse].tolist()
+
+    def _next_chunk_size(self, seconds_per_sentence: float) -> int:
+        """Size the next chunk to take about TARGET_CHUNK_SECONDS."""
+        if seconds_per_sentence <= 0:
+            return self.MAX_CHUNK_SIZE
+        size = int(self.TARGET_CHUNK_SECONDS / seconds_per_sentence)
+        return min(self.MAX_CHUNK_SIZE, max(self.MIN_CHUNK_SIZE, size))
+
+    def _process_parallel(self, sentences: Iterable[str]) -> List[Obligation]:
+        """
+        Extract and filter obligations in chunks across a process pool.
+
+        Chunks are cut from the input as workers free up, each sized from
+        the measured per-sentence time of the chunks finished so far, and
+        their results are reassembled in input order.
+
+        Args:
+            sentences: Sentences to process
+
+        Returns:
+            Filtered obligations in input order, with their sentence indices
+        """
+        sentence_iter = iter(sentences)
+        chunk_size = self.INITIAL_CHUNK_SIZE
+        seconds_per_sentence: Optional[float] = None
+        self.chunk_sizes = []
+        results: Dict[int, List[Obligation]] = {}
+        pending: Dict[Future, Tuple[int, int]] = {}
+        next_index = 0
+        exhausted = False
+
+        # The process pool is imported on first use so importing this module stays cheap
+        from concurrent.futures import ProcessPoolExecutor
+
+        logger.info(f"Processing sentences in parallel across {self.workers} workers")
+        executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                       initargs=(self,))
+        try:
+            while True:
+                # Two chunks per worker in flight, so none idles while a result comes back
+                while not exhausted and len(pending) < 2 * self.workers:
+                    chunk = list(islice(sentence_iter, chunk_size))
+                    if not chunk:
+                        exhausted = True
+                        break
+                    future = executor.submit(_process_chunk, next_index, chunk)
+                    pending[future] = (len(self.chunk_sizes), len(chunk))
+                    self.chunk_sizes.append(len(chunk))
+                    next_index += len(chunk)
+                if not pending:
+                    break
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    chunk_number, size = pending.pop(future)
+                    results[chunk_number], seconds = future.result()
+                    # Smoothed, so one slow chunk doesn't swing the size of the next
+                    cost = seconds / size
+                    seconds_per_sentence = (cost if seconds_per_sentence is None
+                                            else 0.7 * seconds_per_sentence + 0.3 * cost)
+                    chunk_size = self._next_chunk_size(seconds_per_sentence)
+                    logger.debug(f"Chunk {chunk_number} of {size} sentences took {seconds:.3f}s, "
+                                 f"next chunk size {chunk_size}")
+        finally:
+            # Don't keep matching chunks nobody will collect
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        logger.info(f"Processed {next_index} sentences in {len(self.chunk_sizes)} chunks")
+        return [obligation for chunk_number in range(len(results))
+                for obligation in results[chunk_number]]
+
+    def process_sentences(self, sentences: List[str]) -> List[Obligation]:
         """
         Complete obligation processing: extract and filter obligations.
 
+        With more than one worker and at least parallel_threshold sentences,
+        the work is split into chunks across a process pool; the result is
+        the same as serial processing.
+
         Args:
             sentences: List of sentences to process
 
         Returns:
-            List of filtered obligation dictionaries
+            Filtered obligations, in input order
         """
         logger.info(f"Starting complete obligation processing for {len(sentences)} sentences")
 
-        obligations = self.extract_obligations(sentences)
-        filtered_obligations = self.filter_obligations(obligations)
+        if self.workers > 1 and len(sentences) >= self.parallel_threshold:
+            filtered_obligations = self._process_parallel(sentences)
+        else:
+            filtered_obligations = list(self.iter_obligations(sentences))
 
         logger.info(f"Obligation processing complete: {len(filtered_obligations)} final obligations")
         return filtered_obligations
@@ -0,0 +1,146 @@
+"""
+Page Filters Module for Compliance Assistant
+Cleans extracted page text before it is split into sentences.
+"""
+
+import re
+from collections import Counter
+from typing import Iterable, List, Optional, Set, Tuple
+
+DIGITS = re.compile(r'\d+')
+WHITESPACE = re.compile(r'\s+')
+
+# Runs of dots (or ellipses) leading from an entry to its page number
+DOT_LEADER = re.compile(r'(?:\.\s?){4,}|\u2026{2,}')
+
+# A page number (or lowercase roman numeral) ending a line, as in listings
+TRAILING_PAGE_NUMBER = re.compile(r'(?:^|[\s.,])(?:\d{1,4}|[ivx]{1,5})\s*$')
+
+
+def _line_hash(line: str) -> Optional[int]:
+    """
+    Hash a line with case, spacing and numbers normalised away.
+
+    "Page 3 of 40" and "Page 4 of 40" hash the same, so running headers and
+    footers with page numbers are recognised as one repeated line.
+
+    Args:
+        line: A line of page text
+
+    Returns:
+        Hash of the normalised line, or None for blank lines
+    """
+    normalized = DIGITS.sub('#', WHITESPACE.sub(' ', line).strip().lower())
+    if not normalized:
+        return None
+    return hash(normalized)
+
+
+def _edge_line_numbers(lines: List[str], edge_lines: int) -> List[int]:
+    """
+    Find the first and last few non-blank lines of a page.
+
+    Args:
+        lines: Lines of page text
+        edge_lines: How many non-blank lines to take from each end
+
+    Returns:
+        Line numbers of the page's header and footer candidates
+    """
+    non_blank = [number for number, line in enumerate(lines) if line.strip()]
+    if len(non_blank) <= 2 * edge_lines:
+        return non_blank
+    return non_blank[:edge_lines] + non_blank[-edge_lines:]
+
+
+def find_repeated_lines(page_texts: Iterable[str], edge_lines: int = 2,
+                        min_fraction: float = 0.5, min_pages: int = 3) -> Set[int]:
+    """
+    Detect header and footer lines that recur across pages.
+
+    Only the first and last edge_lines non-blank lines of each page are
+    considered, so repeated wording in the body of a page is never removed.
+
+    Args:
+        page_texts: Text of the pages to sample
+        edge_lines: Lines checked at the top and bottom of each page
+        min_fraction: Fraction of sampled pages a line must appear on
+        min_pages: Fewest pages needed before anything counts as repeated
+
+    Returns:
+        Hashes of the repeated lines (see _line_hash)
+    """
+    page_count = 0
+    counts: Counter = Counter()
+    for page_text in page_texts:
+        page_count += 1
+        lines = page_text.split('\n')
+        hashes = {_line_hash(lines[number]) for number in _edge_line_numbers(lines, edge_lines)}
+        counts.update(hashes)
+
+    if page_count < min_pages:
+        return set()
+
+    threshold = max(2, min_fraction * page_count)
+    return {line_hash for line_hash, count in counts.items() if count >= threshold}
+
+
+def strip_repeated_lines(page_text: str, repeated: Set[int],
+                         edge_lines: int = 2) -> Tuple[str, int]:
+    """
+    Remove repeated header and footer lines from a page.
+
+    Args:
+        page_text: Text of one page
+        repeated: Hashes from find_repeated_lines
+        edge_lines: Lines checked at the top and bottom of the page
+
+    Returns:
+        Tuple of (cleaned page text, number of lines removed)
+    """
+    if not repeated:
+        return page_text, 0
+
+    lines = page_text.split('\n')
+    drop = {number for number in _edge_line_numbers(lines, edge_lines)
+            if _line_hash(lines[number]) in repeated}
+    if not drop:
+        return page_text, 0
+
+    kept = [line for number, line in enumerate(lines) if number not in drop]
+    return '\n'.join(kept), len(drop)
+
+
+def classify_listing_page(page_text: str, min_lines: int = 5,
+                          min_leader_fraction: float = 0.3,
+                          min_page_number_fraction: float = 0.6) -> Optional[str]:
+    """
+    Recognise table of contents and index pages.
+
+    Such pages are lists of entries ending in page numbers, often joined by
+    dot leaders. Wrapped body text rarely ends a line with a number, so the
+    share of lines that do separates listings from ordinary pages without
+    any sentence splitting.
+
+    Args:
+        page_text: Text of one page
+        min_lines: Fewest non-blank lines a listing page can have
+        min_leader_fraction: Share of lines with dot leaders marking a contents page
+        min_page_number_fraction: Share of lines ending in a page number marking
+            a listing page
+
+    Returns:
+        "table of contents" or "index" for listing pages, otherwise None
+    """
+    lines = [line for line in page_text.split('\n') if line.strip()]
+    if len(lines) < min_lines:
+        return None
+
+    leaders = sum(1 for line in lines if DOT_LEADER.search(line))
+    if leaders >= min_leader_fraction * len(lines):
+        return 'table of contents'
+
+    numbered = sum(1 for line in lines if TRAILING_PAGE_NUMBER.search(line))
+    if numbered >= min_page_number_fraction * len(lines):
+        return 'index'
+    return None
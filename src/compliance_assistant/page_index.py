@@ -0,0 +1,77 @@
+"""
+Page Index Module for Compliance Assistant
+Maps character offsets in extracted document text back to PDF page numbers.
+"""
+
+from array import array
+from bisect import bisect_right
+from typing import Optional, Tuple
+
+
+class Sentence(str):
+    """
+    A sentence string that remembers where it came from.
+
+    Behaves exactly like ``str`` so existing callers are unaffected, but also
+    carries the page number and the character span of the sentence within the
+    extracted document text (pages joined with newlines).
+    """
+
+    def __new__(cls, text: str, page: Optional[int] = None,
+                start: Optional[int] = None, end: Optional[int] = None) -> 'Sentence':
+        sentence = super().__new__(cls, text)
+        sentence.page = page
+        sentence.start = start
+        sentence.end = end
+        return sentence
+
+    @property
+    def span(self) -> Optional[Tuple[int, int]]:
+        """Character span (start, end) in the document text, if known."""
+        if self.start is None:
+            return None
+        return (self.start, self.end)
+
+
+class PageIndex:
+    """Sorted table of page start offsets into a document's text buffer."""
+
+    def __init__(self) -> None:
+        """Initialize an empty page index."""
+        # Signed 64-bit arrays: 8 bytes per page instead of a list of int objects
+        self.offsets = array('q')
+        self.page_numbers = array('q')
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def add_page(self, page_number: int, offset: int) -> None:
+        """
+        Record where a page starts in the document text.
+
+        Args:
+            page_number: PDF page number (starting at 1)
+            offset: Character offset of the page's first character
+
+        Raises:
+            ValueError: If pages are not added in offset order
+        """
+        if self.offsets and offset < self.offsets[-1]:
+            raise ValueError(f"Page {page_number} offset {offset} precedes previous page")
+        self.offsets.append(offset)
+        self.page_numbers.append(page_number)
+
+    def page_at(self, offset: int) -> Optional[int]:
+        """
+        Find the page containing a character offset using binary search.
+
+        Args:
+            offset: Character offset into the document text
+
+        Returns:
+            Page number, or None if the offset precedes the first page
+        """
+        position = bisect_right(self.offsets, offset) - 1
+        if position < 0:
+            return None
+        return self.page_numbers[position]
@@ -3,54 +3,689 @@ PDF Reader Module for Compliance Assistant
 Extracts text from PDF documents and splits into sentences.
 """
 
-import pypdf
-import re
-from typing import List
+import itertools
+import mmap
+import os
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import (TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional,
+                    Sequence, Tuple, Union)
+from . import __version__
+from .extraction_cache import ExtractionCache, page_content_hash
+from .extraction_metrics import ExtractionMetrics, count_pypdf_warnings
 from .logging_config import get_logger
+from .page_filters import classify_listing_page, find_repeated_lines, strip_repeated_lines
+from .page_index import PageIndex, Sentence
+from .sentence_segmenter import SentenceSegmenter
+from .sentence_spool import SentenceSpool
+
+if TYPE_CHECKING:
+    from multiprocessing.connection import Connection
+
+    import pypdf
 
 logger = get_logger('pdf_reader')
 
+# pypdf text extraction modes: 'plain' is the fast default, 'layout' keeps
+# the page's spatial arrangement (columns, indentation) at some extra cost
+EXTRACTION_MODES = ('plain', 'layout')
+
+
+@contextmanager
+def _open_pdf(pdf_path: str, use_mmap: bool = False) -> Iterator['pypdf.PdfReader']:
+    """
+    Open a PDF for reading, optionally through a read-only memory map.
+
+    A memory map lets every process reading the same file share the OS page
+    cache instead of holding private copies, and only the parts of the file
+    pypdf actually touches are faulted in.
+
+    Args:
+        pdf_path: Path to the PDF file
+        use_mmap: Read through a memory map instead of buffered file reads
+
+    Yields:
+        pypdf reader for the document
+    """
+    # pypdf is imported on first use so importing this module stays cheap
+    import pypdf
+
+    with open(pdf_path, 'rb') as file:
+        if not use_mmap:
+            yield pypdf.PdfReader(file)
+            return
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if hasattr(mapped, 'madvise'):
+                # pypdf seeks around the xref table, so readahead mostly wastes memory
+                mapped.madvise(mmap.MADV_RANDOM)
+            yield pypdf.PdfReader(mapped)
+
+
+def _extract_page(page: 'pypdf.PageObject',
+                  extraction_mode: str = 'plain') -> Tuple[str, float, int]:
+    """
+    Extract one page's text, timing it and counting pypdf warnings.
+
+    Args:
+        page: pypdf page object
+        extraction_mode: pypdf extraction mode, 'plain' or 'layout'
+
+    Returns:
+        Tuple of (page text, seconds taken, pypdf warnings logged)
+    """
+    with count_pypdf_warnings() as warnings:
+        started = time.perf_counter()
+        page_text = page.extract_text(extraction_mode=extraction_mode)
+        seconds = time.perf_counter() - started
+    return page_text, seconds, warnings.count
+
+
+def _extract_pages(pdf_path: str, page_indices: List[int], use_mmap: bool = False,
+                   extraction_mode: str = 'plain') -> List[Tuple[str, float, int]]:
+    """
+    Extract text for a batch of pages of a PDF.
+
+    Runs inside a worker process, so the file is opened independently
+    rather than sharing the parent's reader.
+
+    Args:
+        pdf_path: Path to the PDF file
+        page_indices: 0-based indices of the pages to extract, in order
+        use_mmap: Read the file through a shared memory map
+        extraction_mode: pypdf extraction mode, 'plain' or 'layout'
+
+    Returns:
+        (page text, seconds, warnings) from _extract_page, in the order of
+        page_indices
+    """
+    with _open_pdf(pdf_path, use_mmap) as pdf_reader:
+        return [_extract_page(pdf_reader.pages[page_num], extraction_mode)
+                for page_num in page_indices]
+
+
+# PDF held open by each parallel extraction worker: (context manager, reader, mode)
+_worker_pdf: Optional[Tuple[Any, 'pypdf.PdfReader', str]] = None
+
+
+def _init_extraction_worker(pdf_path: str, use_mmap: bool, extraction_mode: str) -> None:
+    """Open the PDF once per pool worker so page batches don't each reparse it."""
+    global _worker_pdf
+    document = _open_pdf(pdf_path, use_mmap)
+    # The context manager is kept alongside the reader so the file stays open
+    _worker_pdf = (document, document.__enter__(), extraction_mode)
+
+
+def _extract_worker_pages(page_indices: List[int]) -> List[Tuple[str, float, int]]:
+    """
+    Extract a batch of pages with the PDF this pool worker holds open.
+
+    Args:
+        page_indices: 0-based indices of the pages to extract, in order
+
+    Returns:
+        (page text, seconds, warnings) from _extract_page, in the order of
+        page_indices
+    """
+    _, pdf_reader, extraction_mode = _worker_pdf
+    return [_extract_page(pdf_reader.pages[page_num], extraction_mode)
+            for page_num in page_indices]
+
+
+def _isolated_page_worker(conn: 'Connection', pdf_path: str, use_mmap: bool,
+                          extraction_mode: str = 'plain') -> None:
+    """
+    Extract pages on request until told to stop.
+
+    Runs in its own process so a page that never finishes can be killed
+    without losing the rest of the document. Replies on conn with
+    ('ready', None) once the PDF is open, then ('page', (text, seconds,
+    warnings)) or ('error', message) per requested page index; None ends
+    the loop.
+
+    Args:
+        conn: Pipe end shared with the parent reader
+        pdf_path: Path to the PDF file
+        use_mmap: Read the file through a shared memory map
+        extraction_mode: pypdf extraction mode, 'plain' or 'layout'
+    """
+    try:
+        with _open_pdf(pdf_path, use_mmap) as pdf_reader:
+            conn.send(('ready', None))
+            while True:
+                page_num = conn.recv()
+                if page_num is None:
+                    return
+                try:
+                    conn.send(('page', _extract_page(pdf_reader.pages[page_num], extraction_mode)))
+                except Exception as e:
+                    conn.send(('error', str(e)))
+    except Exception as e:
+        conn.send(('fatal', str(e)))
+
+
+class _IsolatedPageWorker:
+    """Parent-side handle on an isolated page worker and its batch of pages."""
+
+    def __init__(self, pdf_path: str, use_mmap: bool, page_indices: List[int],
+                 extraction_mode: str = 'plain') -> None:
+        self.pdf_path = pdf_path
+        self.use_mmap = use_mmap
+        self.extraction_mode = extraction_mode
+        self.pending = deque(page_indices)
+        self.current: Optional[int] = None
+        self.deadline = 0.0
+        self._start()
+
+    def _start(self) -> None:
+        """Launch a fresh worker process; it reports 'ready' once the PDF is open."""
+        import multiprocessing
+
+        self.conn, child_conn = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(
+            target=_isolated_page_worker,
+            args=(child_conn, self.pdf_path, self.use_mmap, self.extraction_mode),
+            daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self.ready = False
+        self.current = None
+
+    @property
+    def active(self) -> bool:
+        """Whether the worker is starting up or extracting a page."""
+        return not self.ready or self.current is not None
+
+    def send_next(self, page_timeout: float) -> None:
+        """Hand the worker its next page, starting that page's time budget."""
+        self.current = self.pending.popleft() if self.pending else None
+        if self.current is not None:
+            self.conn.send(self.current)
+            self.deadline = time.monotonic() + page_timeout
+
+    def restart(self) -> None:
+        """Kill a stuck or crashed worker and start a replacement."""
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+        self._start()
+
+    def stop(self) -> None:
+        """Ask the worker to exit, killing it if it does not."""
+        try:
+            self.conn.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(timeout=1)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+
+def parse_page_ranges(spec: str) -> List[int]:
+    """
+    Parse a page selection such as "12-80,95" into page numbers.
+
+    Args:
+        spec: Comma-separated page numbers and inclusive ranges (1-based)
+
+    Returns:
+        Sorted, de-duplicated page numbers
+
+    Raises:
+        ValueError: If the selection is malformed or contains invalid pages
+    """
+    pages = set()
+    for part in spec.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        first, separator, last = part.partition('-')
+        try:
+            start = int(first)
+            stop = int(last) if separator else start
+        except ValueError:
+            raise ValueError(f"Invalid page range: '{part}'") from None
+        if start < 1 or stop < start:
+            raise ValueError(f"Invalid page range: '{part}'")
+        pages.update(range(start, stop + 1))
+
+    if not pages:
+        raise ValueError(f"No pages selected: '{spec}'")
+    return sorted(pages)
+
 
 class PDFReader:
     """Simple PDF reader that extracts text and splits into sentences."""
 
-    def __init__(self) -> None:
-        """Initialize the PDF reader."""
+    # Documents with fewer pages than this are extracted serially, since
+    # process pool startup would cost more than it saves
+    DEFAULT_PARALLEL_THRESHOLD: int = 50
+
+    # Pages per task handed to the process pool; small batches keep pages
+    # flowing in order and let an early stop cancel the work not yet started
+    PARALLEL_BATCH_PAGES: int = 4
+
+    # Header/footer detection: lines checked at each end of a page, share of
+    # pages a line must recur on, and pages sampled before stripping starts
+    # (fewer when process_pdf may stop early, so triage isn't held back)
+    HEADER_FOOTER_LINES: int = 2
+    HEADER_FOOTER_MIN_FRACTION: float = 0.5
+    HEADER_FOOTER_SAMPLE_PAGES: int = 50
+    HEADER_FOOTER_EARLY_STOP_SAMPLE_PAGES: int = 5
+
+    # Table of contents/index detection: fewest lines on a listing page, and
+    # shares of lines with dot leaders or a trailing page number
+    LISTING_MIN_LINES: int = 5
+    LISTING_MIN_LEADER_FRACTION: float = 0.3
+    LISTING_MIN_PAGE_NUMBER_FRACTION: float = 0.6
+
+    # Rough single-process extraction cost used by inspect() to rank documents
+    COST_PER_PAGE_SECONDS: float = 0.02
+    COST_PER_MB_SECONDS: float = 0.05
+
+    def __init__(self, workers: int = 1,
+                 parallel_threshold: int = DEFAULT_PARALLEL_THRESHOLD,
+                 cache: Optional[ExtractionCache] = None,
+                 use_mmap: bool = False,
+                 page_timeout: Optional[float] = None,
+                 strip_headers: bool = True,
+                 skip_listings: bool = True,
+                 memory_limit: Optional[int] = None,
+                 extraction_mode: str = 'plain') -> None:
+        """
+        Initialize the PDF reader.
+
+        Args:
+            workers: Number of worker processes for page extraction (1 = serial)
+            parallel_threshold: Minimum page count before the process pool is used
+            cache: Optional extraction cache consulted before parsing a PDF
+            use_mmap: Read PDFs through a memory map shared by worker processes
+            page_timeout: Seconds allowed per page; when set, pages are extracted
+                in isolated worker processes and slow pages are skipped
+            strip_headers: Remove header/footer lines repeated across pages
+            skip_listings: Leave table of contents and index pages out of the text
+            memory_limit: Characters of sentence text process_pdf may hold in
+                memory; beyond this its sentences spill to a temporary file
+            extraction_mode: pypdf extraction mode, 'plain' (fast) or 'layout'
+                (keeps columns and indentation)
+
+        Raises:
+            ValueError: If extraction_mode is not a known mode
+        """
         logger.info("Initializing PDF reader")
-        pass
-    
-    def extract_text_from_pdf(self, pdf_path: str) -> str:
+        if extraction_mode not in EXTRACTION_MODES:
+            raise ValueError(f"Unknown extraction mode '{extraction_mode}', "
+                             f"expected one of: {', '.join(EXTRACTION_MODES)}")
+        self.workers = max(1, workers)
+        self.parallel_threshold = parallel_threshold
+        self.cache = cache
+        self.use_mmap = use_mmap
+        self.page_timeout = page_timeout
+        self.strip_headers = strip_headers
+        self.skip_listings = skip_listings
+        self.memory_limit = memory_limit
+        self.extraction_mode = extraction_mode
+        self.segmenter = SentenceSegmenter()
+        # Page offsets of the most recently processed document
+        self.page_index = PageIndex()
+        # Pages of the most recently processed document left out of its text
+        self.skipped_pages: List[Dict[str, Any]] = []
+        # Per-page timings of the most recently processed document
+        self.metrics = ExtractionMetrics()
+        logger.debug(f"Extraction settings: workers={self.workers}, "
+                     f"parallel_threshold={self.parallel_threshold}, use_mmap={self.use_mmap}, "
+                     f"page_timeout={self.page_timeout}, strip_headers={self.strip_headers}, "
+                     f"skip_listings={self.skip_listings}, memory_limit={self.memory_limit}, "
+                     f"extraction_mode={self.extraction_mode}")
+
+    def cache_settings(self) -> Dict[str, Any]:
         """
-        Extract all text from a PDF file.
+        Describe everything besides the PDF bytes that affects extracted text.
+
+        Returns:
+            Settings dictionary folded into extraction cache keys
+        """
+        import pypdf
+
+        return {
+            'reader_version': __version__,
+            'pypdf_version': pypdf.__version__,
+            'strip_headers': self.strip_headers,
+            'skip_listings': self.skip_listings,
+            'extraction_mode': self.extraction_mode
+        }
+
+    def inspect(self, pdf_path: str) -> Dict[str, Any]:
+        """
+        Cheaply describe a PDF without extracting any text.
+
+        Only the trailer and the root of the page tree are read (the page
+        count comes from its /Count entry), so this is fast enough to run over
+        a whole batch before scheduling extraction work.
 
         Args:
             pdf_path: Path to the PDF file
 
         Returns:
-            Extracted text from the PDF
+            Dictionary with file size, page count, encryption status and an
+            estimated single-process extraction time in seconds. page_count is
+            None when an encrypted document cannot be opened without a password.
 
         Raises:
             FileNotFoundError: If PDF file doesn't exist
             Exception: If PDF cannot be read
         """
-        logger.info(f"Starting text extraction from PDF: {pdf_path}")
+        logger.info(f"Inspecting PDF: {pdf_path}")
 
         try:
-            with open(pdf_path, 'rb') as file:
-                pdf_reader = pypdf.PdfReader(file)
-                text = ""
+            file_size = os.path.getsize(pdf_path)
+            with _open_pdf(pdf_path, self.use_mmap) as pdf_reader:
+                encrypted = pdf_reader.is_encrypted
+                pdf_version = pdf_reader.pdf_header.replace('%PDF-', '')
+                try:
+                    page_count = int(pdf_reader.trailer['/Root']['/Pages']['/Count'])
+                except Exception as e:
+                    logger.warning(f"Could not read page count of {pdf_path}: {e}")
+                    page_count = None
+
+        except FileNotFoundError as e:
+            logger.error(f"PDF file not found: {pdf_path}")
+            raise FileNotFoundError(f"PDF file not found: {pdf_path}") from e
+        except Exception as e:
+            logger.error(f"Error reading PDF file {pdf_path}: {str(e)}")
+            raise Exception(f"Error reading PDF file: {str(e)}") from e
 
-                logger.debug(f"PDF has {len(pdf_reader.pages)} pages")
+        estimated_seconds = ((page_count or 0) * self.COST_PER_PAGE_SECONDS
+                             + file_size / (1024 * 1024) * self.COST_PER_MB_SECONDS)
+        info = {
+            'path': pdf_path,
+            'file_size': file_size,
+            'page_count': page_count,
+            'encrypted': encrypted,
+            'pdf_version': pdf_version,
+            'estimated_seconds': round(estimated_seconds, 3)
+        }
+        logger.debug(f"PDF inspection result: {info}")
+        return info
 
-                for page_num in range(len(pdf_reader.pages)):
-                    page = pdf_reader.pages[page_num]
-                    page_text = page.extract_text()
-                    text += page_text + "\n"
-                    logger.debug(f"Extracted {len(page_text)} characters from page {page_num + 1}")
+    def _page_ranges(self, page_count: int) -> List[Tuple[int, int]]:
+        """
+        Split the pages to extract into one contiguous range per worker.
 
-                extracted_text = text.strip()
-                logger.info(f"Successfully extracted {len(extracted_text)} characters from PDF")
-                return extracted_text
+        Args:
+            page_count: Number of pages to extract
+
+        Returns:
+            List of (start, stop) ranges covering every position in order
+        """
+        workers = min(self.workers, page_count)
+        chunk_size, remainder = divmod(page_count, workers)
+        ranges = []
+        start = 0
+        for worker in range(workers):
+            stop = start + chunk_size + (1 if worker < remainder else 0)
+            ranges.append((start, stop))
+            start = stop
+        return ranges
+
+    def _select_pages(self, page_count: int, pages: Optional[Sequence[int]]) -> List[int]:
+        """
+        Turn an optional page selection into 0-based page indices.
+
+        Args:
+            page_count: Number of pages in the document
+            pages: Page numbers to extract (1-based), or None for every page
+
+        Returns:
+            Sorted page indices that exist in the document
+        """
+        if pages is None:
+            return list(range(page_count))
+
+        page_indices = sorted({page - 1 for page in pages if 1 <= page <= page_count})
+        if len(page_indices) < len(set(pages)):
+            logger.warning(f"Ignoring selected pages beyond the document's {page_count} pages")
+        return page_indices
+
+    def _skip_page(self, page_num: int, reason: str, extracted: bool = False) -> None:
+        """
+        Record a page that was left out of the extracted text.
+
+        Args:
+            page_num: 0-based page index
+            reason: Why the page was skipped
+            extracted: Whether the page's text was extracted and then dropped,
+                rather than the page failing to extract
+        """
+        if extracted:
+            logger.info(f"Skipping page {page_num + 1}: {reason}")
+        else:
+            logger.warning(f"Skipping page {page_num + 1}: {reason}")
+        self.skipped_pages.append({'page': page_num + 1, 'reason': reason, 'extracted': extracted})
+
+    def _iter_isolated_pages(self, pdf_path: str,
+                             page_indices: List[int]) -> Iterator[Tuple[int, str]]:
+        """
+        Extract pages in killable worker processes with a per-page time budget.
+
+        Each worker owns a contiguous batch of pages. A page that runs past
+        page_timeout, raises, or crashes its worker is recorded in
+        skipped_pages; the worker is replaced and carries on with its batch.
+
+        Args:
+            pdf_path: Path to the PDF file
+            page_indices: 0-based indices of the pages to extract, in order
+
+        Yields:
+            Tuples of (page number starting at 1, page text) in page order
+        """
+        if not page_indices:
+            return
+        # Process plumbing is imported on first use so importing this module stays cheap
+        from multiprocessing.connection import wait
+
+        ranges = self._page_ranges(len(page_indices))
+        logger.info(f"Extracting {len(page_indices)} pages in {len(ranges)} isolated workers "
+                    f"with a {self.page_timeout}s page timeout")
+        workers = [_IsolatedPageWorker(pdf_path, self.use_mmap, page_indices[start:stop],
+                                       self.extraction_mode)
+                   for start, stop in ranges]
+        # Finished pages waiting for earlier pages; None marks a skipped page
+        results: Dict[int, Optional[Tuple[str, float, int]]] = {}
+        position = 0
+
+        try:
+            while position < len(page_indices):
+                while position < len(page_indices) and page_indices[position] in results:
+                    page_num = page_indices[position]
+                    result = results.pop(page_num)
+                    position += 1
+                    if result is not None:
+                        yield page_num + 1, self._record_page(page_num, *result)
+                if position == len(page_indices):
+                    break
+
+                active = [worker for worker in workers if worker.active]
+                deadlines = [worker.deadline for worker in active if worker.current is not None]
+                wait_time = max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+                ready = wait([worker.conn for worker in active], timeout=wait_time)
+
+                for worker in active:
+                    if worker.conn in ready:
+                        try:
+                            kind, value = worker.conn.recv()
+                        except EOFError:
+                            if worker.current is None:
+                                raise Exception("Page worker exited during startup")
+                            self._skip_page(worker.current, "worker process crashed")
+                            results[worker.current] = None
+                            worker.restart()
+                            continue
+
+                        if kind == 'fatal':
+                            raise Exception(value)
+                        if kind == 'ready':
+                            worker.ready = True
+                        elif kind == 'page':
+                            results[worker.current] = value
+                        else:
+                            self._skip_page(worker.current, f"extraction failed: {value}")
+                            results[worker.current] = None
+                        worker.send_next(self.page_timeout)
+
+                    elif worker.current is not None and time.monotonic() >= worker.deadline:
+                        self._skip_page(worker.current, f"timed out after {self.page_timeout}s")
+                        self.metrics.add_page(worker.current + 1, self.page_timeout, 0,
+                                              source='timed out')
+                        results[worker.current] = None
+                        worker.restart()
+        finally:
+            for worker in workers:
+                worker.stop()
+
+    def iter_pages(self, pdf_path: str, pages: Optional[Sequence[int]] = None,
+                   header_sample_pages: Optional[int] = None) -> Iterator[Tuple[int, str]]:
+        """
+        Yield the cleaned text of each page as soon as it has been parsed.
+
+        Running headers and footers are stripped when strip_headers is on,
+        and table of contents and index pages are dropped (and recorded in
+        skipped_pages) when skip_listings is on. Header detection holds back
+        the pages it samples, so the first page arrives only once
+        header_sample_pages pages are parsed; a smaller sample starts sooner
+        but may miss headers that only settle down later in the document.
+
+        Args:
+            pdf_path: Path to the PDF file
+            pages: Page numbers to extract (1-based), or None for every page
+            header_sample_pages: Pages sampled for header/footer detection
+                (default: HEADER_FOOTER_SAMPLE_PAGES)
+
+        Yields:
+            Tuples of (page number starting at 1, page text)
+
+        Raises:
+            FileNotFoundError: If PDF file doesn't exist
+            Exception: If PDF cannot be read
+        """
+        page_texts = self._iter_raw_pages(pdf_path, pages)
+        if self.strip_headers:
+            if header_sample_pages is None:
+                header_sample_pages = self.HEADER_FOOTER_SAMPLE_PAGES
+            page_texts = self._strip_headers_footers(page_texts, header_sample_pages)
+        if self.skip_listings:
+            page_texts = self._skip_listing_pages(page_texts)
+        yield from page_texts
+
+    def _skip_listing_pages(self, pages: Iterator[Tuple[int, str]]) -> Iterator[Tuple[int, str]]:
+        """
+        Drop table of contents and index pages before sentence splitting.
+
+        Args:
+            pages: Tuples of (page number, page text) in page order
+
+        Yields:
+            Tuples of (page number, page text) for every other page
+        """
+        for page_number, page_text in pages:
+            listing = classify_listing_page(page_text, self.LISTING_MIN_LINES,
+                                            self.LISTING_MIN_LEADER_FRACTION,
+                                            self.LISTING_MIN_PAGE_NUMBER_FRACTION)
+            if listing is not None:
+                self._skip_page(page_number - 1, f"{listing} page", extracted=True)
+                continue
+            yield page_number, page_text
+
+    def _strip_headers_footers(self, pages: Iterator[Tuple[int, str]],
+                               sample_pages: int) -> Iterator[Tuple[int, str]]:
+        """
+        Remove header and footer lines that repeat across pages.
+
+        Repeated lines are detected from the first sample_pages pages, which
+        are held back until detection is done; every page is then cleaned as
+        it streams through.
+
+        Args:
+            pages: Tuples of (page number, page text) in page order
+            sample_pages: Pages to sample before stripping starts
+
+        Yields:
+            Tuples of (page number, page text without repeated lines)
+        """
+        sample = list(itertools.islice(pages, sample_pages))
+        repeated = find_repeated_lines((page_text for _, page_text in sample),
+                                       self.HEADER_FOOTER_LINES,
+                                       self.HEADER_FOOTER_MIN_FRACTION)
+        if not repeated:
+            yield from sample
+            yield from pages
+            return
+
+        logger.info(f"Stripping {len(repeated)} repeated header/footer lines")
+        removed = 0
+        for page_number, page_text in itertools.chain(sample, pages):
+            page_text, page_removed = strip_repeated_lines(page_text, repeated,
+                                                           self.HEADER_FOOTER_LINES)
+            removed += page_removed
+            yield page_number, page_text
+        logger.debug(f"Removed {removed} header/footer lines")
+
+    def _iter_raw_pages(self, pdf_path: str,
+                        pages: Optional[Sequence[int]] = None) -> Iterator[Tuple[int, str]]:
+        """
+        Yield the text of each page exactly as pypdf extracts it.
+
+        With a cache configured, each page's content is hashed first and
+        pages whose hash was seen before are served from the cache, so only
+        new or modified pages of a revised document are extracted.
+
+        Pages are split across a process pool when parallel extraction is
+        enabled and the selection reaches the parallel threshold; otherwise
+        they are read serially in this process. With a page timeout set,
+        pages are always read in isolated worker processes and pages that
+        exceed it are recorded in skipped_pages instead of being yielded.
+        Either way pages are yielded in page order.
+
+        Args:
+            pdf_path: Path to the PDF file
+            pages: Page numbers to extract (1-based), or None for every page
+
+        Yields:
+            Tuples of (page number starting at 1, page text)
+
+        Raises:
+            FileNotFoundError: If PDF file doesn't exist
+            Exception: If PDF cannot be read
+        """
+        self.skipped_pages = []
+        self.metrics = ExtractionMetrics(pdf_path)
+        try:
+            with _open_pdf(pdf_path, self.use_mmap) as pdf_reader:
+                page_count = len(pdf_reader.pages)
+                page_indices = self._select_pages(page_count, pages)
+                logger.debug(f"PDF has {page_count} pages, extracting {len(page_indices)}")
+
+                page_keys: Dict[int, str] = {}
+                reused: Dict[int, str] = {}
+                if self.cache is not None:
+                    page_keys, reused = self._lookup_cached_pages(pdf_reader, page_indices)
+                to_extract = [page_num for page_num in page_indices if page_num not in reused]
+
+                if self.page_timeout is None and (
+                        self.workers == 1 or len(to_extract) < self.parallel_threshold):
+                    extracted = self._iter_serial_pages(pdf_reader, to_extract)
+                    yield from self._merge_pages(page_indices, reused, extracted, page_keys)
+                    return
+
+            if self.page_timeout is not None:
+                extracted = self._iter_isolated_pages(pdf_path, to_extract)
+            else:
+                extracted = self._iter_parallel_pages(pdf_path, to_extract)
+            yield from self._merge_pages(page_indices, reused, extracted, page_keys)
 
         except FileNotFoundError as e:
             logger.error(f"PDF file not found: {pdf_path}")
@@ -58,53 +693,398 @@ class PDFReader:
         except Exception as e:
             logger.error(f"Error reading PDF file {pdf_path}: {str(e)}")
             raise Exception(f"Error reading PDF file: {str(e)}") from e
+
+    def _iter_serial_pages(self, pdf_reader: 'pypdf.PdfReader',
+                           page_indices: List[int]) -> Iterator[Tuple[int, str]]:
+        """
+        Extract pages one after another in this process.
+
+        Args:
+            pdf_reader: Open pypdf reader for the document
+            page_indices: 0-based indices of the pages to extract, in order
+
+        Yields:
+            Tuples of (page number starting at 1, page text) in page order
+        """
+        for page_num in page_indices:
+            result = _extract_page(pdf_reader.pages[page_num], self.extraction_mode)
+            yield page_num + 1, self._record_page(page_num, *result)
+
+    def _record_page(self, page_num: int, page_text: str, seconds: float, warnings: int) -> str:
+        """
+        Add a freshly extracted page to the metrics.
+
+        Args:
+            page_num: 0-based page index
+            page_text: Extracted text
+            seconds: Time taken to extract the page
+            warnings: pypdf warnings logged while extracting it
+
+        Returns:
+            The page text, unchanged
+        """
+        logger.debug(f"Extracted {len(page_text)} characters from page {page_num + 1} "
+                     f"in {seconds:.3f}s with {warnings} warnings")
+        self.metrics.add_page(page_num + 1, seconds, len(page_text), warnings)
+        return page_text
+
+    def _iter_parallel_pages(self, pdf_path: str,
+                             page_indices: List[int]) -> Iterator[Tuple[int, str]]:
+        """
+        Extract pages across a process pool in small batches.
+
+        Each worker opens the PDF once, and two batches per worker are kept
+        in flight, so pages are yielded as soon as their batch is done and
+        closing the generator early leaves only the running batches to finish.
+
+        Args:
+            pdf_path: Path to the PDF file
+            page_indices: 0-based indices of the pages to extract, in order
+
+        Yields:
+            Tuples of (page number starting at 1, page text) in page order
+        """
+        if not page_indices:
+            return
+        # Process plumbing is imported on first use so importing this module stays cheap
+        from concurrent.futures import ProcessPoolExecutor
+
+        batch_pages = self.PARALLEL_BATCH_PAGES
+        batches = iter([page_indices[start:start + batch_pages]
+                        for start in range(0, len(page_indices), batch_pages)])
+        workers = min(self.workers, -(-len(page_indices) // batch_pages))
+        logger.info(f"Extracting {len(page_indices)} pages in parallel across {workers} workers")
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_extraction_worker,
+                                       initargs=(pdf_path, self.use_mmap, self.extraction_mode))
+        try:
+            pending = deque((batch, executor.submit(_extract_worker_pages, batch))
+                            for batch in itertools.islice(batches, 2 * workers))
+            while pending:
+                batch, future = pending.popleft()
+                results = future.result()
+                # Refill before yielding so workers stay busy while pages are consumed
+                for next_batch in itertools.islice(batches, 1):
+                    pending.append((next_batch, executor.submit(_extract_worker_pages, next_batch)))
+                for page_num, result in zip(batch, results):
+                    yield page_num + 1, self._record_page(page_num, *result)
+        finally:
+            # Queued batches are cancelled; only those already running are waited for
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def page_cache_settings(self) -> Dict[str, Any]:
+        """
+        Describe everything besides a page's content that affects its raw text.
+
+        Returns:
+            Settings dictionary folded into per-page cache keys
+        """
+        import pypdf
+
+        return {
+            'reader_version': __version__,
+            'pypdf_version': pypdf.__version__,
+            'extraction_mode': self.extraction_mode
+        }
+
+    def _lookup_cached_pages(self, pdf_reader: 'pypdf.PdfReader',
+                             page_indices: List[int]) -> Tuple[Dict[int, str], Dict[int, str]]:
+        """
+        Hash each page's content and find pages already extracted before.
+
+        Hashing decodes content streams but skips text layout, which is
+        where extraction spends its time, so unchanged pages of a revised
+        document are served from the cache.
+
+        Args:
+            pdf_reader: Open pypdf reader for the document
+            page_indices: 0-based indices of the pages to extract
+
+        Returns:
+            Tuple of (cache key per page index, cached text per reused page index)
+        """
+        settings = self.page_cache_settings()
+        page_keys = {}
+        reused = {}
+        for page_num in page_indices:
+            page_key = self.cache.make_key(page_content_hash(pdf_reader.pages[page_num]), settings)
+            page_keys[page_num] = page_key
+            page_text = self.cache.get_page(page_key)
+            if page_text is not None:
+                reused[page_num] = page_text
+
+        logger.info(f"Reusing cached text for {len(reused)} of {len(page_indices)} pages")
+        return page_keys, reused
+
+    def _merge_pages(self, page_indices: List[int], reused: Dict[int, str],
+                     extracted: Iterator[Tuple[int, str]],
+                     page_keys: Dict[int, str]) -> Iterator[Tuple[int, str]]:
+        """
+        Interleave cached and freshly extracted pages in page order.
+
+        Freshly extracted pages are written to the page cache. Pages the
+        extractor skipped simply never arrive and are left out.
+
+        Args:
+            page_indices: 0-based indices of every selected page, in order
+            reused: Cached text per page index
+            extracted: Freshly extracted (page number, text) in page order
+            page_keys: Page cache key per page index (empty without a cache)
+
+        Yields:
+            Tuples of (page number starting at 1, page text) in page order
+        """
+        pending = next(extracted, None)
+        for page_num in page_indices:
+            if page_num in reused:
+                self.metrics.add_page(page_num + 1, 0.0, len(reused[page_num]), source='cache')
+                yield page_num + 1, reused[page_num]
+            elif pending is not None and pending[0] == page_num + 1:
+                if page_num in page_keys:
+                    self.cache.put_page(page_keys[page_num], pending[1])
+                yield pending
+                pending = next(extracted, None)
+
+        if page_keys:
+            self.cache.evict()
+
+    def extract_page_texts(self, pdf_path: str,
+                           pages: Optional[Sequence[int]] = None) -> List[str]:
+        """
+        Extract the text of every page in a PDF file.
+
+        Args:
+            pdf_path: Path to the PDF file
+            pages: Page numbers to extract (1-based), or None for every page
+
+        Returns:
+            Page texts in page order
+
+        Raises:
+            FileNotFoundError: If PDF file doesn't exist
+            Exception: If PDF cannot be read
+        """
+        return [page_text for _, page_text in self.iter_pages(pdf_path, pages)]
+
+    def extract_text_from_pdf(self, pdf_path: str) -> str:
+        """
+        Extract all text from a PDF file.
+
+        Args:
+            pdf_path: Path to the PDF file
+
+        Returns:
+            Extracted text from the PDF
+
+        Raises:
+            FileNotFoundError: If PDF file doesn't exist
+            Exception: If PDF cannot be read
+        """
+        logger.info(f"Starting text extraction from PDF: {pdf_path}")
+
+        page_texts = self.extract_page_texts(pdf_path)
+        extracted_text = "\n".join(page_texts).strip()
+        logger.info(f"Successfully extracted {len(extracted_text)} characters from PDF")
+        return extracted_text
     
+    def _keep_sentences(self, items: Iterable[Tuple[str, int, int]],
+                        page_index: Optional[PageIndex] = None) -> Iterator[Sentence]:
+        """
+        Drop very short fragments and attach page numbers to sentences.
+
+        Args:
+            items: (sentence, start, end) tuples from the segmenter
+            page_index: Page index used to look up each sentence's page
+
+        Yields:
+            Sentences worth passing on to obligation detection
+        """
+        for sentence, start, end in items:
+            if len(sentence) > 10:  # Filter out very short fragments
+                page = page_index.page_at(start) if page_index is not None else None
+                yield Sentence(sentence, page, start, end)
+
     def split_into_sentences(self, text: str) -> List[str]:
         """
-        Split text into sentences using basic regex patterns.
+        Split text into sentences, keeping abbreviations such as "e.g." intact.
 
         Args:
             text: Input text to split
 
         Returns:
-            List of sentences
+            List of sentences, each carrying its character span within text
         """
         logger.debug(f"Starting sentence splitting for text of length {len(text)}")
 
-        # Clean up the text - remove extra whitespace and line breaks
-        cleaned_text = re.sub(r'\s+', ' ', text.strip())
-        logger.debug(f"Text cleaned, length: {len(cleaned_text)}")
+        cleaned_sentences = list(self._keep_sentences(self.segmenter.iter_sentences(text)))
+
+        logger.info(f"Split text into {len(cleaned_sentences)} valid sentences")
+        return cleaned_sentences
+
+    def split_sentence_stream(self, chunks: Iterable[str],
+                              separator: str = "\n") -> Iterator[Sentence]:
+        """
+        Split a stream of text chunks into sentences without joining them first.
+
+        Each sentence is yielded as soon as its boundary is seen and the
+        unfinished trailing piece is carried into the next chunk, so memory
+        is bounded by the longest sentence rather than the whole text.
+
+        Args:
+            chunks: Text chunks in order, such as page texts
+            separator: Text placed between consecutive chunks
+
+        Yields:
+            Sentences with spans into the chunks joined by separator
+        """
+        yield from self._keep_sentences(self.segmenter.stream(chunks, separator))
+
+    def iter_sentences(self, pdf_path: str, pages: Optional[Sequence[int]] = None,
+                       header_sample_pages: Optional[int] = None) -> Iterator[Sentence]:
+        """
+        Yield sentences page by page while later pages are still being parsed.
+
+        The trailing piece of each page is held back and joined to the next
+        page, so sentences that cross a page break come out whole and the
+        result matches splitting the fully extracted text. Each sentence
+        carries the page it starts on and its span in the extracted text.
+
+        Args:
+            pdf_path: Path to the PDF file
+            pages: Page numbers to extract (1-based), or None for every page
+            header_sample_pages: Pages sampled for header/footer detection
+                before the first page is released (see iter_pages)
+
+        Yields:
+            Sentences in document order
+        """
+        self.page_index = PageIndex()
+        page_texts = self.iter_pages(pdf_path, pages, header_sample_pages=header_sample_pages)
+        yield from self._sentences_from_pages(page_texts, self.page_index)
+
+    def _sentences_from_pages(self, pages: Iterable[Tuple[int, str]],
+                              page_index: PageIndex) -> Iterator[Sentence]:
+        """
+        Split a stream of page texts into sentences.
+
+        Offsets refer to the page texts joined with newlines, the same text
+        extract_text_from_pdf returns before stripping. Pages are registered in
+        page_index as the segmenter pulls them, before any of their sentences
+        are yielded.
+
+        Args:
+            pages: Tuples of (page number, page text) in page order
+            page_index: Empty page index, filled in as pages arrive
+
+        Yields:
+            Sentences in document order
+        """
+        def page_texts() -> Iterator[str]:
+            offset = 0
+            for page_number, page_text in pages:
+                if len(page_index):
+                    offset += 1
+                page_index.add_page(page_number, offset)
+                offset += len(page_text)
+                yield page_text
 
-        # Split into sentences using periods, exclamation marks, and question marks
-        # Look for sentence endings followed by whitespace and capital letters
-        sentence_pattern = r'(?<=[.!?])\s+(?=[A-Z])'
-        sentences = re.split(sentence_pattern, cleaned_text)
-        logger.debug(f"Initial split produced {len(sentences)} potential sentences")
+        items = self.segmenter.stream(page_texts(), "\n")
+        yield from self._keep_sentences(items, page_index)
 
-        # Clean up sentences - remove empty ones and strip whitespace
-        cleaned_sentences = []
+    def _stop_after_candidates(self, sentences: Iterator[Sentence], max_candidates: int,
+                               is_candidate: Optional[Callable[[str], bool]]) -> Iterator[Sentence]:
+        """
+        Pass sentences through until enough candidates have been seen.
+
+        Closing the sentence stream early means no further pages are parsed.
+
+        Args:
+            sentences: Sentences in document order
+            max_candidates: Stop once this many candidate sentences are found
+            is_candidate: Predicate marking candidate sentences (None: every sentence)
+
+        Yields:
+            Sentences up to and including the last candidate needed
+        """
+        candidates = 0
         for sentence in sentences:
-            sentence = sentence.strip()
-            if sentence and len(sentence) > 10:  # Filter out very short fragments
-                cleaned_sentences.append(sentence)
+            yield sentence
+            if is_candidate is None or is_candidate(sentence):
+                candidates += 1
+                if candidates >= max_candidates:
+                    logger.info(f"Found {candidates} candidates by page {sentence.page}, "
+                                f"stopping extraction early")
+                    return
 
-        logger.info(f"Split text into {len(cleaned_sentences)} valid sentences")
-        return cleaned_sentences
-    
-    def process_pdf(self, pdf_path: str) -> List[str]:
+    def process_pdf(self, pdf_path: str, pages: Optional[Sequence[int]] = None,
+                    max_candidates: Optional[int] = None,
+                    is_candidate: Optional[Callable[[str], bool]] = None
+                    ) -> Union[List[str], SentenceSpool]:
         """
-        Complete PDF processing: extract text and split into sentences.
+        Complete PDF processing: extract text page by page and split into sentences.
+
+        With max_candidates set, extraction stops as soon as that many
+        sentences satisfy is_candidate, so no further pages are parsed.
+        Headers and footers are then detected from only the first
+        HEADER_FOOTER_EARLY_STOP_SAMPLE_PAGES pages, so an early stop is not
+        held back by the full detection sample; headers that vary over the
+        first pages may be left in.
+
+        With memory_limit set, sentences are streamed into a SentenceSpool
+        that moves to a temporary file once it passes the limit, and neither
+        page texts nor the document cache are held in memory.
 
         Args:
             pdf_path: Path to the PDF file
+            pages: Page numbers to extract (1-based), or None for every page
+            max_candidates: Stop once this many candidate sentences are found
+            is_candidate: Predicate marking candidate sentences (default: every sentence)
 
         Returns:
-            List of sentences from the PDF
+            List of sentences from the PDF, each carrying its page and span,
+            or a SentenceSpool of them when memory_limit is set
         """
         logger.info(f"Starting complete PDF processing for: {pdf_path}")
+        self.skipped_pages = []
+        self.metrics = ExtractionMetrics(pdf_path)
+
+        if max_candidates is not None or self.memory_limit is not None:
+            # Partial results are never cached, and document cache entries
+            # would bring the whole document back into memory
+            header_sample_pages = (self.HEADER_FOOTER_EARLY_STOP_SAMPLE_PAGES
+                                   if max_candidates is not None else None)
+            sentences = self.iter_sentences(pdf_path, pages, header_sample_pages)
+            if max_candidates is not None:
+                sentences = self._stop_after_candidates(sentences, max_candidates, is_candidate)
+            if self.memory_limit is not None:
+                sentences = SentenceSpool(self.memory_limit, sentences)
+            else:
+                sentences = list(sentences)
+        elif self.cache is None:
+            sentences = list(self.iter_sentences(pdf_path, pages))
+        else:
+            settings = self.cache_settings()
+            settings['pages'] = list(pages) if pages is not None else None
+            cache_key = self.cache.make_key(self.cache.hash_file(pdf_path), settings)
+            cached = self.cache.get(cache_key)
+            self.page_index = PageIndex()
+            if cached is not None:
+                logger.info(f"Using cached extraction for {pdf_path}")
+                self.skipped_pages = cached['skipped']
+                offset = 0
+                for page_number, page_text in cached['pages']:
+                    self.page_index.add_page(page_number, offset)
+                    offset += len(page_text) + 1
+                return [Sentence(*sentence) for sentence in cached['sentences']]
 
-        text = self.extract_text_from_pdf(pdf_path)
-        sentences = self.split_into_sentences(text)
+            extracted_pages = list(self.iter_pages(pdf_path, pages))
+            sentences = list(self._sentences_from_pages(extracted_pages, self.page_index))
+            if any(not skipped['extracted'] for skipped in self.skipped_pages):
+                logger.info("Not caching extraction with pages that failed to extract")
+            else:
+                self.cache.put(cache_key, extracted_pages,
+                               [[sentence, sentence.page, sentence.start, sentence.end]
+                                for sentence in sentences],
+                               self.skipped_pages)
 
         logger.info(f"PDF processing complete. Extracted {len(sentences)} sentences")
         return sentences
@@ -0,0 +1,190 @@
+"""
+Sentence Segmenter Module for Compliance Assistant
+Finds sentence boundaries in one pass, without splitting after abbreviations.
+"""
+
+import re
+from typing import FrozenSet, Iterable, Iterator, List, Optional, Tuple
+from .logging_config import get_logger
+
+logger = get_logger('sentence_segmenter')
+
+# Sentence-ending punctuation followed by whitespace and a capital letter
+BOUNDARY_CANDIDATE = re.compile(r'[.!?]\s+(?=[A-Z])')
+
+# Dotted initialisms such as "U.S", "e.g" or "N.Z" (the final period is the candidate)
+INITIALISM = re.compile(r'(?:[A-Za-z]\.)+[A-Za-z]')
+
+# No abbreviation is longer than this, so the backwards word search is bounded
+MAX_ABBREVIATION_LENGTH = 16
+
+# Unfinished text held back by stream() is emitted as-is beyond this length,
+# so text without sentence boundaries (tables, code listings) cannot grow it
+MAX_FRAGMENT_LENGTH = 100_000
+
+
+class SentenceSegmenter:
+    """Splits text into sentences while keeping abbreviations like "Sec." intact."""
+
+    # Lowercased abbreviations without their final period. A boundary
+    # candidate is always followed by a capital letter, so only abbreviations
+    # that come before capitalised words matter here; references like
+    # "Sec. 4.2" never reach the check. Words that also end ordinary
+    # sentences ("no", "art", "Ltd", month names) are deliberately left out,
+    # since protecting them merges two sentences into one.
+    ABBREVIATIONS: FrozenSet[str] = frozenset({
+        # Latin and general
+        'e.g', 'i.e', 'cf', 'vs', 'viz', 'approx', 'incl', 'excl', 'ca',
+        # References within standards and legislation ("Sec. A", "Vol. II")
+        'sec', 'secs', 'para', 'paras', 'cl', 'ch', 'chap',
+        'pt', 'sch', 'reg', 'regs', 'fig', 'figs', 'tbl', 'vol',
+        'pp', 'ref', 'refs', 'rev', 'ver', 'std',
+        # Titles, always followed by a name
+        'mr', 'mrs', 'ms', 'dr', 'prof',
+    })
+
+    def __init__(self, abbreviations: Optional[Iterable[str]] = None) -> None:
+        """
+        Initialize the segmenter.
+
+        Args:
+            abbreviations: Extra abbreviations to protect, with or without the
+                final period (e.g. "Annex." or "annex")
+        """
+        self.abbreviations = self.ABBREVIATIONS
+        if abbreviations is not None:
+            extra = {abbreviation.lower().rstrip('.') for abbreviation in abbreviations}
+            self.abbreviations = self.abbreviations | frozenset(extra)
+
+    def _is_abbreviation(self, text: str, period: int) -> bool:
+        """
+        Check whether the period at text[period] ends an abbreviation.
+
+        Args:
+            text: Text being segmented
+            period: Index of the period
+
+        Returns:
+            True if the word before the period is a known abbreviation
+        """
+        window_start = max(0, period - MAX_ABBREVIATION_LENGTH)
+        word_start = max(text.rfind(' ', window_start, period),
+                         text.rfind('\n', window_start, period),
+                         window_start - 1) + 1
+        word = text[word_start:period].lstrip('("\'[')
+        return word.lower() in self.abbreviations or INITIALISM.fullmatch(word) is not None
+
+    def spans(self, text: str) -> List[Tuple[int, int]]:
+        """
+        Find the spans of the sentence pieces in text.
+
+        Boundaries are located with a single scan of the text; each candidate
+        ending in a period is checked against the abbreviation lexicon.
+
+        Args:
+            text: Input text to split
+
+        Returns:
+            (start, end) spans of every piece between boundaries, including
+            surrounding whitespace and very short fragments
+        """
+        pieces = []
+        start = 0
+        for candidate in BOUNDARY_CANDIDATE.finditer(text):
+            punctuation = candidate.start()
+            if text[punctuation] == '.' and self._is_abbreviation(text, punctuation):
+                continue
+            pieces.append((start, punctuation + 1))
+            start = candidate.end()
+        pieces.append((start, len(text)))
+        return pieces
+
+    def _normalise(self, text: str, pieces: Iterable[Tuple[int, int]],
+                   base_offset: int = 0) -> Iterator[Tuple[str, int, int]]:
+        """
+        Collapse whitespace in sentence pieces and trim their spans.
+
+        Args:
+            text: Text the piece spans refer to
+            pieces: (start, end) spans from spans()
+            base_offset: Offset of text within the whole stream
+
+        Yields:
+            Tuples of (sentence, start, end), skipping empty pieces
+        """
+        for start, end in pieces:
+            raw = text[start:end]
+            sentence = ' '.join(raw.split())
+            if sentence:
+                start += len(raw) - len(raw.lstrip())
+                end -= len(raw) - len(raw.rstrip())
+                yield sentence, base_offset + start, base_offset + end
+
+    def iter_sentences(self, text: str) -> Iterator[Tuple[str, int, int]]:
+        """
+        Yield whitespace-normalised sentences with their spans in text.
+
+        Args:
+            text: Input text to split
+
+        Yields:
+            Tuples of (sentence, start, end), skipping empty pieces; the span
+            excludes leading and trailing whitespace
+        """
+        return self._normalise(text, self.spans(text))
+
+    def stream(self, chunks: Iterable[str], separator: str = '',
+               max_fragment_length: int = MAX_FRAGMENT_LENGTH) -> Iterator[Tuple[str, int, int]]:
+        """
+        Yield sentences from a stream of text chunks as soon as they end.
+
+        The unfinished trailing piece of each chunk is carried into the next
+        one, so sentences spanning a chunk boundary come out whole and the
+        result matches iter_sentences on the joined text. Only that piece is
+        buffered, so memory is bounded by the longest sentence rather than
+        the whole stream.
+
+        Args:
+            chunks: Text chunks in order, such as the pages of a document
+            separator: Text placed between consecutive chunks
+            max_fragment_length: Carried text longer than this is emitted as
+                a sentence of its own instead of growing further
+
+        Yields:
+            Tuples of (sentence, start, end) with spans into the joined text
+        """
+        carry = ''
+        carry_offset = 0
+        first = True
+        for chunk in chunks:
+            if not first:
+                carry += separator
+            first = False
+            buffer = carry + chunk
+
+            pieces = self.spans(buffer)
+            carry_start, _ = pieces.pop()
+            yield from self._normalise(buffer, pieces, carry_offset)
+
+            carry = buffer[carry_start:]
+            carry_offset += carry_start
+            if len(carry) > max_fragment_length:
+                logger.warning(f"No sentence boundary in {len(carry)} characters at offset "
+                               f"{carry_offset}, emitting the fragment unsplit")
+                yield from self._normalise(carry, [(0, len(carry))], carry_offset)
+                carry_offset += len(carry)
+                carry = ''
+
+        yield from self._normalise(carry, [(0, len(carry))], carry_offset)
+
+    def split(self, text: str) -> List[str]:
+        """
+        Split text into whitespace-normalised sentences.
+
+        Args:
+            text: Input text to split
+
+        Returns:
+            List of non-empty sentences
+        """
+        return [sentence for sentence, _, _ in self.iter_sentences(text)]
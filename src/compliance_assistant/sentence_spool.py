@@ -0,0 +1,106 @@
+"""
+Sentence Spool Module for Compliance Assistant
+Holds a document's sentences in memory up to a ceiling, then in a temporary file.
+"""
+
+import json
+from typing import Iterable, Iterator, Optional
+from .logging_config import get_logger
+from .page_index import Sentence
+
+logger = get_logger('sentence_spool')
+
+
+class SentenceSpool:
+    """
+    Sequence of sentences that spills to disk once it outgrows a memory ceiling.
+
+    Sentences are written as JSON lines to a SpooledTemporaryFile, which
+    switches from an in-memory buffer to a real temporary file as soon as
+    the ceiling is passed. Iterating reads them back one at a time, so a
+    spilled document never has to fit in memory at once.
+    """
+
+    def __init__(self, max_memory: int, sentences: Optional[Iterable[Sentence]] = None) -> None:
+        """
+        Initialize the spool.
+
+        Args:
+            max_memory: Characters of sentence data kept in memory before spilling
+            sentences: Sentences to write straight away
+        """
+        # tempfile is imported on first use so importing this module stays cheap
+        import tempfile
+
+        self.max_memory = max_memory
+        self._file = tempfile.SpooledTemporaryFile(max_size=max_memory, mode='w+',
+                                                  encoding='utf-8')
+        self._count = 0
+        self._spilled = False
+        if sentences is not None:
+            self.extend(sentences)
+
+    @property
+    def spilled(self) -> bool:
+        """Whether the spool has moved from memory to a temporary file."""
+        return self._spilled
+
+    def append(self, sentence: Sentence) -> None:
+        """
+        Add a sentence to the end of the spool.
+
+        Args:
+            sentence: Sentence with its page and span
+        """
+        record = [str(sentence), getattr(sentence, 'page', None),
+                  getattr(sentence, 'start', None), getattr(sentence, 'end', None)]
+        self._file.seek(0, 2)
+        self._file.write(json.dumps(record))
+        self._file.write('\n')
+        self._count += 1
+
+        if not self._spilled and self._file.tell() > self.max_memory:
+            # SpooledTemporaryFile rolls over on its own; this is only for reporting
+            self._spilled = True
+            logger.info(f"Sentence spool passed {self.max_memory} characters after "
+                        f"{self._count} sentences, spilling to a temporary file")
+
+    def extend(self, sentences: Iterable[Sentence]) -> None:
+        """
+        Add sentences to the end of the spool.
+
+        Args:
+            sentences: Sentences with their pages and spans
+        """
+        for sentence in sentences:
+            self.append(sentence)
+
+    def __iter__(self) -> Iterator[Sentence]:
+        """
+        Read the sentences back in order.
+
+        Each pass rereads the spool from the start. Appending while a pass is
+        in progress is not supported.
+
+        Yields:
+            Sentences with their pages and spans
+        """
+        self._file.seek(0)
+        for line in self._file:
+            yield Sentence(*json.loads(line))
+
+    def __len__(self) -> int:
+        """Return the number of sentences in the spool."""
+        return self._count
+
+    def close(self) -> None:
+        """Release the spool's memory buffer or temporary file."""
+        self._file.close()
+
+    def __enter__(self) -> 'SentenceSpool':
+        """Use the spool as a context manager that closes it on exit."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the spool."""
+        self.close()
@@ -3,22 +3,58 @@ Unit Tests for Compliance Assistant
 Tests the functionality of PDF reading, obligation finding, and Excel export.
 """
 
+import csv
+import importlib.util
+import itertools
+import json
+import logging
 import unittest
 import os
 import tempfile
 import shutil
+import subprocess
+import time
+import multiprocessing
+import pickle
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
+import pypdf
 from unittest.mock import patch, MagicMock
 
 import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from compliance_assistant.pdf_reader import PDFReader
+from compliance_assistant.pdf_reader import PDFReader, parse_page_ranges
+from compliance_assistant.extraction_cache import ExtractionCache
+from compliance_assistant.extraction_metrics import ExtractionMetrics
+from compliance_assistant.page_index import PageIndex, Sentence
+from compliance_assistant.document_readers import ReaderRegistry, default_registry
+from compliance_assistant.page_filters import (classify_listing_page, find_repeated_lines,
+                                               strip_repeated_lines)
+from compliance_assistant.sentence_segmenter import SentenceSegmenter
+from compliance_assistant.sentence_spool import SentenceSpool
+from compliance_assistant.lexicon import LexiconCache, load_lexicon
+from compliance_assistant.obligation import Obligation
 from compliance_assistant.obligation_finder import ObligationFinder
+from compliance_assistant.keyword_matcher import (KeywordMatcher, TrieKeywordMatcher,
+                                                  create_matcher)
 from compliance_assistant.excel_exporter import ExcelExporter
 from compliance_assistant.main import ComplianceAssistant
 
+SAMPLE_PDF = "data/documents/sample_IT_compliance_document.pdf"
+
+
+def write_multipage_pdf(output_path, page_count):
+    """Write a PDF that repeats the sample document's first page."""
+    source = pypdf.PdfReader(SAMPLE_PDF)
+    writer = pypdf.PdfWriter()
+    for _ in range(page_count):
+        writer.add_page(source.pages[0])
+    with open(output_path, 'wb') as file:
+        writer.write(file)
+    return output_path
+
 
 class TestPDFReader(unittest.TestCase):
     """Test cases for PDFReader class."""
@@ -45,6 +81,850 @@ class TestPDFReader(unittest.TestCase):
         self.assertEqual(len(sentences), 1)
         self.assertIn("longer sentence", sentences[0])
 
+    def test_parallel_extraction_matches_serial(self):
+        """Test that parallel page extraction reassembles pages in order."""
+        if not os.path.exists(SAMPLE_PDF):
+            self.skipTest("Sample PDF not found")
+
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        pdf_path = write_multipage_pdf(os.path.join(temp_dir, 'multi.pdf'), 5)
+
+        serial_pages = self.pdf_reader.extract_page_texts(pdf_path)
+        parallel_reader = PDFReader(workers=2, parallel_threshold=1)
+        parallel_pages = parallel_reader.extract_page_texts(pdf_path)
+
+        self.assertEqual(len(parallel_pages), 5)
+        self.assertEqual(parallel_pages, serial_pages)
+
+    def test_parallel_extraction_stops_submitting_when_closed(self):
+        """Test that closing the page stream early leaves later batches unsubmitted."""
+        if not os.path.exists(SAMPLE_PDF):
+            self.skipTest("Sample PDF not found")
+
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        pdf_path = write_multipage_pdf(os.path.join(temp_dir, 'multi.pdf'), 40)
+        reader = PDFReader(workers=2, parallel_threshold=1, strip_headers=False)
+        submitted = []
+        original_submit = ProcessPoolExecutor.submit
+
+        def counting_submit(executor, fn, *args):
+            submitted.append(args[0])
+            return original_submit(executor, fn, *args)
+
+        with patch.object(ProcessPoolExecutor, 'submit', counting_submit):
+            pages = reader.iter_pages(pdf_path)
+            first_page, _ = next(pages)
+            pages.close()
+
+        self.assertEqual(first_page, 1)
+        # Two batches per worker up front, plus the refill after the first batch
+        self.assertEqual(len(submitted), 2 * 2 + 1)
+        self.assertEqual(submitted[0], list(range(PDFReader.PARALLEL_BATCH_PAGES)))
+
+    def test_mmap_extraction_matches_buffered(self):
+        """Test that memory-mapped input extracts the same text in both modes."""
+        if not os.path.exists(SAMPLE_PDF):
+            self.skipTest("Sample PDF not found")
+
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        pdf_path = write_multipage_pdf(os.path.join(temp_dir, 'multi.pdf'), 4)
+
+        buffered_pages = self.pdf_reader.extract_page_texts(pdf_path)
+        serial_mmap = PDFReader(use_mmap=True).extract_page_texts(pdf_path)
+        parallel_mmap = PDFReader(workers=2, parallel_threshold=1,
+                                  use_mmap=True).extract_page_texts(pdf_path)
+
+        self.assertEqual(serial_mmap, buffered_pages)
+        self.assertEqual(parallel_mmap, buffered_pages)
+
+    def test_page_timeout_skips_slow_pages(self):
+        """Test that a page exceeding the time budget is skipped and reported."""
+        if not os.path.exists(SAMPLE_PDF):
+            self.skipTest("Sample PDF not found")
+        if multiprocessing.get_start_method() != 'fork':
+            self.skipTest("Patched extraction only reaches forked workers")
+
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        pdf_path = write_multipage_pdf(os.path.join(temp_dir, 'multi.pdf'), 3)
+        original_extract_text = pypdf.PageObject.extract_text
+
+        def slow_second_page(page, *args, **kwargs):
+            if page.page_number == 1:
+                time.sleep(30)
+            return original_extract_text(page, *args, **kwargs)
+
+        reader = PDFReader(page_timeout=1)
+        with patch.object(pypdf.PageObject, 'extract_text', slow_second_page):
+            started = time.monotonic()
+            page_numbers = [page for page, _ in reader.iter_pages(pdf_path)]
+
+        self.assertLess(time.monotonic() - started, 20)
+        self.assertEqual(page_numbers, [1, 3])
+        self.assertEqual(len(reader.skipped_pages), 1)
+        self.assertEqual(reader.skipped_pages[0]['page'], 2)
+        self.assertIn("timed out", reader.skipped_pages[0]['reason'])
+
+    def test_page_timeout_isolation_matches_serial(self):
+        """Test that isolated workers return the same pages when nothing times out."""
+        if not os.path.exists(SAMPLE_PDF):
+            self.skipTest("Sample PDF not found")
+
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        pdf_path = write_multipage_pdf(os.path.join(temp_dir, 'multi.pdf'), 5)
+
+        reader = PDFReader(workers=2, page_timeout=30)
+
+        self.assertEqual(reader.extract_page_texts(pdf_path),
+                         self.pdf_reader.extract_page_texts(pdf_path))
+        self.assertEqual(reader.skipped_pages, [])
+
+    def test_iter_sentences_joins_sentences_across_pages(self):
+        """Test that a sentence split by a page break is yielded whole."""
+        pages = [
+            (1, "The first sentence is complete. The second sentence runs"),
+            (2, "onto the next page. A third sentence ends the document.")
+        ]
+
+        with patch.object(self.pdf_reader, 'iter_pages', return_value=iter(pages)):
+            sentences = list(self.pdf_reader.iter_sentences('test.pdf'))
+
+        self.assertEqual(sentences, [
+            "The first sentence is complete.",
+            "The second sentence runs onto the next page.",
+            "A third sentence ends the document."
+        ])
+
+    def test_process_pdf_matches_full_text_split(self):
+        """Test that streaming page processing matches splitting the whole text."""
+        if not os.path.exists(SAMPLE_PDF):
+            self.skipTest("Sample PDF not found")
+
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        pdf_path = write_multipage_pdf(os.path.join(temp_dir, 'multi.pdf'), 3)
+
+        page_numbers = [page_number for page_number, _ in self.pdf_reader.iter_pages(pdf_path)]
+        expected = self.pdf_reader.split_into_sentences(
+            self.pdf_reader.extract_text_from_pdf(pdf_path))
+
+        self.assertEqual(page_numbers, [1, 2, 3])
+        self.assertEqual(self.pdf_reader.process_pdf(pdf_path), expected)
+
+    def test_sentences_carry_page_and_span(self):
+        """Test that sentences record their page and span in the document text."""
+        pages = [
+            (1, "The first sentence is complete. The second sentence runs"),
+            (2, "onto the next page. A third sentence ends the document.")
+        ]
+        document_text = "\n".join(text for _, text in pages)
+
+        with patch.object(self.pdf_reader, 'iter_pages', return_value=iter(pages)):
+            sentences = list(self.pdf_reader.iter_sentences('test.pdf'))
+
+        self.assertEqual([sentence.page for sentence in sentences], [1, 1, 2])
+        self.assertEqual(document_text[sentences[1].start:sentences[1].end],
+                         "The second sentence runs\nonto the next page.")
+        self.assertEqual(self.pdf_reader.page_index.page_at(sentences[2].start), 2)
+
+    def test_split_sentence_stream_yields_before_next_chunk(self):
+        """Test that complete sentences are yielded before later chunks are read."""
+        pulled = []
+
+        def chunks():
+            for chunk in ["Access shall be logged. Reviews must", "be done monthly."]:
+                pulled.append(chunk)
+                yield chunk
+
+        stream = self.pdf_reader.split_sentence_stream(chunks())
+
+        self.assertEqual(next(stream), "Access shall be logged.")
+        self.assertEqual(len(pulled), 1)
+        self.assertEqual(list(stream), ["Reviews must be done monthly."])
+
+    def test_inspect_reads_metadata_only(self):
+        """Test that inspect reports page count without extracting text."""
+        if not os.path.exists(SAMPLE_PDF):
+            self.skipTest("Sample PDF not found")
+
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        pdf_path = write_multipage_pdf(os.path.join(temp_dir, 'multi.pdf'), 6)
+
+        with patch.object(pypdf.PageObject, 'extract_text') as mock_extract_text:
+            info = self.pdf_reader.inspect(pdf_path)
+
+        mock_extract_text.assert_not_called()
+        self.assertEqual(info['page_count'], 6)
+        self.assertEqual(info['file_size'], os.path.getsize(pdf_path))
+        self.assertFalse(info['encrypted'])
+        self.assertGreater(info['estimated_seconds'], 0)
+
+    def test_inspect_encrypted_pdf(self):
+        """Test that encrypted PDFs are reported without failing."""
+        if not os.path.exists(SAMPLE_PDF):
+            self.skipTest("Sample PDF not found")
+
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        pdf_path = os.path.join(temp_dir, 'encrypted.pdf')
+        writer = pypdf.PdfWriter(clone_from=SAMPLE_PDF)
+        writer.encrypt('secret')
+        writer.write(pdf_path)
+
+        info = self.pdf_reader.inspect(pdf_path)
+
+        self.assertTrue(info['encrypted'])
+        self.assertIsNone(info['page_count'])
+
+    def test_parse_page_ranges(self):
+        """Test parsing of page selections like 12-80,95."""
+        self.assertEqual(parse_page_ranges("3-5,1,4"), [1, 3, 4, 5])
+        self.assertEqual(parse_page_ranges("7"), [7])
+
+        for spec in ("", "0", "5-2", "a-b", "1,,x"):
+            with self.assertRaises(ValueError):
+                parse_page_ranges(spec)
+
+    def test_process_pdf_selected_pages(self):
+        """Test that only selected pages are extracted, keeping real page numbers."""
+        if not os.path.exists(SAMPLE_PDF):
+            self.skipTest("Sample PDF not found")
+
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        pdf_path = write_multipage_pdf(os.path.join(temp_dir, 'multi.pdf'), 4)
+
+        page_numbers = [page for page, _ in self.pdf_reader.iter_pages(pdf_path, pages=[2, 4, 9])]
+        sentences = self.pdf_reader.process_pdf(pdf_path, pages=[3])
+
+        self.assertEqual(page_numbers, [2, 4])
+        self.assertEqual({sentence.page for sentence in sentences}, {3})
+
+    def test_process_pdf_stops_after_candidates(self):
+        """Test that extraction stops once enough candidate sentences are found."""
+        pages = [
+            (1, "Users must comply with the policy. This line is informational."),
+            (2, "Data shall be encrypted at rest. Staff must complete training."),
+            (3, "Nothing on this page is ever read by the reader.")
+        ]
+        pages_read = []
+
+        def fake_pages(pdf_path, selection=None, **kwargs):
+            for page in pages:
+                pages_read.append(page[0])
+                yield page
+
+        finder = ObligationFinder()
+        with patch.object(self.pdf_reader, 'iter_pages', side_effect=fake_pages):
+            sentences = self.pdf_reader.process_pdf(
+                'test.pdf', max_candidates=2, is_candidate=finder.contains_obligation_keyword)
+
+        self.assertEqual(pages_read, [1, 2])
+        self.assertEqual(sentences[-1], "Data shall be encrypted at rest.")
+
+    def test_extraction_mode(self):
+        """Test that layout mode is passed to pypdf and kept apart in cache keys."""
+        if not os.path.exists(SAMPLE_PDF):
+            self.skipTest("Sample PDF not found")
+
+        layout_reader = PDFReader(extraction_mode='layout')
+        with patch('pypdf.PageObject.extract_text', return_value="Users must comply.") as mock_extract:
+            layout_reader.extract_page_texts(SAMPLE_PDF)
+
+        mock_extract.assert_called_with(extraction_mode='layout')
+        self.assertNotEqual(layout_reader.cache_settings(), self.pdf_reader.cache_settings())
+        self.assertNotEqual(layout_reader.page_cache_settings(),
+                            self.pdf_reader.page_cache_settings())
+        with self.assertRaises(ValueError):
+            PDFReader(extraction_mode='ocr')
+
+    def test_page_ranges_cover_document(self):
+        """Test that pages are split into contiguous per-worker ranges."""
+        reader = PDFReader(workers=3)
+
+        self.assertEqual(reader._page_ranges(7), [(0, 3), (3, 5), (5, 7)])
+        self.assertEqual(reader._page_ranges(2), [(0, 1), (1, 2)])
+
+
+class TestSentenceSegmenter(unittest.TestCase):
+    """Test cases for SentenceSegmenter class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.segmenter = SentenceSegmenter()
+
+    def test_does_not_split_after_abbreviations(self):
+        """Test that abbreviations and initialisms do not end sentences."""
+        text = ("Systems hosted in the U.S. Government cloud must be approved. "
+                "See Sec. A for details, e.g. ISO controls. Data shall be encrypted.")
+
+        self.assertEqual(self.segmenter.split(text), [
+            "Systems hosted in the U.S. Government cloud must be approved.",
+            "See Sec. A for details, e.g. ISO controls.",
+            "Data shall be encrypted."
+        ])
+
+    def test_splits_after_sentence_final_words(self):
+        """Test that words which also abbreviate still end sentences before a capital."""
+        cases = {
+            "Encryption must be state of the art. Users shall rotate keys.":
+                ["Encryption must be state of the art.", "Users shall rotate keys."],
+            "The vendor is ABC Ltd. The vendor must comply.":
+                ["The vendor is ABC Ltd.", "The vendor must comply."],
+            "Reviews are due in Dec. Owners must sign off.":
+                ["Reviews are due in Dec.", "Owners must sign off."],
+            "Refer to Art. 5 and Sec. 4.2 of the Act. Staff must comply.":
+                ["Refer to Art. 5 and Sec. 4.2 of the Act.", "Staff must comply."],
+        }
+
+        for text, expected in cases.items():
+            with self.subTest(text=text):
+                self.assertEqual(self.segmenter.split(text), expected)
+
+    def test_spans_and_whitespace(self):
+        """Test whitespace normalisation and spans into the original text."""
+        text = "  First   sentence\nhere.  Second one!\n\nThird?"
+
+        sentences = list(self.segmenter.iter_sentences(text))
+
+        self.assertEqual([sentence for sentence, _, _ in sentences],
+                         ["First sentence here.", "Second one!", "Third?"])
+        _, start, end = sentences[0]
+        self.assertEqual(text[start:end], "First   sentence\nhere.")
+
+    def test_custom_abbreviations(self):
+        """Test that extra abbreviations can be supplied."""
+        segmenter = SentenceSegmenter(abbreviations=["Annex."])
+        text = "Controls are listed in Annex. B covers the rest."
+
+        self.assertEqual(len(self.segmenter.split(text)), 2)
+        self.assertEqual(len(segmenter.split(text)), 1)
+
+    def test_stream_matches_joined_text(self):
+        """Test that sentences crossing chunk boundaries come out whole."""
+        chunks = ["Access must be logged. Reviews happen e.", "g. monthly and sh",
+                  "all be recorded", ". Keys are rotated."]
+
+        streamed = list(self.segmenter.stream(chunks, separator="\n"))
+
+        self.assertEqual(streamed, list(self.segmenter.iter_sentences("\n".join(chunks))))
+        self.assertEqual(len(streamed), 3)
+
+    def test_stream_flushes_long_fragments(self):
+        """Test that carried text without boundaries is capped."""
+        chunks = ["word " * 10] * 5
+
+        streamed = list(self.segmenter.stream(chunks, max_fragment_length=120))
+
+        self.assertGreater(len(streamed), 1)
+        self.assertTrue(all(end - start <= 160 for _, start, end in streamed))
+
+
+class TestSentenceSpool(unittest.TestCase):
+    """Test cases for SentenceSpool class."""
+
+    def test_spills_past_memory_ceiling(self):
+        """Test that sentences round-trip with their spans after spilling to disk."""
+        sentences = [Sentence(f"Users must rotate key number {i}.", i // 10 + 1, i * 40, i * 40 + 33)
+                     for i in range(50)]
+
+        with SentenceSpool(max_memory=500) as spool:
+            spool.extend(sentences[:5])
+            self.assertFalse(spool.spilled)
+            spool.extend(sentences[5:])
+
+            self.assertTrue(spool.spilled)
+            self.assertEqual(len(spool), 50)
+            self.assertEqual(list(spool), sentences)
+            self.assertEqual([sentence.span for sentence in spool],
+                             [sentence.span for sentence in sentences])
+
+    def test_process_pdf_with_memory_limit(self):
+        """Test that a memory-limited reader returns the same sentences as a spool."""
+        pages = [(1, "Users must comply with the policy. The policy runs onto"),
+                 (2, "the next page. Data shall be encrypted at rest.")]
+        reader = PDFReader(memory_limit=40)
+
+        with patch.object(reader, 'iter_pages', side_effect=lambda *args, **kwargs: iter(pages)):
+            spooled = reader.process_pdf('test.pdf')
+        with patch.object(reader, 'iter_pages', side_effect=lambda *args, **kwargs: iter(pages)):
+            expected = list(reader.iter_sentences('test.pdf'))
+
+        self.assertIsInstance(spooled, SentenceSpool)
+        self.assertTrue(spooled.spilled)
+        self.assertEqual(list(spooled), expected)
+        self.assertEqual([sentence.page for sentence in spooled], [1, 1, 2])
+
+
+class TestPageIndex(unittest.TestCase):
+    """Test cases for PageIndex class."""
+
+    def test_page_at(self):
+        """Test binary search of page start offsets."""
+        index = PageIndex()
+        index.add_page(1, 0)
+        index.add_page(2, 100)
+        index.add_page(5, 250)
+
+        self.assertEqual(index.page_at(0), 1)
+        self.assertEqual(index.page_at(99), 1)
+        self.assertEqual(index.page_at(100), 2)
+        self.assertEqual(index.page_at(10000), 5)
+        self.assertIsNone(index.page_at(-1))
+
+    def test_rejects_out_of_order_pages(self):
+        """Test that pages must be added in offset order."""
+        index = PageIndex()
+        index.add_page(1, 50)
+
+        with self.assertRaises(ValueError):
+            index.add_page(2, 10)
+
+
+class TestPageFilters(unittest.TestCase):
+    """Test cases for page filter functions."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        topics = ["passwords", "laptops", "backups", "visitors"]
+        self.pages = [
+            f"ACME Information Security Standard\n{topic.title()} policy applies here.\n"
+            f"Users must follow the {topic} rules.\n"
+            f"CONFIDENTIAL – Internal Use Only – Page {page} of 12"
+            for page, topic in enumerate(topics, 1)
+        ]
+
+    def test_strips_repeated_header_and_footer(self):
+        """Test that running headers and numbered footers are removed."""
+        repeated = find_repeated_lines(self.pages)
+        cleaned, removed = strip_repeated_lines(self.pages[2], repeated)
+
+        self.assertEqual(removed, 2)
+        self.assertEqual(cleaned, "Backups policy applies here.\nUsers must follow the backups rules.")
+
+    def test_needs_enough_pages(self):
+        """Test that short documents are left untouched."""
+        self.assertEqual(find_repeated_lines(self.pages[:2]), set())
+
+    def test_reader_strips_headers_before_splitting(self):
+        """Test that PDFReader removes repeated lines from the page stream."""
+        reader = PDFReader()
+        raw_pages = iter(enumerate(self.pages, 1))
+
+        with patch.object(reader, '_iter_raw_pages', return_value=raw_pages):
+            sentences = list(reader.iter_sentences('test.pdf'))
+
+        self.assertFalse(any("CONFIDENTIAL" in sentence for sentence in sentences))
+        self.assertIn("Users must follow the visitors rules.", sentences)
+
+    def test_early_stop_samples_fewer_pages(self):
+        """Test that a candidate budget isn't held back by the full header sample."""
+        reader = PDFReader()
+        pages_read = []
+
+        def raw_pages(pdf_path, pages=None):
+            for page_number, page_text in enumerate(self.pages * 20, 1):
+                pages_read.append(page_number)
+                yield page_number, page_text
+
+        with patch.object(reader, '_iter_raw_pages', side_effect=raw_pages):
+            sentences = reader.process_pdf('test.pdf', max_candidates=1)
+
+        self.assertEqual(len(pages_read), PDFReader.HEADER_FOOTER_EARLY_STOP_SAMPLE_PAGES)
+        self.assertEqual(sentences, ["Passwords policy applies here."])
+
+    def test_classifies_listing_pages(self):
+        """Test that contents and index pages are told apart from body text."""
+        contents = ("Contents\n1 Scope ........ 3\n2 Access control ..... 5\n"
+                    "2.1 Passwords ...... 6\n3 Logging ..... 9\n4 Review .... 12")
+        index = ("Index\nAccess control, 5, 12\nAudit logs, 9\nBackups, 14\n"
+                 "Encryption, 7\nPasswords, 6, 21")
+
+        self.assertEqual(classify_listing_page(contents), 'table of contents')
+        self.assertEqual(classify_listing_page(index), 'index')
+        self.assertIsNone(classify_listing_page("\n".join(self.pages * 2)))
+
+    def test_reader_skips_listing_pages(self):
+        """Test that PDFReader drops contents pages and records them as skipped."""
+        reader = PDFReader()
+        contents = "\n".join(f"{number} Users must comply ........ {number * 3}"
+                              for number in range(1, 7))
+        raw_pages = iter([(1, contents)] + list(enumerate(self.pages, 2)))
+
+        with patch.object(reader, '_iter_raw_pages', return_value=raw_pages):
+            sentences = list(reader.iter_sentences('test.pdf'))
+
+        self.assertFalse(any("comply" in sentence for sentence in sentences))
+        self.assertEqual(reader.skipped_pages,
+                         [{'page': 1, 'reason': 'table of contents page', 'extracted': True}])
+
+
+class TestExtractionCache(unittest.TestCase):
+    """Test cases for ExtractionCache class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache = ExtractionCache(os.path.join(self.temp_dir, 'cache'))
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir)
+
+    def _write_file(self, name, content):
+        """Write a small file into the temp directory."""
+        path = os.path.join(self.temp_dir, name)
+        with open(path, 'wb') as file:
+            file.write(content)
+        return path
+
+    def test_put_and_get(self):
+        """Test that stored results are returned for the same key."""
+        key = self.cache.make_key('abc', {'reader_version': '1'})
+        self.assertIsNone(self.cache.get(key))
+
+        self.cache.put(key, [(1, 'page one')], ['Users must comply with policies.'])
+        entry = self.cache.get(key)
+
+        self.assertEqual(entry['pages'], [[1, 'page one']])
+        self.assertEqual(entry['sentences'], ['Users must comply with policies.'])
+        self.assertNotEqual(key, self.cache.make_key('abc', {'reader_version': '2'}))
+
+    def test_evicts_least_recently_used(self):
+        """Test that the oldest entry is evicted when over the size cap."""
+        self.cache.max_bytes = 200
+        self.cache.put('first', ['x' * 40], [])
+        self.cache.put('second', ['y' * 40], [])
+        os.utime(self.cache._entry_path('first'), (1, 1))
+        os.utime(self.cache._entry_path('second'), (2, 2))
+
+        self.cache.get('first')  # Mark as recently used
+        self.cache.put('third', ['z' * 40], [])
+
+        self.assertIsNotNone(self.cache.get('first'))
+        self.assertIsNone(self.cache.get('second'))
+        self.assertIsNotNone(self.cache.get('third'))
+
+    def test_invalidate_and_clear(self):
+        """Test removing entries for one document and for the whole cache."""
+        pdf_a = self._write_file('a.pdf', b'document a')
+        pdf_b = self._write_file('b.pdf', b'document b')
+        key_a = self.cache.make_key(self.cache.hash_file(pdf_a), {})
+        key_b = self.cache.make_key(self.cache.hash_file(pdf_b), {})
+        self.cache.put(key_a, [], [])
+        self.cache.put(key_b, [], [])
+
+        self.assertEqual(self.cache.invalidate(pdf_a), 1)
+        self.assertIsNone(self.cache.get(key_a))
+        self.assertIsNotNone(self.cache.get(key_b))
+        self.assertEqual(self.cache.clear(), 1)
+        self.assertIsNone(self.cache.get(key_b))
+
+    def test_revised_pdf_reextracts_only_changed_pages(self):
+        """Test that unchanged pages of a revised PDF reuse cached page text."""
+        if not os.path.exists(SAMPLE_PDF):
+            self.skipTest("Sample PDF not found")
+
+        original_pdf = write_multipage_pdf(os.path.join(self.temp_dir, 'original.pdf'), 4)
+        writer = pypdf.PdfWriter(clone_from=original_pdf)
+        writer.add_blank_page()
+        revised_pdf = os.path.join(self.temp_dir, 'revised.pdf')
+        writer.write(revised_pdf)
+
+        reader = PDFReader(cache=self.cache)
+        original_pages = reader.extract_page_texts(original_pdf)
+        original_extract_text = pypdf.PageObject.extract_text
+
+        with patch.object(pypdf.PageObject, 'extract_text', autospec=True,
+                          side_effect=original_extract_text) as mock_extract_text:
+            revised_pages = reader.extract_page_texts(revised_pdf)
+
+        self.assertEqual(mock_extract_text.call_count, 1)
+        self.assertEqual(revised_pages, original_pages + [''])
+
+    def test_cache_hit_skips_pdf_parsing(self):
+        """Test that PDFReader serves a cache hit without calling pypdf."""
+        if not os.path.exists(SAMPLE_PDF):
+            self.skipTest("Sample PDF not found")
+
+        reader = PDFReader(cache=self.cache)
+        sentences = reader.process_pdf(SAMPLE_PDF)
+
+        with patch('pypdf.PdfReader') as mock_pdf_reader:
+            cached_sentences = reader.process_pdf(SAMPLE_PDF)
+
+        mock_pdf_reader.assert_not_called()
+        self.assertEqual(cached_sentences, sentences)
+        self.assertEqual([sentence.span for sentence in cached_sentences],
+                         [sentence.span for sentence in sentences])
+
+    def test_invalidate_reextracts_pages(self):
+        """Test that invalidating a PDF also drops its per-page entries."""
+        if not os.path.exists(SAMPLE_PDF):
+            self.skipTest("Sample PDF not found")
+
+        reader = PDFReader(cache=self.cache)
+        sentences = reader.process_pdf(SAMPLE_PDF)
+        page_count = len(pypdf.PdfReader(SAMPLE_PDF).pages)
+        self.assertEqual(self.cache.invalidate(SAMPLE_PDF), 1 + page_count)
+
+        original_extract_text = pypdf.PageObject.extract_text
+        with patch.object(pypdf.PageObject, 'extract_text', autospec=True,
+                          side_effect=original_extract_text) as mock_extract_text:
+            reextracted = reader.process_pdf(SAMPLE_PDF)
+
+        self.assertEqual(mock_extract_text.call_count, page_count)
+        self.assertEqual(reextracted, sentences)
+
+
+class TestExtractionMetrics(unittest.TestCase):
+    """Test cases for per-page extraction metrics."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_reader_records_timing_and_warnings(self):
+        """Test that each extracted page is timed and its pypdf warnings counted."""
+        if not os.path.exists(SAMPLE_PDF):
+            self.skipTest("Sample PDF not found")
+
+        pdf_path = write_multipage_pdf(os.path.join(self.temp_dir, 'multi.pdf'), 3)
+        original_extract_text = pypdf.PageObject.extract_text
+
+        def noisy_extract_text(page, *args, **kwargs):
+            logging.getLogger('pypdf._page').warning("Ignoring broken font")
+            return original_extract_text(page, *args, **kwargs)
+
+        reader = PDFReader()
+        with patch('pypdf.PageObject.extract_text', noisy_extract_text):
+            reader.extract_page_texts(pdf_path)
+
+        self.assertEqual([page['page'] for page in reader.metrics.pages], [1, 2, 3])
+        self.assertTrue(all(page['seconds'] > 0 for page in reader.metrics.pages))
+        self.assertEqual(reader.metrics.total_warnings, 3)
+        self.assertEqual(reader.metrics.summary()['extracted_pages'], 3)
+
+    def test_csv_appends_rows(self):
+        """Test that metrics for several documents collect in one CSV file."""
+        csv_path = os.path.join(self.temp_dir, 'metrics', 'pages.csv')
+        for document in ['a.pdf', 'b.pdf']:
+            metrics = ExtractionMetrics(document)
+            metrics.add_page(1, 0.5, 1000, warnings=2)
+            metrics.add_page(2, 0.0, 800, source='cache')
+            metrics.to_csv(csv_path, append=True)
+
+        with open(csv_path, newline='', encoding='utf-8') as file:
+            rows = list(csv.DictReader(file))
+
+        self.assertEqual([row['document'] for row in rows], ['a.pdf', 'a.pdf', 'b.pdf', 'b.pdf'])
+        self.assertEqual(rows[0]['chars_per_second'], '2000.0')
+        self.assertEqual(rows[1]['chars_per_second'], '')
+
+
+class TestKeywordMatcher(unittest.TestCase):
+    """Test cases for KeywordMatcher class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.matcher = KeywordMatcher(ObligationFinder.OBLIGATION_KEYWORDS)
+
+    def test_finds_all_keywords_in_lexicon_order(self):
+        """Test that one scan returns every keyword, respecting word boundaries."""
+        sentence = "Training is MANDATORY and staff must attend; mustard is not required."
+
+        self.assertEqual(self.matcher.find_keywords(sentence), ['must', 'required', 'mandatory'])
+        self.assertEqual(self.matcher.find_keywords("Mustard and shallots."), [])
+        self.assertTrue(self.matcher.search("Data SHALL be encrypted."))
+        self.assertFalse(self.matcher.search("Data is encrypted."))
+
+    def test_phrase_offsets(self):
+        """Test that nested keywords are reported and offsets point into the text."""
+        matcher = KeywordMatcher(['shall', 'shall ensure', 'no later than'])
+        text = "The owner Shall Ensure delivery no later than Friday."
+
+        matches = matcher.find_matches(text)
+
+        self.assertEqual([keyword for keyword, _, _ in matches],
+                         ['shall ensure', 'shall', 'no later than'])
+        self.assertEqual(text[matches[0][1]:matches[0][2]], "Shall Ensure")
+        self.assertEqual(text[matches[1][1]:matches[1][2]], "Shall")
+
+    def test_trie_matches_overlapping_phrases(self):
+        """Test that the trie reports nested phrases and agrees with the regex matcher."""
+        matcher = TrieKeywordMatcher(['shall', 'shall ensure', 'ensure that', 'follow-up'])
+        text = "The owner Shall  Ensure that a follow-up happens; shallow follow up is not enough."
+
+        matches = matcher.find_matches(text)
+
+        self.assertEqual([keyword for keyword, _, _ in matches],
+                         ['shall ensure', 'shall', 'ensure that', 'follow-up'])
+        self.assertEqual(text[matches[0][1]:matches[0][2]], "Shall  Ensure")
+        self.assertFalse(matcher.search("A shallow ensured follow up."))
+
+        trie = TrieKeywordMatcher(ObligationFinder.OBLIGATION_KEYWORDS)
+        for sentence in ["Training is MANDATORY and staff must attend; mustard is not required.",
+                         "Mustard and shallots.", "Data SHALL be encrypted."]:
+            self.assertEqual(trie.find_keywords(sentence), self.matcher.find_keywords(sentence))
+
+    def test_backends_agree_on_nested_phrases(self):
+        """Test that both backends report every matched phrase, nested or overlapping."""
+        keywords = ['must', 'must not', 'not share', 'shall', 'shall ensure', 'ensure that']
+        sentences = ["Users must not share passwords.",
+                     "The owner Shall Ensure that keys are rotated.",
+                     "Staff must attend; mustard is not shared."]
+        regex, trie = KeywordMatcher(keywords), TrieKeywordMatcher(keywords)
+
+        for sentence in sentences:
+            with self.subTest(sentence=sentence):
+                self.assertEqual(regex.find_keywords(sentence), trie.find_keywords(sentence))
+                self.assertEqual(regex.find_matches(sentence), trie.find_matches(sentence))
+        self.assertEqual(regex.find_keywords(sentences[0]), ['must', 'must not', 'not share'])
+
+        lexicon_path = 'data/lexicons/obligation_lexicon.json'
+        for backend in ('regex', 'trie'):
+            with self.subTest(backend=backend):
+                finder = ObligationFinder(lexicon_path=lexicon_path, matcher_backend=backend)
+                obligation = finder.extract_obligations(["Users must not share passwords."])[0]
+                self.assertEqual(obligation['keywords'], 'must, must not')
+                self.assertEqual(obligation['categories'], 'obligation, prohibition')
+
+    def test_builds_large_phrase_lexicon_quickly(self):
+        """Test that a lexicon of about 1000 nested phrases compiles in well under a second."""
+        keywords = [f'control {n}' for n in range(500)] + [f'control {n} shall' for n in range(500)]
+
+        started = time.monotonic()
+        matcher = KeywordMatcher(keywords)
+        self.assertLess(time.monotonic() - started, 2)
+
+        self.assertEqual(matcher.find_keywords("Control 12 shall apply, control 120 may not."),
+                         ['control 12', 'control 120', 'control 12 shall'])
+        self.assertEqual(matcher.find_keywords("Control 7-b shall apply."), ['control 7'])
+
+    def test_create_matcher_backends(self):
+        """Test backend selection by name and by lexicon size."""
+        self.assertIsInstance(create_matcher(['must']), KeywordMatcher)
+        self.assertIsInstance(create_matcher([f'term {n}' for n in range(500)]), TrieKeywordMatcher)
+        self.assertIsInstance(ObligationFinder(matcher_backend='trie').matcher, TrieKeywordMatcher)
+        with self.assertRaises(ValueError):
+            create_matcher(['must'], backend='bloom')
+
+
+class TestLexicon(unittest.TestCase):
+    """Test cases for lexicon loading, caching and hot reload."""
+
+    LEXICON = {
+        'default_category': 'obligation',
+        'phrases': ['must', {'phrase': 'No Later Than', 'category': 'deadline', 'weight': 0.5}]
+    }
+
+    def setUp(self):
+        """Set up a temporary directory for lexicon files and the cache."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.lexicon_path = os.path.join(self.temp_dir, 'lexicon.json')
+        self.write_lexicon(self.LEXICON)
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        shutil.rmtree(self.temp_dir)
+
+    def write_lexicon(self, data, path=None):
+        """Write a JSON lexicon and make sure its modification time moves on."""
+        path = path or self.lexicon_path
+        previous = os.stat(path).st_mtime_ns if os.path.exists(path) else 0
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(data, file)
+        os.utime(path, ns=(previous + 10**9, previous + 10**9))
+
+    def test_load_and_cache(self):
+        """Test defaults, categories and weights, and that a cached lexicon is not re-parsed."""
+        cache = LexiconCache(os.path.join(self.temp_dir, 'cache'))
+
+        lexicon = load_lexicon(self.lexicon_path, cache)
+        self.assertEqual(lexicon.keywords, ['must', 'no later than'])
+        self.assertEqual(lexicon.categories_for(['must', 'no later than']), ['obligation', 'deadline'])
+        self.assertEqual(lexicon.weight_for(['must', 'no later than']), 1.0)
+
+        with patch('compliance_assistant.lexicon._decode') as decode:
+            cached = load_lexicon(self.lexicon_path, cache)
+        decode.assert_not_called()
+        self.assertEqual(cached.entries(), lexicon.entries())
+
+        self.write_lexicon({'phrases': ['must', {'phrase': 'shall', 'weight': 'high'}]})
+        with self.assertRaises(ValueError):
+            load_lexicon(self.lexicon_path)
+
+    @unittest.skipUnless(importlib.util.find_spec('yaml'), "PyYAML not installed")
+    def test_yaml_lexicon(self):
+        """Test that YAML lexicons load like JSON ones."""
+        yaml_path = os.path.join(self.temp_dir, 'lexicon.yaml')
+        with open(yaml_path, 'w', encoding='utf-8') as file:
+            file.write("phrases:\n  - must\n  - phrase: shall not\n    category: prohibition\n")
+
+        lexicon = load_lexicon(yaml_path)
+
+        self.assertEqual(lexicon.keywords, ['must', 'shall not'])
+        self.assertEqual(lexicon.category('shall not'), 'prohibition')
+
+    def test_finder_hot_reload(self):
+        """Test that the finder uses the lexicon file and picks up edits."""
+        finder = ObligationFinder(lexicon_path=self.lexicon_path)
+        obligations = finder.extract_obligations(["Reports must be filed no later than Friday."])
+        self.assertEqual(obligations[0]['keywords'], 'must, no later than')
+        self.assertEqual(obligations[0]['categories'], 'obligation, deadline')
+        self.assertFalse(finder.reload_lexicon_if_changed())
+
+        self.write_lexicon({'phrases': ['shall']})
+        self.assertTrue(finder.reload_lexicon_if_changed())
+        self.assertFalse(finder.contains_obligation_keyword("Reports must be filed."))
+        self.assertTrue(finder.contains_obligation_keyword("Reports shall be filed."))
+
+        # A broken edit keeps the last good lexicon in use
+        with open(self.lexicon_path, 'w', encoding='utf-8') as file:
+            file.write('{"phrases": [')
+        self.assertFalse(finder.reload_lexicon_if_changed())
+        self.assertTrue(finder.contains_obligation_keyword("Reports shall be filed."))
+
+
+class TestObligation(unittest.TestCase):
+    """Test cases for the Obligation record."""
+
+    def test_dictionary_compatibility(self):
+        """Test that records read like the dictionaries they replace."""
+        obligation = Obligation("Users must comply.", ('must', 'required'), 3, page=2, span=(10, 28))
+
+        self.assertFalse(hasattr(obligation, '__dict__'))
+        self.assertEqual(obligation['keywords'], 'must, required')
+        self.assertEqual(obligation.get('page', ''), 2)
+        self.assertNotIn('categories', obligation)
+        self.assertEqual(obligation.get('weight', ''), '')
+        self.assertEqual(obligation.to_dict(), {'text': "Users must comply.", 'keywords': 'must, required',
+                                                'sentence_index': 3, 'page': 2, 'span': (10, 28)})
+        self.assertEqual(obligation, obligation.to_dict())
+        self.assertEqual(Obligation.from_dict(obligation.to_dict()).keywords, ('must', 'required'))
+        with self.assertRaises(KeyError):
+            obligation['owner']
+
+    def test_finder_records_share_keyword_tuples(self):
+        """Test that found obligations are records sharing keyword tuples and survive pickling."""
+        finder = ObligationFinder()
+        obligations = finder.process_sentences(["Users must follow the security policies.",
+                                                "Staff must complete the training annually."])
+
+        self.assertIsInstance(obligations[0], Obligation)
+        self.assertIs(obligations[0].keywords, obligations[1].keywords)
+        self.assertIs(obligations[0].keywords[0], finder.matcher.keywords[0])
+        self.assertEqual(pickle.loads(pickle.dumps(obligations)), obligations)
+
 
 class TestObligationFinder(unittest.TestCase):
     """Test cases for ObligationFinder class."""
@@ -73,10 +953,20 @@ class TestObligationFinder(unittest.TestCase):
         obligations = self.finder.extract_obligations(test_sentences)
         
         self.assertEqual(len(obligations), 3)
+        self.assertNotIn('page', obligations[0])
         self.assertIn("must", obligations[0]['keywords'])
         self.assertIn("shall", obligations[1]['keywords'])
         self.assertIn("required", obligations[2]['keywords'])
     
+    def test_extract_obligations_keeps_page(self):
+        """Test that obligations keep the page of page-aware sentences."""
+        sentences = [Sentence("Users must follow security policies.", 4, 120, 156)]
+
+        obligations = self.finder.extract_obligations(sentences)
+
+        self.assertEqual(obligations[0]['page'], 4)
+        self.assertEqual(obligations[0]['span'], (120, 156))
+
     def test_filter_obligations(self):
         """Test obligation filtering."""
         test_obligations = [
@@ -90,6 +980,58 @@ class TestObligationFinder(unittest.TestCase):
         self.assertEqual(len(filtered), 1)
         self.assertIn("proper obligation", filtered[0]['text'])
 
+    def test_iter_obligations_is_lazy(self):
+        """Test that iter_obligations streams the same obligations as process_sentences."""
+        sentences = ["Users must follow security policies.", "Short must",
+                     "Backups run nightly.", "TITLE: SECURITY REQUIREMENTS",
+                     "Data shall be encrypted at rest and in transit."]
+
+        streamed = self.finder.iter_obligations(s for s in sentences)
+
+        self.assertEqual(list(streamed), self.finder.process_sentences(sentences))
+        # An endless stream still yields as soon as an obligation is found
+        endless = self.finder.iter_obligations(itertools.cycle(sentences[2:]))
+        self.assertEqual(next(endless)['sentence_index'], 2)
+
+    def test_detect_obligations_batch(self):
+        """Test that batch detection flags the same sentences as process_sentences."""
+        sentences = [
+            "Users must follow security policies.",
+            "Short must",
+            "TITLE: SECURITY REQUIREMENTS MUST",
+            "123-456-789 must be updated 2024",
+            "Regular backups are recommended for data safety.",
+            "  Data SHALL be encrypted and training is mandatory.  ",
+            "Die Übermittlung der Daten must über TLS erfolgen.",
+        ]
+        series = pd.Series(sentences + [None], index=[7, 7, 3, 2, 1, 0, 9, 8])
+
+        result = self.finder.detect_obligations_batch(series)
+
+        self.assertEqual(list(result.index), list(series.index))
+        self.assertEqual(result['is_obligation'].tolist(),
+                         [True, False, False, False, False, True, True, False])
+        expected = [obligation['keywords'] for obligation in self.finder.process_sentences(sentences)]
+        self.assertEqual(result.loc[result['is_obligation'], 'keywords'].tolist(), expected)
+        self.assertEqual(result['keywords'].iloc[1], '')
+
+    def test_process_sentences_parallel(self):
+        """Test that chunked parallel processing keeps order, indices and pages."""
+        sentences = [Sentence(f"Users must rotate credential number {i} every quarter.", i // 50 + 1)
+                     if i % 3 else f"Backups of system {i} run nightly." for i in range(3000)]
+        finder = ObligationFinder(workers=2, parallel_threshold=1000)
+        finder.INITIAL_CHUNK_SIZE = 200
+        finder.MIN_CHUNK_SIZE = 100
+
+        parallel = finder.process_sentences(sentences)
+
+        self.assertEqual(parallel, self.finder.process_sentences(sentences))
+        self.assertEqual(sum(finder.chunk_sizes), len(sentences))
+        self.assertEqual(parallel[0]['sentence_index'], 1)
+        self.assertEqual(parallel[-1]['page'], 60)
+        self.assertEqual(finder._next_chunk_size(0.25 / 10**9), finder.MAX_CHUNK_SIZE)
+        self.assertEqual(finder._next_chunk_size(1.0), finder.MIN_CHUNK_SIZE)
+
 
 class TestExcelExporter(unittest.TestCase):
     """Test cases for ExcelExporter class."""
@@ -143,6 +1085,62 @@ class TestExcelExporter(unittest.TestCase):
         self.assertTrue(filename.endswith('.xlsx'))
 
 
+class TestDocumentReaders(unittest.TestCase):
+    """Test cases for text export readers and the reader registry."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.registry = default_registry()
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir)
+
+    def _read(self, name, content):
+        """Write a document and read it back through the registry."""
+        path = os.path.join(self.temp_dir, name)
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(content)
+        return ''.join(self.registry.get(path)(path))
+
+    def test_markdown_and_html_markup_removed(self):
+        """Test that only readable text is returned from Markdown and HTML."""
+        markdown = self._read('policy.MD', "# Access\n- Users **must** read [the policy](x.md).\n"
+                                           "```\nshall_not_appear()\n```\n")
+        html = self._read('policy.html', "<html><head><title>T</title><style>p{}</style></head>"
+                                         "<body><p>Data shall be encrypted &amp; logged.</p>"
+                                         "<script>var must = 1;</script></body></html>")
+
+        self.assertEqual(markdown.split(), "Access Users must read the policy.".split())
+        self.assertEqual(html.split(), "Data shall be encrypted & logged.".split())
+
+    def test_registry_lookup_by_extension(self):
+        """Test that readers are found by extension and can be added."""
+        registry = ReaderRegistry()
+        registry.register(['csv'], lambda path: iter(()))
+
+        self.assertIsNone(self.registry.get('document.pdf'))
+        self.assertIsNotNone(self.registry.get('export.TXT'))
+        self.assertEqual(registry.extensions(), ['.csv'])
+
+    def test_text_export_skips_pdf_parsing(self):
+        """Test that ComplianceAssistant processes text exports without the PDF reader."""
+        path = os.path.join(self.temp_dir, 'policy.txt')
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write("Users must comply with all security policies.\n"
+                       "The system shall encrypt all data in transit. Have a nice day.")
+        assistant = ComplianceAssistant()
+
+        with patch.object(assistant.pdf_reader, 'process_pdf') as mock_process_pdf:
+            result = assistant.process_document(path, self.temp_dir)
+
+        mock_process_pdf.assert_not_called()
+        self.assertTrue(result['success'])
+        self.assertEqual(result['summary']['total_sentences'], 3)
+        self.assertEqual(result['summary']['total_obligations'], 2)
+
+
 class TestComplianceAssistant(unittest.TestCase):
     """Test cases for the main ComplianceAssistant class."""
     
@@ -189,6 +1187,97 @@ class TestComplianceAssistant(unittest.TestCase):
         self.assertEqual(result['summary']['total_obligations'], 1)
         self.assertEqual(result['summary']['total_sentences'], 2)
 
+    def test_process_document_finds_obligations_while_pages_are_read(self):
+        """Test that detection on page 1 starts before later pages are parsed."""
+        pages = [(1, "Users must comply with the policy. The policy runs onto"),
+                 (2, "the next page. This page has no keywords at all."),
+                 (3, "Data shall be encrypted at rest by every team.")]
+        pages_read = []
+        pages_read_at_obligation = []
+
+        def fake_pages(pdf_path, selection=None, **kwargs):
+            for page in pages:
+                pages_read.append(page[0])
+                yield page
+
+        assistant = ComplianceAssistant(pdf_reader=PDFReader())
+        finder = assistant.obligation_finder
+        original_make_obligation = finder._make_obligation
+
+        def recording_make_obligation(*args):
+            pages_read_at_obligation.append(len(pages_read))
+            return original_make_obligation(*args)
+
+        with patch.object(assistant.pdf_reader, 'iter_pages', side_effect=fake_pages), \
+                patch.object(finder, '_make_obligation', side_effect=recording_make_obligation):
+            result = assistant.process_document('test.pdf', self.temp_dir)
+
+        self.assertTrue(result['success'])
+        self.assertEqual(result['summary']['total_obligations'], 2)
+        self.assertEqual(result['summary']['total_sentences'], 4)
+        self.assertEqual(pages_read_at_obligation, [1, 3])
+        self.assertEqual([obligation['page'] for obligation in result['obligations']], [1, 3])
+
+    def test_max_obligations_counts_only_filtered_obligations(self):
+        """Test that keyword hits the filters reject don't use up the obligation budget."""
+        pages = [(1, "POLICY REQUIREMENTS MUST APPLY. Must: 1234-5678-9012-3456."),
+                 (2, "Users must comply with the access policy. Data shall be encrypted at rest. "
+                     "The appendix lists"),
+                 (3, "Backups are required for every production system.")]
+        pages_read = []
+
+        def fake_pages(pdf_path, selection=None, **kwargs):
+            for page in pages:
+                pages_read.append(page[0])
+                yield page
+
+        # Streamed, and through process_pdf's candidate budget
+        for reader in (PDFReader(), PDFReader(memory_limit=10_000)):
+            with self.subTest(memory_limit=reader.memory_limit):
+                pages_read.clear()
+                assistant = ComplianceAssistant(pdf_reader=reader)
+                with patch.object(reader, 'iter_pages', side_effect=fake_pages):
+                    result = assistant.process_document('test.pdf', self.temp_dir,
+                                                        max_obligations=2)
+
+                self.assertTrue(result['success'])
+                self.assertEqual([obligation['text'] for obligation in result['obligations']],
+                                 ["Users must comply with the access policy.",
+                                  "Data shall be encrypted at rest."])
+                self.assertEqual(pages_read, [1, 2])
+
+    def test_process_document_closes_sentence_spool(self):
+        """Test that a spooled document's sentences are released after matching."""
+        spool = SentenceSpool(max_memory=40, sentences=[
+            Sentence("Users must comply with the policy.", 1, 0, 34),
+            Sentence("Data shall be encrypted at rest.", 1, 35, 67)
+        ])
+        assistant = ComplianceAssistant(pdf_reader=PDFReader(memory_limit=40))
+
+        with patch.object(assistant.pdf_reader, 'process_pdf', return_value=spool):
+            result = assistant.process_document('test.pdf', self.temp_dir)
+
+        self.assertTrue(result['success'])
+        self.assertEqual(result['summary']['total_obligations'], 2)
+        self.assertEqual(result['summary']['total_sentences'], 2)
+        self.assertTrue(spool._file.closed)
+
+
+class TestPackageImport(unittest.TestCase):
+    """Test cases for package import cost."""
+
+    def test_import_does_not_load_heavy_dependencies(self):
+        """Test that importing the package and CLI leaves pypdf and pandas unloaded."""
+        src_path = os.path.join(os.path.dirname(__file__), '..', 'src')
+        code = ("import sys; import compliance_assistant, compliance_assistant.cli; "
+                "from compliance_assistant import ComplianceAssistant; "
+                "print(sorted(m for m in ('pypdf', 'pandas', 'openpyxl') if m in sys.modules))")
+
+        output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                                check=True, env={**os.environ, 'PYTHONPATH': src_path})
+
+        self.assertEqual(output.stdout.strip(), "[]")
+
 
 class TestIntegration(unittest.TestCase):
     """Integration tests using the actual sample PDF."""
@@ -220,6 +1309,8 @@ class TestIntegration(unittest.TestCase):
         self.assertIn('ID', df.columns)
         self.assertIn('Obligation Text', df.columns)
         self.assertIn('Source Document', df.columns)
+        self.assertIn('Page', df.columns)
+        self.assertTrue((df['Page'] == 1).all())
         
         # Check that we found the expected number of obligations (around 5 based on manual test)
         self.assertGreaterEqual(len(df), 3)  # At least 3 obligations
@@ -237,9 +1328,20 @@ def run_tests():
     
     # Add test classes
     suite.addTests(loader.loadTestsFromTestCase(TestPDFReader))
+    suite.addTests(loader.loadTestsFromTestCase(TestSentenceSegmenter))
+    suite.addTests(loader.loadTestsFromTestCase(TestSentenceSpool))
+    suite.addTests(loader.loadTestsFromTestCase(TestPageIndex))
+    suite.addTests(loader.loadTestsFromTestCase(TestPageFilters))
+    suite.addTests(loader.loadTestsFromTestCase(TestExtractionCache))
+    suite.addTests(loader.loadTestsFromTestCase(TestExtractionMetrics))
+    suite.addTests(loader.loadTestsFromTestCase(TestKeywordMatcher))
+    suite.addTests(loader.loadTestsFromTestCase(TestLexicon))
+    suite.addTests(loader.loadTestsFromTestCase(TestObligation))
     suite.addTests(loader.loadTestsFromTestCase(TestObligationFinder))
     suite.addTests(loader.loadTestsFromTestCase(TestExcelExporter))
+    suite.addTests(loader.loadTestsFromTestCase(TestDocumentReaders))
     suite.addTests(loader.loadTestsFromTestCase(TestComplianceAssistant))
+    suite.addTests(loader.loadTestsFromTestCase(TestPackageImport))
     suite.addTests(loader.loadTestsFromTestCase(TestIntegration))
     
     # Run tests